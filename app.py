@@ -7,6 +7,7 @@ from web import (
     render_sidebar,
     render_stock_page,
     render_new_chat_page,
+    render_scanner_page,
     poll_background_tasks,
 )
 
@@ -27,6 +28,8 @@ render_sidebar()
 # Main content
 if st.session_state.selected_stock:
     render_stock_page(st.session_state.selected_stock)
+elif st.session_state.selected_view == "scanner":
+    render_scanner_page()
 else:
     render_new_chat_page()
 
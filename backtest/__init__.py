@@ -0,0 +1,25 @@
+"""Vectorized backtesting of Fintellix's technical signals."""
+
+from .rules import STRATEGIES, hold_between, macd_positions, sma_trend_positions, rsi_positions
+from .engine import (
+    METRIC_NAMES,
+    performance,
+    run_backtest,
+    parameter_grid,
+    sweep,
+    backtest_symbols,
+)
+
+__all__ = [
+    "STRATEGIES",
+    "hold_between",
+    "macd_positions",
+    "sma_trend_positions",
+    "rsi_positions",
+    "METRIC_NAMES",
+    "performance",
+    "run_backtest",
+    "parameter_grid",
+    "sweep",
+    "backtest_symbols",
+]
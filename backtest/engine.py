@@ -0,0 +1,190 @@
+"""Vectorized backtests of the signal rules over daily bars."""
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from indicators.kernels import as_float_array
+
+from .rules import STRATEGIES
+
+METRIC_NAMES = ["total_return", "buy_hold_return", "max_drawdown", "exposure", "trades", "hit_rate"]
+
+# Parameter pairs where the first must stay below the second in a sweep
+_ORDERED_PARAMS = [("ema_fast", "ema_slow"), ("sma_short", "sma_long"), ("oversold", "overbought")]
+
+# Below this many symbols a multi-symbol run stays in the current process
+MIN_SYMBOLS_FOR_POOL = int(os.getenv("BACKTEST_MIN_POOL_SYMBOLS", "8"))
+
+
+def performance(close, positions, cost: float = 0.0) -> dict[str, np.ndarray]:
+    """Simulate positions over closing prices and measure the result.
+
+    Positions are applied with a one-bar lag: a position decided at a bar's
+    close earns the next bar's return.
+
+    Args:
+        close: Closing prices, oldest first (1-D, or 2-D with one row per symbol).
+        positions: Positions (0 or 1) with the same shape as ``close``.
+        cost: Cost per position change as a fraction of equity (e.g. 0.001).
+
+    Returns:
+        Mapping of metric name (see ``METRIC_NAMES``) to a value per row:
+        total and buy-and-hold return, maximum drawdown (negative), share
+        of bars in the market, number of trades and the share of trades
+        that made money (NaN without trades).
+    """
+    close = as_float_array(close)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = close / np.concatenate([np.full(close.shape[:-1] + (1,), np.nan), close[..., :-1]], axis=-1) - 1
+    valid = ~np.isnan(returns)
+    returns = np.where(valid, returns, 0.0)
+
+    positions = np.nan_to_num(as_float_array(positions))
+    held = np.concatenate([np.zeros(positions.shape[:-1] + (1,)), positions[..., :-1]], axis=-1)
+    held = np.where(valid, held, 0.0)
+    previous = np.concatenate([np.zeros(held.shape[:-1] + (1,)), held[..., :-1]], axis=-1)
+    changes = np.abs(held - previous)
+    strategy = held * returns - cost * changes
+
+    equity = np.cumprod(1 + strategy, axis=-1)
+    drawdown = equity / np.maximum.accumulate(equity, axis=-1) - 1
+
+    # Label every held bar (and the exit bar, which pays the exit cost) with its trade number
+    starts = (held > 0) & (previous == 0)
+    exits = (held == 0) & (previous > 0)
+    trade_id = np.cumsum(starts, axis=-1)
+    in_trade = (held > 0) | exits
+    flat_close = np.atleast_2d(close)
+    rows, n = flat_close.shape
+    offsets = (np.arange(rows) * (n + 1)).reshape(close.shape[:-1] + (1,)) if close.ndim > 1 else 0
+    trade_log = np.bincount(
+        (trade_id + offsets)[in_trade],
+        weights=np.log1p(strategy)[in_trade],
+        minlength=rows * (n + 1),
+    ).reshape(close.shape[:-1] + (n + 1,))
+    trades = starts.sum(axis=-1)
+    wins = (trade_log[..., 1:] > 0).sum(axis=-1)
+
+    first = np.argmax(~np.isnan(close), axis=-1)
+    last = n - 1 - np.argmax(~np.isnan(close[..., ::-1]), axis=-1)
+    bars = valid.sum(axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return {
+            "total_return": equity[..., -1] - 1,
+            "buy_hold_return": np.take_along_axis(close, last[..., None], -1)[..., 0]
+            / np.take_along_axis(close, first[..., None], -1)[..., 0] - 1,
+            "max_drawdown": drawdown.min(axis=-1),
+            "exposure": np.where(bars > 0, held.sum(axis=-1) / bars, 0.0),
+            "trades": trades,
+            "hit_rate": np.where(trades > 0, wins / trades, np.nan),
+        }
+
+
+def _metrics_row(metrics: dict[str, np.ndarray]) -> dict:
+    """Convert one symbol's metrics to plain Python numbers."""
+    return {name: int(value) if name == "trades" else float(value) for name, value in metrics.items()}
+
+
+def run_backtest(close, strategy: str = "macd", cost: float = 0.0, **params) -> dict[str, np.ndarray]:
+    """Backtest one of the built-in signal rules.
+
+    Args:
+        close: Closing prices, oldest first (1-D, or 2-D with one row per symbol).
+        strategy: Name of the rule in ``STRATEGIES`` ("macd", "sma_trend" or "rsi").
+        cost: Cost per position change as a fraction of equity.
+        **params: Parameters for the rule (e.g. ``ema_fast=8``).
+
+    Returns:
+        The ``performance`` metrics.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy: {strategy}. Available: {', '.join(STRATEGIES)}")
+    positions = STRATEGIES[strategy](close, **params)
+    return performance(close, positions, cost)
+
+
+def parameter_grid(grid: dict[str, list]) -> list[dict]:
+    """Expand a parameter grid into every valid combination.
+
+    Combinations where a fast/short/oversold parameter is not below its
+    slow/long/overbought counterpart are skipped.
+    """
+    names = list(grid)
+    combos = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        combo = dict(zip(names, values))
+        if all(combo[a] < combo[b] for a, b in _ORDERED_PARAMS if a in combo and b in combo):
+            combos.append(combo)
+    return combos
+
+
+def sweep(close, strategy: str, grid: dict[str, list], cost: float = 0.0) -> pd.DataFrame:
+    """Backtest every combination of a parameter grid.
+
+    Args:
+        close: Closing prices of one symbol, oldest first.
+        strategy: Name of the rule in ``STRATEGIES``.
+        grid: Candidate values per parameter, e.g. ``{"ema_fast": [8, 12], "ema_slow": [21, 26]}``.
+        cost: Cost per position change as a fraction of equity.
+
+    Returns:
+        One row per combination with its parameters and metrics, best
+        total return first.
+    """
+    rows = []
+    for combo in parameter_grid(grid):
+        metrics = run_backtest(close, strategy, cost, **combo)
+        rows.append({**combo, **_metrics_row(metrics)})
+    if not rows:
+        return pd.DataFrame(columns=list(grid) + METRIC_NAMES)
+    return pd.DataFrame(rows).sort_values("total_return", ascending=False).reset_index(drop=True)
+
+
+def _backtest_symbol(symbol: str, close: np.ndarray, strategy: str, grid: dict | None,
+                     cost: float, params: dict) -> pd.DataFrame:
+    """Worker for ``backtest_symbols`` (module level so it can be pickled)."""
+    if grid:
+        result = sweep(close, strategy, grid, cost)
+    else:
+        metrics = run_backtest(close, strategy, cost, **params)
+        result = pd.DataFrame([{**params, **_metrics_row(metrics)}])
+    return result.assign(symbol=symbol)
+
+
+def backtest_symbols(frames: dict[str, pd.DataFrame], strategy: str = "macd", grid: dict[str, list] | None = None,
+                     cost: float = 0.0, max_workers: int | None = None, **params) -> pd.DataFrame:
+    """Backtest a rule (or sweep a grid) for many symbols in a process pool.
+
+    Args:
+        frames: Mapping of symbol to a date-indexed history frame with a
+            ``close`` column (e.g. from ``get_stock_history_frames``).
+        strategy: Name of the rule in ``STRATEGIES``.
+        grid: Parameter grid to sweep per symbol; if None, ``params`` are used.
+        cost: Cost per position change as a fraction of equity.
+        max_workers: Worker processes (defaults to the CPU count).
+        **params: Parameters for the rule when not sweeping.
+
+    Returns:
+        Metrics with a ``symbol`` column, one row per symbol (or per symbol
+        and combination when sweeping).
+    """
+    jobs = [
+        (symbol, frame["close"].to_numpy(dtype=np.float64), strategy, grid, cost, params)
+        for symbol, frame in frames.items()
+        if not frame.empty
+    ]
+    if not jobs:
+        return pd.DataFrame(columns=["symbol"] + list(grid or params) + METRIC_NAMES)
+
+    if len(jobs) < MIN_SYMBOLS_FOR_POOL or max_workers == 1:
+        results = [_backtest_symbol(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_backtest_symbol, *zip(*jobs)))
+
+    result = pd.concat(results, ignore_index=True)
+    return result[["symbol"] + [c for c in result.columns if c != "symbol"]]
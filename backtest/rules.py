@@ -0,0 +1,76 @@
+"""Position rules for the built-in technical signals.
+
+Each rule turns closing prices into a position array (1 = long, 0 = flat)
+with the same shape, working along the last axis like the indicator
+kernels. A position is decided at a bar's close; the engine applies it
+from the next bar on.
+"""
+
+import numpy as np
+
+from indicators import DEFAULT_PARAMS
+from indicators.kernels import as_float_array, macd, rsi, sma
+from indicators.signals import RSI_OVERBOUGHT, RSI_OVERSOLD
+
+
+def hold_between(entry, exit) -> np.ndarray:
+    """Go long on ``entry`` bars and stay long until the next ``exit`` bar.
+
+    The state is carried forward with an index forward-fill, so there is
+    no per-bar loop. A bar that is both an entry and an exit is an entry.
+    """
+    entry = np.asarray(entry, dtype=bool)
+    exit = np.asarray(exit, dtype=bool)
+    events = entry | exit
+    n = events.shape[-1]
+    last_event = np.where(events, np.arange(n), -1)
+    last_event = np.maximum.accumulate(last_event, axis=-1)
+    state = np.take_along_axis(entry, np.maximum(last_event, 0), axis=-1)
+    return np.where(last_event >= 0, state, False).astype(np.float64)
+
+
+def macd_positions(close, ema_fast: int = DEFAULT_PARAMS["ema_fast"],
+                   ema_slow: int = DEFAULT_PARAMS["ema_slow"],
+                   macd_signal: int = DEFAULT_PARAMS["macd_signal"]) -> np.ndarray:
+    """Long while the MACD line is above its signal line (the "Bullish" MACD signal)."""
+    line, signal, _ = macd(as_float_array(close), ema_fast, ema_slow, macd_signal)
+    return (line > signal).astype(np.float64)
+
+
+def sma_trend_positions(close, sma_short: int = DEFAULT_PARAMS["sma_short"],
+                        sma_long: int = DEFAULT_PARAMS["sma_long"],
+                        strong: bool = False) -> np.ndarray:
+    """Long while the SMA trend is bullish.
+
+    Args:
+        close: Closing prices, oldest first.
+        sma_short: Short SMA window.
+        sma_long: Long SMA window.
+        strong: Only hold on "Strong Bullish" (price above the short SMA and
+            the short SMA above the long one) instead of any bullish trend.
+    """
+    close = as_float_array(close)
+    short = sma(close, sma_short)
+    long_in = close > short
+    if strong:
+        long_in &= short > sma(close, sma_long)
+    else:
+        # The trend signal is only defined once the long SMA is
+        long_in &= ~np.isnan(sma(close, sma_long))
+    return long_in.astype(np.float64)
+
+
+def rsi_positions(close, rsi_period: int = DEFAULT_PARAMS["rsi_period"],
+                  oversold: float = RSI_OVERSOLD,
+                  overbought: float = RSI_OVERBOUGHT) -> np.ndarray:
+    """Buy when RSI turns oversold and sell when it turns overbought."""
+    values = rsi(as_float_array(close), rsi_period)
+    return hold_between(values < oversold, values > overbought)
+
+
+# Strategy name -> position rule
+STRATEGIES = {
+    "macd": macd_positions,
+    "sma_trend": sma_trend_positions,
+    "rsi": rsi_positions,
+}
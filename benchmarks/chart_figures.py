@@ -0,0 +1,75 @@
+"""Benchmark technical chart figures: build time, JSON size and serialization time.
+
+Run from the repository root:
+
+    python -m benchmarks.chart_figures
+
+Each history length is rendered three ways: every point as SVG traces,
+every point as WebGL traces, and the app's default (downsampled, WebGL
+above ``CHART_WEBGL_THRESHOLD``). Serialization is timed the way
+``st.plotly_chart`` does it (``to_dict`` followed by ``plotly.io.to_json``).
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+
+from chart import build_technical_figure
+from indicators import compute_indicators
+
+SIZES = [1_000, 10_000, 100_000]
+
+
+def make_bars(n: int, seed: int = 0) -> pd.DataFrame:
+    """Generate ``n`` synthetic daily bars with indicator columns."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    spread = np.abs(rng.normal(0, 0.005, n)) * close
+    dates = pd.date_range(end="2026-01-30", periods=n, freq="D", tz="UTC", name="date")
+    bars = pd.DataFrame({
+        "open": close - spread / 2,
+        "high": close + spread,
+        "low": close - spread,
+        "close": close,
+        "volume": rng.integers(1_000_000, 5_000_000, n).astype(float),
+    }, index=dates)
+    indicators = compute_indicators(bars["close"].to_numpy(), bars["volume"].to_numpy())
+    return bars.assign(**indicators).reset_index()
+
+
+def measure(df: pd.DataFrame, **options) -> dict:
+    """Build and serialize one figure, returning timings in ms and the JSON size in KB."""
+    start = time.perf_counter()
+    fig = build_technical_figure(df, "BENCH", **options)
+    built = time.perf_counter()
+    spec = pio.to_json(fig.to_dict(), validate=False)
+    serialized = time.perf_counter()
+    return {
+        "points": sum(len(trace.x) for trace in fig.data),
+        "webgl": any(trace.type == "scattergl" for trace in fig.data),
+        "build_ms": (built - start) * 1000,
+        "serialize_ms": (serialized - built) * 1000,
+        "json_kb": len(spec) / 1024,
+    }
+
+
+def run(sizes: list[int] = SIZES) -> pd.DataFrame:
+    """Run the benchmark for every history length."""
+    rows = []
+    for n in sizes:
+        df = make_bars(n)
+        modes = {
+            "full svg": dict(max_points=n, max_candles=n, webgl=False),
+            "full webgl": dict(max_points=n, max_candles=n, webgl=True),
+            "default": {},
+        }
+        for mode, options in modes.items():
+            rows.append({"bars": n, "mode": mode, **measure(df, **options)})
+    return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    with pd.option_context("display.float_format", "{:,.1f}".format, "display.width", 120):
+        print(run().to_string(index=False))
@@ -0,0 +1,8 @@
+"""Caching utilities for Fintellix."""
+
+from .ttl_cache import TTLCache, estimate_size
+from .persistent_cache import PersistentCache, cache_key
+from .single_flight import SingleFlight
+from .tool_cache import cached_tool, TOOL_CACHES
+
+__all__ = ["TTLCache", "PersistentCache", "SingleFlight", "estimate_size", "cache_key", "cached_tool", "TOOL_CACHES"]
@@ -0,0 +1,147 @@
+"""Thread-safe SQLite-backed cache with per-entry expiry and LRU eviction."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+_MISSING = object()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+"""
+
+
+def cache_key(key: Any) -> str:
+    """Hash a JSON-serializable key into a stable string.
+
+    Dict keys are sorted, so keys built from the same values in a different
+    order map to the same entry.
+    """
+    encoded = json.dumps(key, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class PersistentCache:
+    """A bounded on-disk mapping whose entries expire after ``ttl`` seconds.
+
+    Keys and values must be JSON-serializable. Entries survive restarts and
+    are shared by every process using the same file. When more than
+    ``maxsize`` entries are stored, the least recently used are evicted.
+    Hit, miss and eviction counters (for this process) are kept for
+    inspection via ``stats()``.
+    """
+
+    def __init__(self, path: str | Path, maxsize: int = 1000, ttl: float = 3600):
+        self.path = Path(path)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._initialized = False
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the file and schema on first use."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            conn.executescript(_SCHEMA)
+            self._initialized = True
+        return conn
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Get a cached value, or ``default`` if missing or expired."""
+        hashed = cache_key(key)
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    row = conn.execute(
+                        "SELECT value, expires_at FROM entries WHERE key = ?", (hashed,)
+                    ).fetchone()
+                    if row is None or row[1] < now:
+                        if row is not None:
+                            conn.execute("DELETE FROM entries WHERE key = ?", (hashed,))
+                        self.misses += 1
+                        return default
+                    conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, hashed))
+            finally:
+                conn.close()
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key: Any, value: Any, ttl: float | None = None):
+        """Store a value, evicting the least recently used entries if full."""
+        now = time.time()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        encoded = json.dumps(value, default=str)
+        with self._lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO entries (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                        (cache_key(key), encoded, expires_at, now),
+                    )
+                    conn.execute("DELETE FROM entries WHERE expires_at < ?", (now,))
+                    overflow = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0] - self.maxsize
+                    if overflow > 0:
+                        conn.execute(
+                            "DELETE FROM entries WHERE key IN "
+                            "(SELECT key FROM entries ORDER BY accessed_at LIMIT ?)",
+                            (overflow,),
+                        )
+                        self.evictions += overflow
+            finally:
+                conn.close()
+
+    def invalidate(self, key: Any = _MISSING):
+        """Remove one entry, or every entry if no key is given."""
+        with self._lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    if key is _MISSING:
+                        conn.execute("DELETE FROM entries")
+                    else:
+                        conn.execute("DELETE FROM entries WHERE key = ?", (cache_key(key),))
+            finally:
+                conn.close()
+
+    def stats(self) -> dict:
+        """Get hit/miss counters and the current size."""
+        size = len(self)
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": size,
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "path": str(self.path),
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            conn = self._connect()
+            try:
+                return conn.execute(
+                    "SELECT COUNT(*) FROM entries WHERE expires_at >= ?", (time.time(),)
+                ).fetchone()[0]
+            finally:
+                conn.close()
@@ -0,0 +1,116 @@
+"""Request coalescing: concurrent calls for the same key share one execution."""
+
+import threading
+from typing import Any, Callable, Hashable, Iterable
+
+
+class _Call:
+    """An in-flight call whose result is shared with every waiting caller."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into a single execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is still running wait for it and receive the same result (or exception).
+    Nothing is cached once the call finishes.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run ``fn(*args, **kwargs)`` unless a call for ``key`` is already in flight."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.shared += 1
+                is_leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+                is_leader = True
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def do_many(
+        self,
+        keys: Iterable[Hashable],
+        fn: Callable[..., dict],
+        *args,
+        **kwargs,
+    ) -> dict:
+        """Run ``fn`` once for the keys not already in flight and join the rest.
+
+        ``fn(claimed_keys, *args, **kwargs)`` is called with the list of keys
+        this caller leads and must return a dict of their results. Keys that
+        another caller is already running are waited on instead, so each key
+        is fetched at most once however the concurrent batches overlap.
+
+        Returns:
+            dict: The result for every key.
+        """
+        claimed, joined = {}, {}
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                call = self._calls.get(key)
+                if call is not None:
+                    self.shared += 1
+                    joined[key] = call
+                else:
+                    claimed[key] = self._calls[key] = _Call()
+                    self.executed += 1
+
+        if claimed:
+            try:
+                results = fn(list(claimed), *args, **kwargs)
+                for key, call in claimed.items():
+                    call.result = results.get(key)
+            except BaseException as e:
+                for call in claimed.values():
+                    call.error = e
+                raise
+            finally:
+                with self._lock:
+                    for key in claimed:
+                        del self._calls[key]
+                for call in claimed.values():
+                    call.done.set()
+
+        for call in joined.values():
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+        return {key: call.result for key, call in {**claimed, **joined}.items()}
+
+    def stats(self) -> dict:
+        """Get how many calls were executed and how many were coalesced."""
+        with self._lock:
+            return {
+                "executed": self.executed,
+                "shared": self.shared,
+                "in_flight": len(self._calls),
+            }
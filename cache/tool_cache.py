@@ -0,0 +1,106 @@
+"""Memoization for agent tools shared across agent runs and sessions.
+
+Tools are wrapped beneath LangChain's ``@tool`` decorator::
+
+    @tool
+    @cached_tool("get_stock_info", ttl=60, normalize={"symbol": str.upper})
+    def get_stock_info(symbol: str) -> dict:
+        ...
+
+Results live in a bounded in-memory LRU per tool. If ``TOOL_CACHE_PATH`` is
+set, they are also written to an SQLite file shared by every process, so a
+restart or a second worker still finds them.
+"""
+
+import functools
+import inspect
+import os
+from typing import Any, Callable
+
+from .persistent_cache import PersistentCache
+from .single_flight import SingleFlight
+from .ttl_cache import TTLCache
+
+TOOL_CACHE_SIZE = int(os.getenv("TOOL_CACHE_SIZE", "256"))
+TOOL_CACHE_PATH = os.getenv("TOOL_CACHE_PATH")
+TOOL_CACHE_DISK_SIZE = int(os.getenv("TOOL_CACHE_DISK_SIZE", "5000"))
+
+# Shared on-disk tier (None unless TOOL_CACHE_PATH is set)
+TOOL_DISK_CACHE = (
+    PersistentCache(TOOL_CACHE_PATH, maxsize=TOOL_CACHE_DISK_SIZE) if TOOL_CACHE_PATH else None
+)
+
+# In-memory tier of every cached tool, by tool name
+TOOL_CACHES: dict[str, TTLCache] = {}
+
+_flights = SingleFlight()
+
+
+def _canonical(value: Any) -> Any:
+    """Collapse insignificant whitespace in string arguments."""
+    if isinstance(value, str):
+        return " ".join(value.split())
+    return value
+
+
+def _is_cacheable(result: Any) -> bool:
+    """Error payloads (``{"error": ...}``) are never cached, so they are retried."""
+    return result is not None and not (isinstance(result, dict) and "error" in result)
+
+
+def cached_tool(name: str, ttl: float, maxsize: int | None = None,
+                normalize: dict[str, Callable[[Any], Any]] | None = None):
+    """Cache a tool function's results by its canonicalized arguments.
+    
+    Arguments are bound to the function's signature (so positional, keyword
+    and default arguments give the same key), stripped of extra whitespace
+    and passed through the per-argument ``normalize`` functions. The tool
+    is called with the canonical arguments. Concurrent calls with the same
+    arguments share one execution.
+    
+    Args:
+        name: Tool name, used to namespace keys and in ``TOOL_CACHES``.
+        ttl: Seconds a result stays valid.
+        maxsize: In-memory entries for this tool (defaults to ``TOOL_CACHE_SIZE``).
+        normalize: Optional per-argument canonicalization, e.g. ``{"symbol": str.upper}``.
+    """
+    normalize = normalize or {}
+    cache = TOOL_CACHES[name] = TTLCache(maxsize=maxsize or TOOL_CACHE_SIZE, ttl=ttl)
+
+    def decorator(fn: Callable) -> Callable:
+        signature = inspect.signature(fn)
+
+        def compute(key: tuple, arguments: dict) -> Any:
+            if TOOL_DISK_CACHE is not None:
+                result = TOOL_DISK_CACHE.get(key)
+                if result is not None:
+                    cache.set(key, result)
+                    return result
+            result = fn(**arguments)
+            if _is_cacheable(result):
+                cache.set(key, result)
+                if TOOL_DISK_CACHE is not None:
+                    try:
+                        TOOL_DISK_CACHE.set(key, result, ttl=ttl)
+                    except (TypeError, ValueError) as e:
+                        print(f"Could not store {name} result on disk: {e}")
+            return result
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = {
+                arg: normalize.get(arg, _canonical)(_canonical(value))
+                for arg, value in bound.arguments.items()
+            }
+            key = (name, tuple(sorted(arguments.items())))
+            result = cache.get(key)
+            if result is not None:
+                return result
+            return _flights.do(key, compute, key, arguments)
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
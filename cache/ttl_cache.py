@@ -0,0 +1,117 @@
+"""Thread-safe in-memory cache with per-entry expiry and LRU eviction."""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+_MISSING = object()
+
+
+def estimate_size(value: Any) -> int:
+    """Estimate the memory used by a cached value in bytes.
+
+    DataFrames/Series and NumPy arrays report their buffer sizes; dicts,
+    lists and tuples are summed recursively; anything else falls back to
+    ``sys.getsizeof``.
+    """
+    if hasattr(value, "memory_usage"):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class TTLCache:
+    """A bounded mapping whose entries expire after ``ttl`` seconds.
+
+    When the cache is full, the least recently used entry is evicted. With
+    ``max_bytes`` set, entries are also evicted until the estimated size of
+    all values fits in that budget.
+    Hit, miss and eviction counters are kept for inspection via ``stats()``.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300, max_bytes: int | None = None,
+                 sizeof: Callable[[Any], int] = estimate_size):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._sizes: dict[Hashable, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value, or ``default`` if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING or entry[0] < time.monotonic():
+                if entry is not _MISSING:
+                    self._remove(key)
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None):
+        """Store a value, evicting the least recently used entry if full."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (expires_at, value)
+            self._sizes[key] = size
+            self._bytes += size
+            while self._data and (
+                len(self._data) > self.maxsize
+                or (self.max_bytes is not None and self._bytes > self.max_bytes)
+            ):
+                self._remove(next(iter(self._data)))
+                self.evictions += 1
+
+    def _remove(self, key: Hashable):
+        """Drop an entry and its size accounting (caller holds the lock)."""
+        del self._data[key]
+        self._bytes -= self._sizes.pop(key, 0)
+
+    def invalidate(self, key: Hashable | None = None):
+        """Remove one entry, or every entry if ``key`` is None."""
+        with self._lock:
+            if key is None:
+                self._data.clear()
+                self._sizes.clear()
+                self._bytes = 0
+            elif key in self._data:
+                self._remove(key)
+
+    def stats(self) -> dict:
+        """Get hit/miss counters and the current size."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
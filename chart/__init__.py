@@ -1,3 +1,33 @@
 from .display_chart import display_chart
+from .downsample import (
+    CHART_RANGES,
+    MAX_LINE_POINTS,
+    MAX_CANDLES,
+    lttb_indices,
+    downsample_line,
+    aggregate_ohlc,
+)
+from .figures import PLOTLY_TEMPLATE, WEBGL_THRESHOLD, build_price_figure, build_mini_figure, build_technical_figure
+from .figure_cache import FIGURE_CACHE, get_figure, figure_size
+from .sparkline import SPARKLINE_CACHE, sparkline_svg, sparkline_data_uri
 
-__all__ = ["display_chart"]
+__all__ = [
+    "display_chart",
+    "CHART_RANGES",
+    "MAX_LINE_POINTS",
+    "MAX_CANDLES",
+    "lttb_indices",
+    "downsample_line",
+    "aggregate_ohlc",
+    "PLOTLY_TEMPLATE",
+    "WEBGL_THRESHOLD",
+    "build_price_figure",
+    "build_mini_figure",
+    "build_technical_figure",
+    "FIGURE_CACHE",
+    "get_figure",
+    "figure_size",
+    "SPARKLINE_CACHE",
+    "sparkline_svg",
+    "sparkline_data_uri",
+]
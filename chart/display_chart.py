@@ -1,7 +1,8 @@
 import streamlit as st
-import plotly.graph_objects as go
-import pandas as pd
 import uuid
+from stock import payload_to_frame
+from .figures import build_price_figure
+from .figure_cache import get_figure
 
 
 def display_chart(symbol: str, stock_data: dict, chart_key: str | None = None):
@@ -13,31 +14,15 @@ def display_chart(symbol: str, stock_data: dict, chart_key: str | None = None):
         chart_key: Optional unique key for the chart element.
     """
     if "data" in stock_data and stock_data["data"]:
-        # Convert to DataFrame
-        df = pd.DataFrame(stock_data["data"])
-        df["date"] = pd.to_datetime(df["date"])
-        df = df.sort_values("date")
+        # Convert to a date-ordered DataFrame
+        frame = payload_to_frame(stock_data)
+        df = frame.reset_index()
         
         st.subheader(f"📊 {symbol} Price Chart")
         
-        # Create candlestick chart
-        fig = go.Figure(data=[go.Candlestick(
-            x=df["date"],
-            open=df["open"],
-            high=df["high"],
-            low=df["low"],
-            close=df["close"],
-            name=symbol
-        )])
-        
-        fig.update_layout(
-            xaxis_title="Date",
-            yaxis_title="Price (USD)",
-            template="plotly_dark",
-            height=350,
-            margin=dict(l=0, r=0, t=30, b=0),
-            xaxis_rangeslider_visible=False
-        )
+        # Candlestick chart, rebuilt only when the bars change
+        last_bar = (df["date"].iloc[-1].isoformat(), float(df["close"].iloc[-1]))
+        fig = get_figure("price", symbol, len(df), last_bar, build_price_figure, frame, symbol)
         
         # Use provided key or generate a unique one
         key = chart_key or f"chart_{uuid.uuid4()}"
@@ -54,5 +39,7 @@ def display_chart(symbol: str, stock_data: dict, chart_key: str | None = None):
         m2.metric("Open", f"${latest['open']:.2f}")
         m3.metric("High", f"${latest['high']:.2f}")
         m4.metric("Low", f"${latest['low']:.2f}")
+    elif stock_data.get("rate_limited"):
+        st.warning(f"Market data for {symbol} is temporarily rate limited. Use Refresh All to try again shortly.")
     else:
         st.error(f"Could not fetch data for {symbol}. Please check the symbol.")
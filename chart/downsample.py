@@ -0,0 +1,122 @@
+"""Downsampling of long price histories before they are sent to Plotly.
+
+Lines use Largest-Triangle-Three-Buckets (LTTB), which keeps the points
+that shape the curve; candles are aggregated into OHLC buckets. Both keep
+the number of points bounded no matter how much history is stored.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+# Roughly the pixel width of a wide chart; more points than this cannot be told apart
+MAX_LINE_POINTS = int(os.getenv("CHART_MAX_POINTS", "1500"))
+# Candles need a few pixels each to stay readable
+MAX_CANDLES = int(os.getenv("CHART_MAX_CANDLES", "500"))
+
+# Chart range label -> number of daily bars
+CHART_RANGES = {
+    "1M": 21,
+    "3M": 63,
+    "6M": 126,
+    "1Y": 252,
+    "5Y": 1260,
+    "Max": 5040,
+}
+
+
+def lttb_indices(x, y, threshold: int) -> np.ndarray:
+    """Select ``threshold`` points of a line with Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept. The points in between are
+    split into equal buckets and each bucket keeps the point forming the
+    largest triangle with the previously kept point and the average of the
+    next bucket.
+
+    Args:
+        x: Increasing x values (e.g. dates as integers).
+        y: Y values without NaNs.
+        threshold: Number of points to keep.
+
+    Returns:
+        Sorted indices of the kept points (every index if the line is
+        already short enough).
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.intp)
+    selected = np.empty(threshold, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def downsample_line(dates: pd.Index, values, max_points: int = MAX_LINE_POINTS) -> tuple[pd.Index, np.ndarray]:
+    """Downsample one line series with LTTB, dropping missing values.
+
+    Args:
+        dates: Dates of the points (a DatetimeIndex or date column).
+        values: Y values; NaNs (e.g. indicator warm-up) are left out.
+        max_points: Maximum number of points to keep.
+
+    Returns:
+        The kept dates and values.
+    """
+    dates = pd.DatetimeIndex(dates)
+    values = np.asarray(values, dtype=np.float64)
+    valid = ~np.isnan(values)
+    dates, values = dates[valid], values[valid]
+    keep = lttb_indices(dates.asi8, values, max_points)
+    return dates[keep], values[keep]
+
+
+def aggregate_ohlc(frame: pd.DataFrame, max_points: int = MAX_CANDLES) -> pd.DataFrame:
+    """Merge consecutive bars so at most ``max_points`` candles remain.
+
+    Each bucket keeps the first open, highest high, lowest low, last close
+    and total volume, dated at its first bar. Buckets are aligned to the
+    newest bar, so only the oldest one can be partial.
+
+    Args:
+        frame: Date-indexed bars in ascending order with OHLCV columns.
+        max_points: Maximum number of candles.
+
+    Returns:
+        The aggregated bars (the input itself if already short enough).
+    """
+    n = len(frame)
+    if n <= max_points:
+        return frame
+
+    size = -(-n // max_points)
+    starts = np.arange(n % size, n, size)
+    if starts[0] != 0:
+        starts = np.concatenate([[0], starts])
+    ends = np.append(starts[1:], n) - 1
+
+    return pd.DataFrame(
+        {
+            "open": frame["open"].to_numpy()[starts],
+            "high": np.maximum.reduceat(frame["high"].to_numpy(), starts),
+            "low": np.minimum.reduceat(frame["low"].to_numpy(), starts),
+            "close": frame["close"].to_numpy()[ends],
+            "volume": np.add.reduceat(frame["volume"].to_numpy(), starts),
+        },
+        index=frame.index[starts],
+    )
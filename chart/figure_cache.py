@@ -0,0 +1,61 @@
+"""Cache of built Plotly figures, reused until the chart's data changes.
+
+Building a figure (subplots, trace validation, downsampling) costs far more
+than handing an existing one to ``st.plotly_chart``, and the polling reruns
+redraw the same charts every couple of seconds.
+"""
+
+import os
+from typing import Callable
+
+import plotly.graph_objects as go
+
+from cache import TTLCache, estimate_size
+
+from .figures import PLOTLY_TEMPLATE
+
+# Trace attributes that hold the per-point data
+_DATA_ATTRIBUTES = ("x", "y", "open", "high", "low", "close")
+
+
+def figure_size(fig: go.Figure) -> int:
+    """Approximate the memory held by a figure's trace data in bytes."""
+    size = 0
+    for trace in fig.data:
+        for name in _DATA_ATTRIBUTES:
+            if name in trace:
+                size += estimate_size(trace[name])
+    return size
+
+
+FIGURE_CACHE = TTLCache(
+    maxsize=int(os.getenv("FIGURE_CACHE_SIZE", "64")),
+    ttl=float(os.getenv("FIGURE_CACHE_TTL", "3600")),
+    max_bytes=int(os.getenv("FIGURE_CACHE_MAX_BYTES", str(128 * 1024 * 1024))),
+    sizeof=figure_size,
+)
+
+
+def get_figure(chart_type: str, symbol: str, chart_range, last_bar: tuple,
+               build: Callable[..., go.Figure], *args, template: str = PLOTLY_TEMPLATE) -> go.Figure:
+    """Get a cached figure, building it only when its inputs changed.
+
+    Args:
+        chart_type: Kind of chart (e.g. "price" or "technical").
+        symbol: The stock symbol.
+        chart_range: The displayed range (label or bar count).
+        last_bar: Date and close of the newest bar in the chart (the close
+            changes while an intraday bar is still partial).
+        build: Figure builder, called as ``build(*args, template=template)`` on a miss.
+        *args: Arguments for ``build``.
+        template: Plotly template name (part of the key).
+
+    Returns:
+        The figure. It is shared between reruns, so callers must not modify it.
+    """
+    key = (symbol, chart_range, chart_type, last_bar, template)
+    fig = FIGURE_CACHE.get(key)
+    if fig is None:
+        fig = build(*args, template=template)
+        FIGURE_CACHE.set(key, fig)
+    return fig
@@ -0,0 +1,225 @@
+"""Plotly figure builders for the price and technical analysis charts."""
+
+import os
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from .downsample import MAX_CANDLES, MAX_LINE_POINTS, aggregate_ohlc, downsample_line
+
+PLOTLY_TEMPLATE = "plotly_dark"
+
+# Line traces with more points than this are drawn with WebGL instead of SVG
+WEBGL_THRESHOLD = int(os.getenv("CHART_WEBGL_THRESHOLD", "1000"))
+
+
+def build_price_figure(frame: pd.DataFrame, symbol: str, template: str = PLOTLY_TEMPLATE,
+                       max_candles: int = MAX_CANDLES) -> go.Figure:
+    """Build the candlestick price chart.
+    
+    Args:
+        frame: Date-indexed bars in ascending order with OHLC columns.
+        symbol: The stock symbol.
+        template: Plotly template name.
+        max_candles: Maximum number of candles (long ranges are merged).
+        
+    Returns:
+        The figure.
+    """
+    candles = aggregate_ohlc(frame, max_candles).reset_index()
+    fig = go.Figure(data=[go.Candlestick(
+        x=candles["date"],
+        open=candles["open"],
+        high=candles["high"],
+        low=candles["low"],
+        close=candles["close"],
+        name=symbol
+    )])
+    
+    fig.update_layout(
+        xaxis_title="Date",
+        yaxis_title="Price (USD)",
+        template=template,
+        height=350,
+        margin=dict(l=0, r=0, t=30, b=0),
+        xaxis_rangeslider_visible=False
+    )
+    return fig
+
+
+def build_mini_figure(frame: pd.DataFrame, template: str = PLOTLY_TEMPLATE) -> go.Figure:
+    """Build the small filled line chart shown in competitor popovers.
+    
+    Args:
+        frame: Date-indexed bars in ascending order with a ``close`` column.
+        template: Plotly template name.
+        
+    Returns:
+        The figure.
+    """
+    df = frame.reset_index()
+    rising = df["close"].iloc[-1] >= df["close"].iloc[0]
+    fig = go.Figure(data=[go.Scatter(
+        x=df["date"],
+        y=df["close"],
+        mode='lines',
+        line=dict(color='#00c853' if rising else '#ff5252', width=2),
+        fill='tozeroy',
+        fillcolor='rgba(0, 200, 83, 0.1)' if rising else 'rgba(255, 82, 82, 0.1)'
+    )])
+    
+    fig.update_layout(
+        template=template,
+        height=150,
+        margin=dict(l=0, r=0, t=10, b=0),
+        xaxis=dict(showticklabels=False, showgrid=False),
+        yaxis=dict(showticklabels=False, showgrid=False),
+        showlegend=False
+    )
+    return fig
+
+
+def build_technical_figure(df: pd.DataFrame, symbol: str, template: str = PLOTLY_TEMPLATE,
+                           max_points: int = MAX_LINE_POINTS, max_candles: int = MAX_CANDLES,
+                           webgl: bool | None = None) -> go.Figure:
+    """Build the price/MACD/RSI chart with indicator overlays.
+    
+    Args:
+        df: Bars with a ``date`` column and the ``compute_indicators`` columns.
+        symbol: The stock symbol.
+        template: Plotly template name.
+        max_points: Maximum points per indicator line (LTTB downsampling).
+        max_candles: Maximum number of candles.
+        webgl: Draw the indicator traces with WebGL. By default this is
+            decided by ``WEBGL_THRESHOLD``. Candlesticks have no WebGL
+            variant and are kept small by ``max_candles`` instead.
+        
+    Returns:
+        The three-row figure.
+    """
+    # Create subplot with 3 rows
+    fig = make_subplots(
+        rows=3, cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.05,
+        row_heights=[0.6, 0.2, 0.2],
+        subplot_titles=(f"{symbol} Price with Indicators", "MACD", "RSI")
+    )
+    
+    # Indicators are computed at full resolution; only the plotted points are downsampled
+    frame = df.set_index("date")
+    candles = aggregate_ohlc(frame, max_candles).reset_index()
+    
+    def line(column: str):
+        return downsample_line(df["date"], df[column], max_points)
+    
+    if webgl is None:
+        webgl = min(len(df), max_points) > WEBGL_THRESHOLD
+    Scatter = go.Scattergl if webgl else go.Scatter
+    
+    # Candlestick chart
+    fig.add_trace(
+        go.Candlestick(
+            x=candles["date"],
+            open=candles["open"],
+            high=candles["high"],
+            low=candles["low"],
+            close=candles["close"],
+            name="Price"
+        ),
+        row=1, col=1
+    )
+    
+    # Bollinger Bands
+    x, y = line("BB_Upper")
+    fig.add_trace(
+        Scatter(x=x, y=y, name="BB Upper",
+                   line=dict(color="rgba(173, 216, 230, 0.5)", width=1)),
+        row=1, col=1
+    )
+    x, y = line("BB_Lower")
+    fig.add_trace(
+        Scatter(x=x, y=y, name="BB Lower",
+                   line=dict(color="rgba(173, 216, 230, 0.5)", width=1),
+                   fill='tonexty', fillcolor='rgba(173, 216, 230, 0.1)'),
+        row=1, col=1
+    )
+    
+    # Moving Averages
+    x, y = line("SMA_20")
+    fig.add_trace(
+        Scatter(x=x, y=y, name="SMA 20",
+                   line=dict(color="#ffc107", width=1.5)),
+        row=1, col=1
+    )
+    x, y = line("SMA_50")
+    fig.add_trace(
+        Scatter(x=x, y=y, name="SMA 50",
+                   line=dict(color="#2196f3", width=1.5)),
+        row=1, col=1
+    )
+    
+    # MACD
+    x, y = line("MACD_Hist")
+    if webgl:
+        # Bars have no WebGL variant; draw the histogram as filled areas instead
+        for values, color, show in ((np.maximum(y, 0), '#00c853', True), (np.minimum(y, 0), '#ff5252', False)):
+            fig.add_trace(
+                Scatter(x=x, y=values, name="MACD Histogram", legendgroup="macd_hist", showlegend=show,
+                        mode="lines", line=dict(color=color, width=0), fill="tozeroy", fillcolor=color),
+                row=2, col=1
+            )
+    else:
+        colors = np.where(y >= 0, '#00c853', '#ff5252')
+        fig.add_trace(
+            go.Bar(x=x, y=y, name="MACD Histogram",
+                   marker_color=colors),
+            row=2, col=1
+        )
+    x, y = line("MACD")
+    fig.add_trace(
+        Scatter(x=x, y=y, name="MACD",
+                   line=dict(color="#2196f3", width=1.5)),
+        row=2, col=1
+    )
+    x, y = line("MACD_Signal")
+    fig.add_trace(
+        Scatter(x=x, y=y, name="Signal",
+                   line=dict(color="#ff9800", width=1.5)),
+        row=2, col=1
+    )
+    
+    # RSI
+    x, y = line("RSI")
+    fig.add_trace(
+        Scatter(x=x, y=y, name="RSI",
+                   line=dict(color="#9c27b0", width=1.5)),
+        row=3, col=1
+    )
+    # Overbought/Oversold lines - add shapes directly to RSI subplot
+    fig.add_shape(type="line", y0=70, y1=70, x0=0, x1=1, xref="x3 domain", yref="y3",
+                  line=dict(color="red", dash="dash"))
+    fig.add_shape(type="line", y0=30, y1=30, x0=0, x1=1, xref="x3 domain", yref="y3",
+                  line=dict(color="green", dash="dash"))
+    fig.add_shape(type="rect", y0=70, y1=100, x0=0, x1=1, xref="x3 domain", yref="y3",
+                  fillcolor="red", opacity=0.1, line_width=0)
+    fig.add_shape(type="rect", y0=0, y1=30, x0=0, x1=1, xref="x3 domain", yref="y3",
+                  fillcolor="green", opacity=0.1, line_width=0)
+    
+    # Update layout
+    fig.update_layout(
+        template=template,
+        height=700,
+        showlegend=True,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        xaxis_rangeslider_visible=False,
+        margin=dict(l=0, r=0, t=30, b=0)
+    )
+    
+    fig.update_yaxes(title_text="Price ($)", row=1, col=1)
+    fig.update_yaxes(title_text="MACD", row=2, col=1)
+    fig.update_yaxes(title_text="RSI", row=3, col=1, range=[0, 100])
+    
+    return fig
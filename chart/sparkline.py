@@ -0,0 +1,80 @@
+"""Tiny SVG sparklines for places where a full Plotly chart is too heavy."""
+
+import base64
+import os
+
+import numpy as np
+import pandas as pd
+
+from cache import TTLCache
+
+UP_COLOR = "#00c853"
+DOWN_COLOR = "#ff5252"
+
+# Keyed by the last bar, so entries only go stale through the TTL safety net
+SPARKLINE_CACHE = TTLCache(
+    maxsize=int(os.getenv("SPARKLINE_CACHE_SIZE", "512")),
+    ttl=float(os.getenv("SPARKLINE_CACHE_TTL", "86400")),
+)
+
+
+def sparkline_svg(values, width: int = 120, height: int = 36, stroke_width: float = 1.5) -> str:
+    """Draw a series as a small SVG line with a shaded area below it.
+
+    The line is green if the last value is at or above the first, red otherwise.
+
+    Args:
+        values: The series to draw (NaNs are skipped).
+        width: Image width in pixels.
+        height: Image height in pixels.
+        stroke_width: Line width in pixels.
+
+    Returns:
+        The SVG markup (empty if fewer than two values are available).
+    """
+    y = np.asarray(values, dtype=np.float64)
+    y = y[~np.isnan(y)]
+    if len(y) < 2:
+        return ""
+
+    color = UP_COLOR if y[-1] >= y[0] else DOWN_COLOR
+    pad = stroke_width
+    span = y.max() - y.min() or 1.0
+    xs = np.linspace(pad, width - pad, len(y))
+    ys = height - pad - (y - y.min()) / span * (height - 2 * pad)
+    line = " ".join(f"{x:.1f},{v:.1f}" for x, v in zip(xs, ys))
+    area = f"{xs[0]:.1f},{height} {line} {xs[-1]:.1f},{height}"
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}">'
+        f'<polygon points="{area}" fill="{color}" fill-opacity="0.12"/>'
+        f'<polyline points="{line}" fill="none" stroke="{color}" stroke-width="{stroke_width}" '
+        f'stroke-linejoin="round" stroke-linecap="round"/>'
+        f'</svg>'
+    )
+
+
+def sparkline_data_uri(symbol: str, history: pd.DataFrame, width: int = 120, height: int = 36) -> str:
+    """Get a sparkline of a history frame's closes as a data URI for an ``<img>`` tag.
+
+    Results are memoized per symbol, size and last bar, so reruns reuse the
+    encoded image until a new bar arrives.
+
+    Args:
+        symbol: The stock symbol.
+        history: Date-indexed bars in ascending order with a ``close`` column.
+        width: Image width in pixels.
+        height: Image height in pixels.
+
+    Returns:
+        The data URI, or an empty string if there is not enough data.
+    """
+    if len(history) < 2:
+        return ""
+    key = (symbol, width, height, history.index[-1].isoformat(), float(history["close"].iloc[-1]), len(history))
+    uri = SPARKLINE_CACHE.get(key)
+    if uri is None:
+        svg = sparkline_svg(history["close"].to_numpy(), width, height)
+        uri = "data:image/svg+xml;base64," + base64.b64encode(svg.encode()).decode() if svg else ""
+        SPARKLINE_CACHE.set(key, uri)
+    return uri
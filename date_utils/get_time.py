@@ -2,8 +2,11 @@ from datetime import datetime
 
 from langchain.tools import tool
 
+from cache import cached_tool
+
 
 @tool
+@cached_tool("get_current_date", ttl=60)
 def get_current_date() -> str:
     """Get today's current date.
     
@@ -0,0 +1,36 @@
+"""Technical indicator engine for Fintellix."""
+
+from .kernels import sma, ema, rolling_std, macd, rsi, bollinger_bands
+from .engine import compute_indicators, DEFAULT_PARAMS, INDICATOR_NAMES
+from .streaming import IndicatorState
+from .signals import (
+    rsi_signal,
+    macd_signal,
+    trend_signal,
+    bollinger_position,
+    bollinger_signal,
+    classify,
+)
+from .batch import align_bars, compute_indicators_batch, last_valid_values
+
+__all__ = [
+    "sma",
+    "ema",
+    "rolling_std",
+    "macd",
+    "rsi",
+    "bollinger_bands",
+    "compute_indicators",
+    "DEFAULT_PARAMS",
+    "INDICATOR_NAMES",
+    "IndicatorState",
+    "rsi_signal",
+    "macd_signal",
+    "trend_signal",
+    "bollinger_position",
+    "bollinger_signal",
+    "classify",
+    "align_bars",
+    "compute_indicators_batch",
+    "last_valid_values",
+]
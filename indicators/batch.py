@@ -0,0 +1,81 @@
+"""Indicator computation across many symbols as aligned 2-D arrays."""
+
+import numpy as np
+import pandas as pd
+
+from .engine import compute_indicators
+
+
+def align_bars(frames: dict[str, pd.DataFrame]) -> tuple[list[str], pd.DatetimeIndex, np.ndarray, np.ndarray]:
+    """Align per-symbol history frames on a shared date axis.
+
+    Args:
+        frames: Mapping of symbol to a date-indexed frame with ``close`` and
+            ``volume`` columns.
+
+    Returns:
+        The symbols (row order), the shared dates and (symbols x bars) close
+        and volume matrices. Bars before a symbol's first date or after its
+        last are NaN; gaps inside its history are forward-filled (close) or
+        zero (volume).
+    """
+    symbols = [symbol for symbol, frame in frames.items() if not frame.empty]
+    if not symbols:
+        return [], pd.DatetimeIndex([]), np.empty((0, 0)), np.empty((0, 0))
+
+    first_index = frames[symbols[0]].index
+    dates = pd.DatetimeIndex(first_index.append([frames[s].index for s in symbols[1:]]).unique()).sort_values()
+    date_keys = dates.asi8
+
+    close = np.full((len(symbols), len(dates)), np.nan)
+    volume = np.full((len(symbols), len(dates)), np.nan)
+    for row, symbol in enumerate(symbols):
+        frame = frames[symbol]
+        positions = np.searchsorted(date_keys, pd.DatetimeIndex(frame.index).asi8)
+        first, last = positions.min(), positions.max()
+        # Forward-fill gaps inside the symbol's own history
+        fill = np.zeros(len(dates), dtype=np.intp)
+        fill[positions] = positions
+        fill = np.maximum.accumulate(fill[first:last + 1])
+        values = np.full(len(dates), np.nan)
+        values[positions] = frame["close"].to_numpy(dtype=np.float64)
+        close[row, first:last + 1] = values[fill]
+        volume[row, first:last + 1] = 0.0
+        volume[row, positions] = frame["volume"].to_numpy(dtype=np.float64)
+
+    return symbols, dates, close, volume
+
+
+def compute_indicators_batch(close, volume=None, **params) -> dict[str, np.ndarray]:
+    """Compute every indicator for many symbols in one vectorized pass.
+
+    Args:
+        close: (symbols x bars) closing prices, oldest first. Rows may start
+            with NaNs for symbols listed later than others.
+        volume: (symbols x bars) volumes (optional).
+        **params: Overrides for ``DEFAULT_PARAMS``.
+
+    Returns:
+        Mapping of indicator name to a (symbols x bars) array.
+    """
+    close = np.atleast_2d(np.asarray(close, dtype=np.float64))
+    if volume is not None:
+        volume = np.atleast_2d(np.asarray(volume, dtype=np.float64))
+    return compute_indicators(close, volume, **params)
+
+
+def last_valid_values(close: np.ndarray, indicators: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """Get each symbol's indicator values at its most recent bar.
+
+    Symbols whose history ends before the shared last date use their own
+    last bar rather than the trailing NaNs.
+    """
+    close = np.atleast_2d(close)
+    valid = ~np.isnan(close)
+    n = close.shape[-1]
+    last = np.where(valid.any(axis=-1), n - 1 - np.argmax(valid[..., ::-1], axis=-1), 0)
+    rows = np.arange(close.shape[0])
+    result = {"close": np.where(valid.any(axis=-1), close[rows, last], np.nan)}
+    for name, values in indicators.items():
+        result[name] = values[rows, last]
+    return result
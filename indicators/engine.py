@@ -0,0 +1,63 @@
+"""Compute the full indicator set used by the technical analysis views."""
+
+import numpy as np
+
+from .kernels import bollinger_bands, ema, macd, rsi, sma
+
+# Default parameters for compute_indicators
+DEFAULT_PARAMS = {
+    "sma_short": 20,
+    "sma_long": 50,
+    "ema_fast": 12,
+    "ema_slow": 26,
+    "macd_signal": 9,
+    "rsi_period": 14,
+    "bb_window": 20,
+    "bb_std": 2.0,
+    "volume_window": 20,
+}
+
+# Names of the arrays returned by compute_indicators
+INDICATOR_NAMES = [
+    "SMA_20", "SMA_50", "EMA_12", "EMA_26",
+    "MACD", "MACD_Signal", "MACD_Hist",
+    "RSI",
+    "BB_Middle", "BB_Upper", "BB_Lower",
+    "Volume_SMA",
+]
+
+
+def compute_indicators(close, volume=None, **params) -> dict[str, np.ndarray]:
+    """Compute moving averages, MACD, RSI and Bollinger Bands.
+    
+    Args:
+        close: Closing prices, oldest first (1-D, or 2-D with one row per symbol).
+        volume: Volumes with the same shape as ``close`` (optional).
+        **params: Overrides for ``DEFAULT_PARAMS``.
+        
+    Returns:
+        Mapping of indicator name (see ``INDICATOR_NAMES``) to an array with
+        the same shape as ``close``. Names keep the default periods even when
+        the parameters are overridden.
+    """
+    p = {**DEFAULT_PARAMS, **params}
+    
+    macd_line, macd_signal, macd_hist = macd(close, p["ema_fast"], p["ema_slow"], p["macd_signal"])
+    bb_middle, bb_upper, bb_lower = bollinger_bands(close, p["bb_window"], p["bb_std"])
+    
+    result = {
+        "SMA_20": sma(close, p["sma_short"]),
+        "SMA_50": sma(close, p["sma_long"]),
+        "EMA_12": ema(close, p["ema_fast"]),
+        "EMA_26": ema(close, p["ema_slow"]),
+        "MACD": macd_line,
+        "MACD_Signal": macd_signal,
+        "MACD_Hist": macd_hist,
+        "RSI": rsi(close, p["rsi_period"]),
+        "BB_Middle": bb_middle,
+        "BB_Upper": bb_upper,
+        "BB_Lower": bb_lower,
+    }
+    if volume is not None:
+        result["Volume_SMA"] = sma(volume, p["volume_window"])
+    return result
@@ -0,0 +1,111 @@
+"""Vectorized NumPy kernels for technical indicators.
+
+Every kernel works along the last axis, so it accepts a single price series
+(1-D) or one series per row (2-D). Results match the pandas rolling/ewm
+calculations the technical tab used originally: windows that are not yet
+full are NaN and EMAs are seeded with the first value (``adjust=False``).
+
+Leading NaNs (e.g. a symbol listed later than the others in a batch) are
+skipped, so each row gives the same result as its trimmed 1-D series.
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Largest power of the EMA decay factor kept in one block (avoids overflow)
+_MAX_BLOCK_SCALE = 100 * np.log(10)
+
+
+def as_float_array(values) -> np.ndarray:
+    """Convert values to a contiguous float64 array."""
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def sma(values, window: int) -> np.ndarray:
+    """Simple moving average over ``window`` bars."""
+    x = as_float_array(values)
+    out = np.full(x.shape, np.nan)
+    if x.shape[-1] >= window:
+        out[..., window - 1:] = sliding_window_view(x, window, axis=-1).mean(axis=-1)
+    return out
+
+
+def rolling_std(values, window: int, ddof: int = 1) -> np.ndarray:
+    """Rolling sample standard deviation over ``window`` bars."""
+    x = as_float_array(values)
+    out = np.full(x.shape, np.nan)
+    if x.shape[-1] >= window:
+        out[..., window - 1:] = sliding_window_view(x, window, axis=-1).std(axis=-1, ddof=ddof)
+    return out
+
+
+def ema(values, span: int) -> np.ndarray:
+    """Exponential moving average seeded with the first valid value.
+
+    The recursion ``y[t] = (1 - a) * y[t-1] + a * x[t]`` is solved in closed
+    form with cumulative sums over blocks, so there is no per-bar Python
+    loop. Blocks are sized so the scaling factors cannot overflow.
+
+    Leading NaNs stay NaN and the EMA starts at each row's first valid
+    value. Interior NaNs are not supported and propagate.
+    """
+    x = as_float_array(values)
+    out = np.empty_like(x)
+    n = x.shape[-1]
+    if n == 0:
+        return out
+    alpha = 2.0 / (span + 1.0)
+    decay = 1.0 - alpha
+    if decay <= 0:
+        out[...] = x
+        return out
+
+    # Start every row from zero and scale its first valid value by 1/alpha,
+    # which makes the recursion output exactly that value at the first bar.
+    valid = ~np.isnan(x)
+    started = np.logical_or.accumulate(valid, axis=-1)
+    first = valid & ~np.concatenate([np.zeros_like(started[..., :1]), started[..., :-1]], axis=-1)
+    x = np.where(started, x, 0.0)
+    x = np.where(first, x / alpha, x)
+
+    block = int(max(1, min(n, _MAX_BLOCK_SCALE // -np.log(decay))))
+    powers = decay ** np.arange(block)
+    prev = np.zeros(x.shape[:-1])
+    for start in range(0, n, block):
+        segment = x[..., start:start + block]
+        p = powers[:segment.shape[-1]]
+        acc = np.cumsum(segment / p, axis=-1)
+        y = (decay * p) * prev[..., None] + alpha * p * acc
+        out[..., start:start + segment.shape[-1]] = y
+        prev = y[..., -1]
+    out[~started] = np.nan
+    return out
+
+
+def macd(values, fast: int = 12, slow: int = 26, signal: int = 9) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD line, signal line and histogram."""
+    line = ema(values, fast) - ema(values, slow)
+    signal_line = ema(line, signal)
+    return line, signal_line, line - signal_line
+
+
+def rsi(values, period: int = 14) -> np.ndarray:
+    """Relative Strength Index using simple moving averages of gains and losses."""
+    x = as_float_array(values)
+    delta = np.diff(x, axis=-1, prepend=np.nan)
+    # A bar without a previous close counts as no change; missing bars stay NaN
+    missing = np.isnan(x)
+    gain = np.where(missing, np.nan, np.where(delta > 0, delta, 0.0))
+    loss = np.where(missing, np.nan, np.where(delta < 0, -delta, 0.0))
+    avg_gain = sma(gain, period)
+    avg_loss = sma(loss, period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = avg_gain / avg_loss
+        return 100 - (100 / (1 + rs))
+
+
+def bollinger_bands(values, window: int = 20, num_std: float = 2.0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bollinger middle, upper and lower bands."""
+    middle = sma(values, window)
+    std = rolling_std(values, window)
+    return middle, middle + std * num_std, middle - std * num_std
@@ -0,0 +1,99 @@
+"""Signal rules applied to indicator values (shared by the technical tab and the scanner)."""
+
+import math
+
+RSI_OVERBOUGHT = 70
+RSI_OVERSOLD = 30
+BB_UPPER_ZONE = 80
+BB_LOWER_ZONE = 20
+
+# Points each signal contributes to the scanner's bullish/bearish score
+SIGNAL_SCORES = {
+    "Oversold": 1,
+    "Overbought": -1,
+    "Bullish": 1,
+    "Bearish": -1,
+    "Strong Bullish": 2,
+    "Strong Bearish": -2,
+}
+
+
+def _missing(*values) -> bool:
+    return any(value is None or math.isnan(value) for value in values)
+
+
+def rsi_signal(rsi: float) -> str | None:
+    """Classify RSI as Overbought, Oversold or Neutral (None if unavailable)."""
+    if _missing(rsi):
+        return None
+    if rsi > RSI_OVERBOUGHT:
+        return "Overbought"
+    if rsi < RSI_OVERSOLD:
+        return "Oversold"
+    return "Neutral"
+
+
+def macd_signal(macd: float, signal: float) -> str | None:
+    """Classify MACD against its signal line as Bullish or Bearish."""
+    if _missing(macd, signal):
+        return None
+    return "Bullish" if macd > signal else "Bearish"
+
+
+def trend_signal(price: float, sma_short: float, sma_long: float) -> str | None:
+    """Classify the price trend from the short and long SMAs."""
+    if _missing(sma_short, sma_long):
+        return None
+    if price > sma_short > sma_long:
+        return "Strong Bullish"
+    if price > sma_short:
+        return "Bullish"
+    if price < sma_short < sma_long:
+        return "Strong Bearish"
+    return "Bearish"
+
+
+def bollinger_position(price: float, upper: float, lower: float) -> float | None:
+    """Position of the price within the Bollinger Bands, in percent.
+
+    None if the bands are unavailable or have no width (a flat series).
+    """
+    if _missing(upper, lower) or upper == lower:
+        return None
+    return (price - lower) / (upper - lower) * 100
+
+
+def bollinger_signal(position: float | None) -> str | None:
+    """Classify a Bollinger position as near the upper band, lower band or mid range."""
+    if position is None or math.isnan(position):
+        return None
+    if position > BB_UPPER_ZONE:
+        return "Near Upper Band"
+    if position < BB_LOWER_ZONE:
+        return "Near Lower Band"
+    return "Mid Range"
+
+
+def classify(values: dict[str, float]) -> dict:
+    """Apply every signal rule to one symbol's latest indicator values.
+
+    Args:
+        values: Latest values keyed like ``compute_indicators`` plus ``close``.
+
+    Returns:
+        The RSI, MACD, trend and Bollinger signals with an overall score
+        (positive is bullish).
+    """
+    price = values["close"]
+    position = bollinger_position(price, values["BB_Upper"], values["BB_Lower"])
+    signals = {
+        "rsi_signal": rsi_signal(values["RSI"]),
+        "macd_signal": macd_signal(values["MACD"], values["MACD_Signal"]),
+        "trend": trend_signal(price, values["SMA_20"], values["SMA_50"]),
+        "bb_position": position,
+        "bb_signal": bollinger_signal(position),
+    }
+    signals["score"] = sum(
+        SIGNAL_SCORES.get(signals[name], 0) for name in ("rsi_signal", "macd_signal", "trend")
+    )
+    return signals
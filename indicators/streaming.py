@@ -0,0 +1,207 @@
+"""Incremental indicator state: constant-time updates as new bars arrive."""
+
+import math
+from collections import deque
+
+import numpy as np
+
+from .engine import DEFAULT_PARAMS
+from .kernels import as_float_array, ema
+
+NAN = float("nan")
+
+
+def _tail_mean(values: deque, window: int) -> float:
+    """Mean of the last ``window`` values, or NaN if there are fewer."""
+    if len(values) < window:
+        return NAN
+    tail = list(values)[-window:]
+    return math.fsum(tail) / window
+
+
+def _tail_std(values: deque, window: int) -> float:
+    """Sample standard deviation of the last ``window`` values, or NaN if there are fewer."""
+    if len(values) < window or window < 2:
+        return NAN
+    tail = list(values)[-window:]
+    mean = math.fsum(tail) / window
+    return math.sqrt(math.fsum((v - mean) ** 2 for v in tail) / (window - 1))
+
+
+class IndicatorState:
+    """Running indicator state for one symbol.
+
+    Holds the EMA values, the recent gains/losses for RSI and ring buffers
+    for the SMAs and rolling standard deviation, so appending a bar costs
+    the same regardless of how much history came before it. Values match
+    ``compute_indicators`` on the full series.
+
+    Appending a bar with the same date as the last one replaces it, which
+    lets partial intraday bars be corrected when the final bar arrives.
+    """
+
+    def __init__(self, **params):
+        self.params = {**DEFAULT_PARAMS, **params}
+        p = self.params
+        self.closes: deque = deque(maxlen=max(p["sma_short"], p["sma_long"], p["bb_window"]))
+        self.volumes: deque = deque(maxlen=p["volume_window"])
+        self.gains: deque = deque(maxlen=p["rsi_period"])
+        self.losses: deque = deque(maxlen=p["rsi_period"])
+        self.ema_fast: float | None = None
+        self.ema_slow: float | None = None
+        self.macd_signal: float | None = None
+        self.count = 0
+        self.last_date: str | None = None
+        self._previous: dict | None = None
+
+    def _alpha(self, span: int) -> float:
+        return 2.0 / (span + 1.0)
+
+    def _ema_step(self, previous: float | None, value: float, span: int) -> float:
+        if previous is None:
+            return value
+        alpha = self._alpha(span)
+        return (1 - alpha) * previous + alpha * value
+
+    def update(self, close: float, volume: float | None = None, date: str | None = None) -> dict[str, float]:
+        """Append one bar and return the updated indicator values."""
+        if date is not None and date == self.last_date and self._previous is not None:
+            self._restore(self._previous)
+        self._previous = self._snapshot()
+
+        p = self.params
+        close = float(close)
+        if self.closes:
+            delta = close - self.closes[-1]
+            self.gains.append(max(delta, 0.0))
+            self.losses.append(max(-delta, 0.0))
+        else:
+            # The first bar has no change; it counts as neither gain nor loss
+            self.gains.append(0.0)
+            self.losses.append(0.0)
+        self.closes.append(close)
+        if volume is not None:
+            self.volumes.append(float(volume))
+
+        self.ema_fast = self._ema_step(self.ema_fast, close, p["ema_fast"])
+        self.ema_slow = self._ema_step(self.ema_slow, close, p["ema_slow"])
+        self.macd_signal = self._ema_step(self.macd_signal, self.ema_fast - self.ema_slow, p["macd_signal"])
+        self.count += 1
+        if date is not None:
+            self.last_date = date
+        return self.values()
+
+    def values(self) -> dict[str, float]:
+        """Get the current indicator values (same names as ``compute_indicators``)."""
+        p = self.params
+        if self.count == 0:
+            return {}
+
+        macd = self.ema_fast - self.ema_slow
+        bb_middle = _tail_mean(self.closes, p["bb_window"])
+        bb_std = _tail_std(self.closes, p["bb_window"])
+
+        rsi = NAN
+        if len(self.gains) == p["rsi_period"]:
+            avg_gain = math.fsum(self.gains) / p["rsi_period"]
+            avg_loss = math.fsum(self.losses) / p["rsi_period"]
+            if avg_loss > 0:
+                rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+            elif avg_gain > 0:
+                rsi = 100.0
+
+        return {
+            "SMA_20": _tail_mean(self.closes, p["sma_short"]),
+            "SMA_50": _tail_mean(self.closes, p["sma_long"]),
+            "EMA_12": self.ema_fast,
+            "EMA_26": self.ema_slow,
+            "MACD": macd,
+            "MACD_Signal": self.macd_signal,
+            "MACD_Hist": macd - self.macd_signal,
+            "RSI": rsi,
+            "BB_Middle": bb_middle,
+            "BB_Upper": bb_middle + bb_std * p["bb_std"],
+            "BB_Lower": bb_middle - bb_std * p["bb_std"],
+            "Volume_SMA": _tail_mean(self.volumes, p["volume_window"]),
+        }
+
+    def _snapshot(self) -> dict:
+        return {
+            "closes": list(self.closes),
+            "volumes": list(self.volumes),
+            "gains": list(self.gains),
+            "losses": list(self.losses),
+            "ema_fast": self.ema_fast,
+            "ema_slow": self.ema_slow,
+            "macd_signal": self.macd_signal,
+            "count": self.count,
+            "last_date": self.last_date,
+        }
+
+    def _restore(self, snapshot: dict):
+        self.closes = deque(snapshot["closes"], maxlen=self.closes.maxlen)
+        self.volumes = deque(snapshot["volumes"], maxlen=self.volumes.maxlen)
+        self.gains = deque(snapshot["gains"], maxlen=self.gains.maxlen)
+        self.losses = deque(snapshot["losses"], maxlen=self.losses.maxlen)
+        self.ema_fast = snapshot["ema_fast"]
+        self.ema_slow = snapshot["ema_slow"]
+        self.macd_signal = snapshot["macd_signal"]
+        self.count = snapshot["count"]
+        self.last_date = snapshot["last_date"]
+
+    def to_dict(self) -> dict:
+        """Serialize the state to JSON-compatible data."""
+        return {
+            "params": self.params,
+            **self._snapshot(),
+            "previous": self._previous,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "IndicatorState":
+        """Rebuild a state serialized with ``to_dict``."""
+        state = cls(**data["params"])
+        state._restore(data)
+        state._previous = data.get("previous")
+        return state
+
+    @classmethod
+    def from_bars(cls, closes, volumes=None, dates=None, **params) -> "IndicatorState":
+        """Build a state from a history of bars, oldest first.
+
+        ``dates`` should be a list or array of bar date strings.
+
+        The history is summarized with the vectorized kernels; only the last
+        bar goes through ``update`` so it can still be replaced later.
+        """
+        state = cls(**params)
+        close = as_float_array(closes)
+        n = len(close)
+        if n == 0:
+            return state
+
+        p = state.params
+        head = close[:-1]
+        if len(head):
+            ema_fast = ema(head, p["ema_fast"])
+            ema_slow = ema(head, p["ema_slow"])
+            state.ema_fast = float(ema_fast[-1])
+            state.ema_slow = float(ema_slow[-1])
+            state.macd_signal = float(ema(ema_fast - ema_slow, p["macd_signal"])[-1])
+
+            delta = np.diff(head, prepend=np.nan)
+            state.gains.extend(np.where(delta > 0, delta, 0.0)[-p["rsi_period"]:].tolist())
+            state.losses.extend(np.where(delta < 0, -delta, 0.0)[-p["rsi_period"]:].tolist())
+            state.closes.extend(head[-state.closes.maxlen:].tolist())
+            if volumes is not None:
+                state.volumes.extend(as_float_array(volumes)[:-1][-state.volumes.maxlen:].tolist())
+            state.count = n - 1
+            if dates is not None:
+                state.last_date = dates[-2]
+
+        state.update(
+            close[-1],
+            None if volumes is None else as_float_array(volumes)[-1],
+            None if dates is None else dates[-1],
+        )
+        return state
@@ -0,0 +1,20 @@
+"""Market data provider modules for Fintellix."""
+
+from .base import MarketDataProvider
+from .yfinance_provider import YFinanceProvider
+from .replay import ReplayProvider, record_fixtures
+from .rate_limit import MARKET_DATA_LIMITER, RateLimiter, RateLimitError, is_throttling_error
+from .factory import MARKET_DATA_PROVIDERS, get_market_data_provider
+
+__all__ = [
+    "MarketDataProvider",
+    "YFinanceProvider",
+    "ReplayProvider",
+    "record_fixtures",
+    "MARKET_DATA_LIMITER",
+    "RateLimiter",
+    "RateLimitError",
+    "is_throttling_error",
+    "MARKET_DATA_PROVIDERS",
+    "get_market_data_provider",
+]
@@ -0,0 +1,51 @@
+"""Base class for market data providers."""
+
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+
+class MarketDataProvider(ABC):
+    """Abstract base class for market data providers.
+
+    Bars are returned as DataFrames indexed by date with ``Open``, ``High``,
+    ``Low``, ``Close`` and ``Volume`` columns, matching yfinance.
+    """
+    
+    name: str = "base"
+    
+    @abstractmethod
+    def get_history(
+        self,
+        symbols: List[str],
+        period: Optional[str] = None,
+        start: Optional[str] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """Get daily bars for several symbols.
+        
+        Args:
+            symbols: Stock symbols to fetch.
+            period: Lookback period such as "45d", "6mo" or "1y".
+            start: Fetch bars on or after this "YYYY-MM-DD" date instead.
+            
+        Returns:
+            Mapping of symbol to its bars. Symbols without data map to an
+            empty DataFrame.
+        """
+        pass
+    
+    @abstractmethod
+    def get_quote(self, symbol: str) -> pd.DataFrame:
+        """Get the last few daily bars used to build the latest quote."""
+        pass
+    
+    @abstractmethod
+    def get_fundamentals(self, symbol: str) -> dict:
+        """Get company fundamentals (yfinance ``Ticker.info`` keys)."""
+        pass
+    
+    @staticmethod
+    def is_available() -> bool:
+        """Check if this provider can serve data."""
+        return False
@@ -0,0 +1,29 @@
+"""Factory functions for market data providers."""
+
+import os
+from typing import Dict, Optional, Type
+
+from .base import MarketDataProvider
+from .replay import ReplayProvider
+from .yfinance_provider import YFinanceProvider
+
+
+# Registry of all available market data providers
+MARKET_DATA_PROVIDERS: Dict[str, Type[MarketDataProvider]] = {
+    "yfinance": YFinanceProvider,
+    "replay": ReplayProvider,
+}
+
+
+def get_market_data_provider(provider_name: Optional[str] = None) -> MarketDataProvider:
+    """Get a market data provider instance by name.
+    
+    Args:
+        provider_name: Provider name ('yfinance', 'replay'). If None, reads
+            the MARKET_DATA_PROVIDER environment variable (default 'yfinance').
+    """
+    if provider_name is None:
+        provider_name = os.getenv("MARKET_DATA_PROVIDER", "yfinance")
+    if provider_name not in MARKET_DATA_PROVIDERS:
+        raise ValueError(f"Unknown market data provider: {provider_name}. Available: {list(MARKET_DATA_PROVIDERS.keys())}")
+    return MARKET_DATA_PROVIDERS[provider_name]()
@@ -0,0 +1,134 @@
+"""Process-wide pacing and throttling backoff for upstream market data requests."""
+
+import os
+import random
+import threading
+import time
+from typing import Any, Callable
+
+
+class RateLimitError(Exception):
+    """Raised when the upstream keeps throttling us after every retry."""
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """Check whether an exception means the upstream is rate limiting us."""
+    try:
+        from yfinance.exceptions import YFRateLimitError
+        if isinstance(error, YFRateLimitError):
+            return True
+    except ImportError:
+        pass
+    return is_throttling_message(str(error))
+
+
+def is_throttling_message(message: str) -> bool:
+    """Check whether an error message says the upstream is rate limiting us."""
+    message = message.lower()
+    return any(marker in message for marker in ("too many requests", "rate limit", "429"))
+
+
+class RateLimiter:
+    """Token-bucket limiter with retries and jittered exponential backoff.
+
+    The refill rate adapts: it is halved whenever the upstream throttles us
+    and recovers gradually after successful calls, up to the configured rate.
+    """
+
+    def __init__(
+        self,
+        rate: float = 2.0,
+        burst: int = 5,
+        max_retries: int = 4,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        min_rate: float = 0.1,
+    ):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.min_rate = min_rate
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._counters = {
+            "calls": 0,
+            "succeeded": 0,
+            "throttled": 0,
+            "retried": 0,
+            "rate_limited": 0,
+            "failed": 0,
+        }
+
+    def _count(self, name: str):
+        with self._lock:
+            self._counters[name] += 1
+
+    def acquire(self):
+        """Block until a request token is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def _on_throttled(self):
+        """Slow down after the upstream throttled a request."""
+        with self._lock:
+            self._counters["throttled"] += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = 0
+
+    def _on_success(self):
+        """Recover the request rate gradually after a successful call."""
+        with self._lock:
+            self._counters["succeeded"] += 1
+            self.rate = min(self.max_rate, self.rate + self.max_rate * 0.1)
+
+    def call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Call ``fn`` once a token is available, retrying throttled calls.
+
+        Raises:
+            RateLimitError: If the call is still throttled after all retries.
+        """
+        self._count("calls")
+        for attempt in range(self.max_retries + 1):
+            self.acquire()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                if not is_throttling_error(e):
+                    self._count("failed")
+                    raise
+                self._on_throttled()
+                if attempt == self.max_retries:
+                    self._count("rate_limited")
+                    raise RateLimitError(f"Rate limited by upstream after {attempt + 1} attempts: {e}") from e
+                delay = min(self.max_delay, self.base_delay * 2 ** attempt) * random.uniform(0.5, 1.5)
+                print(f"Throttled by upstream, retrying in {delay:.1f}s")
+                self._count("retried")
+                time.sleep(delay)
+            else:
+                self._on_success()
+                return result
+
+    def stats(self) -> dict:
+        """Get call counters and the current request rate."""
+        with self._lock:
+            return {**self._counters, "rate": self.rate}
+
+
+# Shared by every thread in the process
+MARKET_DATA_LIMITER = RateLimiter(
+    rate=float(os.getenv("MARKET_DATA_RATE", "2")),
+    burst=int(os.getenv("MARKET_DATA_BURST", "5")),
+    max_retries=int(os.getenv("MARKET_DATA_MAX_RETRIES", "4")),
+)
@@ -0,0 +1,133 @@
+"""File-backed market data provider that replays recorded fixtures.
+
+Fixtures live in one directory per recording: ``<SYMBOL>.csv`` (or
+``<SYMBOL>.parquet``) holds the daily bars and ``<SYMBOL>.json`` holds the
+fundamentals. Lookback periods are anchored to the last recorded bar rather
+than today, so replays are deterministic.
+"""
+
+import json
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from .base import MarketDataProvider
+
+DEFAULT_REPLAY_DIR = Path(__file__).parent.parent / "data" / "replay"
+
+_PERIOD_PATTERN = re.compile(r"^(\d+)(d|wk|mo|y)$")
+
+
+def _period_to_offset(period: str) -> pd.DateOffset | None:
+    """Convert a yfinance period string into a date offset (None means everything)."""
+    match = _PERIOD_PATTERN.match(period)
+    if not match:
+        return None
+    amount, unit = int(match.group(1)), match.group(2)
+    if unit == "d":
+        return pd.DateOffset(days=amount)
+    if unit == "wk":
+        return pd.DateOffset(weeks=amount)
+    if unit == "mo":
+        return pd.DateOffset(months=amount)
+    return pd.DateOffset(years=amount)
+
+
+@lru_cache(maxsize=256)
+def _read_bars(path: str, mtime: float) -> pd.DataFrame:
+    """Read a bar fixture. ``mtime`` is part of the cache key so edits are picked up."""
+    if path.endswith(".parquet"):
+        bars = pd.read_parquet(path)
+    else:
+        bars = pd.read_csv(path, index_col=0)
+    bars.index = pd.DatetimeIndex(pd.to_datetime(bars.index), name="Date")
+    return bars.sort_index()
+
+
+class ReplayProvider(MarketDataProvider):
+    """Market data provider serving recorded CSV/Parquet fixtures."""
+    
+    name = "replay"
+    
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = Path(directory or os.getenv("MARKET_DATA_REPLAY_DIR", DEFAULT_REPLAY_DIR))
+    
+    def _load_bars(self, symbol: str) -> pd.DataFrame:
+        """Load the recorded bars for a symbol, or an empty frame if none exist."""
+        for suffix in (".parquet", ".csv"):
+            path = self.directory / f"{symbol}{suffix}"
+            if path.exists():
+                return _read_bars(str(path), path.stat().st_mtime)
+        return pd.DataFrame()
+    
+    def get_history(
+        self,
+        symbols: List[str],
+        period: Optional[str] = None,
+        start: Optional[str] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """Serve recorded bars filtered by ``start`` or ``period``."""
+        result = {}
+        for symbol in symbols:
+            bars = self._load_bars(symbol)
+            if not bars.empty:
+                if start:
+                    bars = bars[bars.index >= pd.Timestamp(start)]
+                else:
+                    offset = _period_to_offset(period or "1mo")
+                    if offset is not None:
+                        bars = bars[bars.index > bars.index[-1] - offset]
+            result[symbol] = bars
+        return result
+    
+    def get_quote(self, symbol: str) -> pd.DataFrame:
+        """Serve the last five days of recorded bars."""
+        return self.get_history([symbol], period="5d")[symbol]
+    
+    def get_fundamentals(self, symbol: str) -> dict:
+        """Serve recorded fundamentals (empty if none were recorded)."""
+        path = self.directory / f"{symbol}.json"
+        if not path.exists():
+            return {}
+        with open(path, "r") as f:
+            return json.load(f)
+    
+    def is_available(self) -> bool:
+        """Check if the fixture directory exists."""
+        return self.directory.is_dir()
+
+
+def record_fixtures(
+    symbols: List[str],
+    directory: Optional[str] = None,
+    period: str = "2y",
+    source: Optional[MarketDataProvider] = None,
+):
+    """Record bars and fundamentals from a live provider for later replay.
+    
+    Args:
+        symbols: Stock symbols to record.
+        directory: Where to write the fixtures. Defaults to the replay directory.
+        period: How much history to record.
+        source: Provider to record from. Defaults to Yahoo Finance.
+    """
+    if source is None:
+        from .yfinance_provider import YFinanceProvider
+        source = YFinanceProvider()
+    
+    target = Path(directory or os.getenv("MARKET_DATA_REPLAY_DIR", DEFAULT_REPLAY_DIR))
+    target.mkdir(parents=True, exist_ok=True)
+    
+    for symbol, bars in source.get_history(symbols, period=period).items():
+        if bars.empty:
+            print(f"No data to record for {symbol}")
+            continue
+        bars.to_csv(target / f"{symbol}.csv", index_label="Date")
+        fundamentals = source.get_fundamentals(symbol)
+        with open(target / f"{symbol}.json", "w") as f:
+            json.dump(fundamentals, f, indent=2, default=str)
+        print(f"Recorded {len(bars)} bars for {symbol}")
@@ -0,0 +1,92 @@
+"""Yahoo Finance market data provider."""
+
+import logging
+import threading
+from typing import Dict, List, Optional
+
+import pandas as pd
+import yfinance as yf
+
+from .base import MarketDataProvider
+from .rate_limit import MARKET_DATA_LIMITER, is_throttling_message
+
+
+def _symbol_bars(hist: Optional[pd.DataFrame], symbol: str) -> pd.DataFrame:
+    """Get one symbol's bars from a multi-ticker frame, empty if it failed."""
+    if hist is None or hist.empty or symbol not in hist.columns.get_level_values(0):
+        return pd.DataFrame()
+    return hist[symbol].dropna(how="all")
+
+
+class _ThrottleWatch(logging.Handler):
+    """Notice rate-limit errors that ``yf.download`` logs on the calling thread.
+
+    ``yf.download`` does not raise per-ticker failures; it logs them once all
+    tickers are done. Records from other threads (other downloads running
+    at the same time) are ignored.
+    """
+
+    def __init__(self):
+        super().__init__(logging.ERROR)
+        self.thread = threading.get_ident()
+        self.throttled = False
+
+    def emit(self, record: logging.LogRecord):
+        if record.thread == self.thread and is_throttling_message(record.getMessage()):
+            self.throttled = True
+
+
+def _download(symbols: List[str], **kwargs) -> pd.DataFrame:
+    """Run a multi-ticker download, raising if Yahoo throttled it.
+
+    Only a rate-limit error reported by yfinance counts as throttling, so
+    the limiter backs off and retries. Tickers that simply have no data
+    (unknown or delisted symbols) come back as empty frames.
+    """
+    logger = logging.getLogger("yfinance")
+    watch = _ThrottleWatch()
+    logger.addHandler(watch)
+    try:
+        hist = yf.download(
+            symbols,
+            group_by="ticker",
+            threads=True,
+            progress=False,
+            **kwargs
+        )
+    finally:
+        logger.removeHandler(watch)
+    if watch.throttled:
+        raise yf.exceptions.YFRateLimitError()
+    return hist
+
+
+class YFinanceProvider(MarketDataProvider):
+    """Market data provider backed by Yahoo Finance (yfinance)."""
+    
+    name = "yfinance"
+    
+    def get_history(
+        self,
+        symbols: List[str],
+        period: Optional[str] = None,
+        start: Optional[str] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """Download bars for all symbols in one multi-ticker request."""
+        kwargs = {"start": start} if start else {"period": period or "1mo"}
+        hist = MARKET_DATA_LIMITER.call(_download, symbols, **kwargs)
+        
+        return {symbol: _symbol_bars(hist, symbol) for symbol in symbols}
+    
+    def get_quote(self, symbol: str) -> pd.DataFrame:
+        """Get the last five days of bars."""
+        return MARKET_DATA_LIMITER.call(yf.Ticker(symbol).history, period="5d")
+    
+    def get_fundamentals(self, symbol: str) -> dict:
+        """Get ``Ticker.info`` for a symbol."""
+        return MARKET_DATA_LIMITER.call(lambda: yf.Ticker(symbol).info)
+    
+    @staticmethod
+    def is_available() -> bool:
+        """Yahoo Finance needs no credentials."""
+        return True
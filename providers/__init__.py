@@ -6,6 +6,7 @@ from .ollama import OllamaProvider
 from .openai_provider import OpenAIProvider
 from .factory import (
     get_provider,
+    invalidate_provider_cache,
     get_llm,
     get_available_models,
     get_lm_studio_models,
@@ -19,6 +20,7 @@ __all__ = [
     "OllamaProvider",
     "OpenAIProvider",
     "get_provider",
+    "invalidate_provider_cache",
     "get_llm",
     "get_available_models",
     "get_lm_studio_models",
@@ -1,22 +1,34 @@
 """Base class for LLM providers."""
 
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Sequence, Tuple
 
 
 class BaseLLMProvider(ABC):
-    """Abstract base class for LLM providers."""
+    """Abstract base class for LLM providers.
+    
+    LLM clients (with their HTTP connection pools) and compiled agents are
+    cached per model and tool set, so repeated queries skip client setup,
+    TLS handshakes and agent graph compilation. Call ``invalidate()`` to
+    drop them, e.g. when the model selection changes.
+    """
     
     name: str = "base"
     
+    def __init__(self):
+        self._llms: Dict[str, Any] = {}
+        self._agents: Dict[Tuple[str, Tuple[str, ...]], Any] = {}
+        self._lock = threading.Lock()
+    
     @abstractmethod
     def get_models(self) -> List[str]:
         """Get list of available models from this provider."""
         pass
     
     @abstractmethod
-    def get_llm(self, model: Optional[str] = None) -> Any:
-        """Get an LLM instance for simple invoke() calls."""
+    def create_llm(self, model: Optional[str] = None) -> Any:
+        """Create a new LLM client for the given model."""
         pass
     
     @abstractmethod
@@ -24,7 +36,108 @@ class BaseLLMProvider(ABC):
         """Run an agent query with the given system prompt."""
         pass
     
+    def get_llm(self, model: Optional[str] = None) -> Any:
+        """Get a cached LLM instance for simple invoke() calls."""
+        key = model or ""
+        with self._lock:
+            if key not in self._llms:
+                self._llms[key] = self.create_llm(model)
+            return self._llms[key]
+    
+    @staticmethod
+    def default_tools() -> List[Any]:
+        """Get the tools available to the analysis agent."""
+        from search import search_web
+        from stock import get_stock_info
+        from date_utils import get_current_date
+        return [get_current_date, search_web, get_stock_info]
+    
+    def get_agent(self, model: Optional[str] = None, tools: Optional[Sequence[Any]] = None) -> Any:
+        """Get a cached compiled agent for the given model and tool set.
+        
+        Args:
+            model: Model to use. If None, uses the provider's default.
+            tools: LangChain tools for the agent. Defaults to ``default_tools()``.
+            
+        Returns:
+            The compiled agent graph.
+        """
+        from langchain.agents import create_agent
+        
+        tools = list(tools) if tools is not None else self.default_tools()
+        # Tools are LangChain tools or plain functions
+        key = (model or "", tuple(getattr(tool, "name", None) or tool.__name__ for tool in tools))
+        llm = self.get_llm(model)
+        with self._lock:
+            if key not in self._agents:
+                self._agents[key] = create_agent(model=llm, tools=tools)
+            return self._agents[key]
+    
+    def stream_agent(self, query: str, system_prompt: str, model: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Run an agent query, yielding events as they happen.
+        
+        Events are dicts with a ``type`` key:
+        
+        - ``token``: a piece of model output text (``content``).
+        - ``tool_call``: the model called a tool (``name``).
+        - ``tool_result``: a tool finished (``name``, ``content``).
+        - ``done``: the run finished; ``content`` is the final response (the
+          text after the last tool result, like ``run_agent`` returns).
+        
+        Args:
+            query: The user's question or request.
+            system_prompt: System instructions for the agent.
+            model: Model to use. If None, uses the provider's default.
+        """
+        from langchain_core.messages import HumanMessage, SystemMessage, ToolMessage
+        
+        agent = self.get_agent(model)
+        response = []
+        stream = agent.stream(
+            {"messages": [SystemMessage(content=system_prompt), HumanMessage(content=query)]},
+            stream_mode="messages",
+        )
+        for message, _metadata in stream:
+            if isinstance(message, ToolMessage):
+                # Only text after the last tool result is the final answer
+                response = []
+                yield {"type": "tool_result", "name": message.name, "content": _message_text(message)}
+                continue
+            # Streamed chunks carry tool_call_chunks; providers that send whole
+            # messages only set tool_calls
+            tool_calls = getattr(message, "tool_call_chunks", None) or getattr(message, "tool_calls", None) or []
+            for tool_call in tool_calls:
+                if tool_call.get("name"):
+                    yield {"type": "tool_call", "name": tool_call["name"]}
+            text = _message_text(message)
+            if text:
+                response.append(text)
+                yield {"type": "token", "content": text}
+        yield {"type": "done", "content": "".join(response)}
+    
+    def invalidate(self, model: Optional[str] = None):
+        """Drop cached clients and agents for one model, or for every model if None."""
+        with self._lock:
+            if model is None:
+                self._llms.clear()
+                self._agents.clear()
+                return
+            self._llms.pop(model, None)
+            for key in [key for key in self._agents if key[0] == model]:
+                del self._agents[key]
+    
     @staticmethod
     def is_available() -> bool:
         """Check if this provider is available (service running, API key set, etc.)."""
         return False
+
+
+def _message_text(message: Any) -> str:
+    """Get the text of a message whose content is a string or a list of content blocks."""
+    content = message.content
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block.get("text", "") if isinstance(block, dict) else str(block)
+        for block in content or []
+    )
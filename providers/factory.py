@@ -1,5 +1,6 @@
 """Factory functions for LLM providers."""
 
+import threading
 from typing import Dict, List, Optional, Type, Any
 
 from .base import BaseLLMProvider
@@ -16,13 +17,40 @@ PROVIDERS: Dict[str, Type[BaseLLMProvider]] = {
 }
 
 
+# One shared instance per provider, so its cached clients and agents are reused
+_instances: Dict[str, BaseLLMProvider] = {}
+_instances_lock = threading.Lock()
+
+
 def get_provider(provider_name: Optional[str] = None) -> BaseLLMProvider:
-    """Get a provider instance by name."""
+    """Get the shared provider instance by name."""
     if provider_name is None:
         provider_name = "lm_studio"
     if provider_name not in PROVIDERS:
         raise ValueError(f"Unknown provider: {provider_name}. Available: {list(PROVIDERS.keys())}")
-    return PROVIDERS[provider_name]()
+    with _instances_lock:
+        if provider_name not in _instances:
+            _instances[provider_name] = PROVIDERS[provider_name]()
+        return _instances[provider_name]
+
+
+def invalidate_provider_cache(provider_name: Optional[str] = None, model: Optional[str] = None):
+    """Drop cached LLM clients and agents.
+    
+    Args:
+        provider_name: Provider to invalidate. If None, every provider is
+            invalidated and the shared instances are recreated on next use.
+        model: Only drop this model's clients and agents.
+    """
+    with _instances_lock:
+        if provider_name is None:
+            providers = list(_instances.values())
+            if model is None:
+                _instances.clear()
+        else:
+            providers = [_instances[provider_name]] if provider_name in _instances else []
+    for provider in providers:
+        provider.invalidate(model)
 
 
 def get_llm(provider_name: Optional[str] = None, model: Optional[str] = None) -> Any:
@@ -64,14 +92,14 @@ def get_available_models(provider_name: str) -> List[str]:
 # Convenience functions for getting models from each provider
 def get_lm_studio_models() -> List[str]:
     """Get available LM Studio models."""
-    return LMStudioProvider().get_models()
+    return get_provider("lm_studio").get_models()
 
 
 def get_ollama_models() -> List[str]:
     """Get available Ollama models."""
-    return OllamaProvider().get_models()
+    return get_provider("ollama").get_models()
 
 
 def get_openai_models() -> List[str]:
     """Get available OpenAI models."""
-    return OpenAIProvider().get_models()
+    return get_provider("openai").get_models()
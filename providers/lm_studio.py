@@ -38,8 +38,8 @@ class LMStudioProvider(BaseLLMProvider):
                 pass
         return []
     
-    def get_llm(self, model: Optional[str] = None):
-        """Get a ChatOpenAI instance pointed at LM Studio."""
+    def create_llm(self, model: Optional[str] = None):
+        """Create a ChatOpenAI instance pointed at LM Studio."""
         from langchain_openai import ChatOpenAI
         return ChatOpenAI(
             base_url=self.base_url,
@@ -50,16 +50,10 @@ class LMStudioProvider(BaseLLMProvider):
     
     def run_agent(self, query: str, system_prompt: str, model: Optional[str] = None) -> str:
         """Run a query using LangChain agent with LM Studio."""
-        from langchain.agents import create_agent
         from langchain_core.messages import HumanMessage, SystemMessage
-        from search import search_web
-        from stock import get_stock_info
-        from date_utils import get_current_date
         
         try:
-            llm = self.get_llm(model)
-            tools = [get_current_date, search_web, get_stock_info]
-            agent = create_agent(model=llm, tools=tools)
+            agent = self.get_agent(model)
             
             result = agent.invoke({
                 "messages": [
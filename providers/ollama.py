@@ -30,8 +30,8 @@ class OllamaProvider(BaseLLMProvider):
             print(f"Error fetching Ollama models: {e}")
         return []
     
-    def get_llm(self, model: Optional[str] = None):
-        """Get a ChatOllama instance."""
+    def create_llm(self, model: Optional[str] = None):
+        """Create a ChatOllama instance."""
         from langchain_ollama import ChatOllama
         return ChatOllama(
             model=model or "llama2",
@@ -41,15 +41,9 @@ class OllamaProvider(BaseLLMProvider):
     
     def run_agent(self, query: str, system_prompt: str, model: Optional[str] = None) -> str:
         """Run a query using LangChain agent with Ollama."""
-        from langchain.agents import create_agent
         from langchain_core.messages import HumanMessage, SystemMessage
-        from search import search_web
-        from stock import get_stock_info
-        from date_utils import get_current_date
         
-        llm = self.get_llm(model)
-        tools = [get_current_date, search_web, get_stock_info]
-        agent = create_agent(model=llm, tools=tools)
+        agent = self.get_agent(model)
         
         result = agent.invoke({
             "messages": [
@@ -46,8 +46,8 @@ class OpenAIProvider(BaseLLMProvider):
             print(f"Error fetching OpenAI models: {e}")
         return []
     
-    def get_llm(self, model: Optional[str] = None):
-        """Get a ChatOpenAI instance."""
+    def create_llm(self, model: Optional[str] = None):
+        """Create a ChatOpenAI instance."""
         from langchain_openai import ChatOpenAI
         return ChatOpenAI(
             model=model or "gpt-4-turbo",
@@ -56,15 +56,9 @@ class OpenAIProvider(BaseLLMProvider):
     
     def run_agent(self, query: str, system_prompt: str, model: Optional[str] = None) -> str:
         """Run a query using LangChain agent with OpenAI."""
-        from langchain.agents import create_agent
         from langchain_core.messages import HumanMessage, SystemMessage
-        from search import search_web
-        from stock import get_stock_info
-        from date_utils import get_current_date
         
-        llm = self.get_llm(model)
-        tools = [get_current_date, search_web, get_stock_info]
-        agent = create_agent(model=llm, tools=tools)
+        agent = self.get_agent(model)
         
         result = agent.invoke({
             "messages": [
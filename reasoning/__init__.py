@@ -1,2 +1,3 @@
-from .llm import run_agent, filter_response_for_mode
-__all__ = ["run_agent", "filter_response_for_mode"]
\ No newline at end of file
+from .llm import run_agent, stream_agent, filter_response_for_mode, split_response, response_mode, generate_takeaway, generate_analysis, complete_response
+from .prefetch import prefetch_market_data, build_market_context
+__all__ = ["run_agent", "stream_agent", "filter_response_for_mode", "split_response", "response_mode", "generate_takeaway", "generate_analysis", "complete_response", "prefetch_market_data", "build_market_context"]
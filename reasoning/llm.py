@@ -1,9 +1,11 @@
 """Agent runner and response filtering for Fintellix."""
 
-from typing import Optional
+from typing import Iterator, Optional
 import re
 
 from providers import get_provider, get_llm
+from .prefetch import build_market_context
+from .response_cache import RESPONSE_CACHE, response_key, is_cacheable
 
 # Re-export provider functions for backwards compatibility
 from providers import (
@@ -66,6 +68,18 @@ When analyzing a stock, ALWAYS structure your response in this order:
    - Short-term vs long-term perspective
    - Always remind users that this is not financial advice"""
 
+# Added when the query starts with a pre-fetched market data block (see reasoning/prefetch.py)
+PREFETCHED_DATA_NOTE = """
+
+PREFETCHED DATA:
+The user's message starts with a PREFETCHED MARKET DATA block holding today's date, the latest quote, recent daily bars and recent news for the stock being discussed. Treat it as the results of get_current_date, get_stock_info and search_web and use it directly - do NOT call those tools again for the same information. Only use your tools for anything the block marks as unavailable or does not cover (e.g. other companies, older history or follow-up research)."""
+
+# Beginner mode only shows the takeaway, so the analysis sections are researched but not written
+BEGINNER_ONLY_NOTE = """
+
+BEGINNER MODE:
+The user only sees the beginner takeaway. Gather the information for sections 1-5 above, but do NOT write those sections - reply with ONLY section 6 below."""
+
 # Beginner takeaway section (added when beginner mode is on)
 BEGINNER_SECTION = """
 
@@ -85,22 +99,53 @@ BEGINNER_SECTION = """
    💡 **Simple Advice:** One sentence of actionable advice for a beginner"""
 
 
-def run_agent(query: str, llm_provider: Optional[str] = None, selected_model: Optional[str] = None) -> str:
-    """Run the agent with a given query.
+# Cheap follow-up that adds a takeaway to an analysis written in full mode
+TAKEAWAY_PROMPT = """Below is a stock analysis. Using only the information in it, write the beginner takeaway section described here:
+{section}
+
+Reply with ONLY that section, starting with its heading. If the text below is not a stock analysis, reply with only: NONE
+
+Analysis:
+{analysis}"""
+
+
+# Writes the analysis sections from the research a beginner-mode run already gathered
+ANALYSIS_PROMPT = """Below is the research gathered to answer a user's question about a stock: their message (with any pre-fetched market data) followed by the results of the tools that were used. Using only this research, write the analysis described here:
+{sections}
+
+The research is already done - do not ask for or mention tools. Reply with ONLY sections 1-5. Be concise, factual, and helpful, and cite the sources of information from web searches.
+
+Research:
+{research}"""
+
+
+def response_mode(beginner_mode: Optional[bool]) -> str:
+    """Get which sections a response generated for a mode holds: "beginner", "full" or "both"."""
+    if beginner_mode is None:
+        return "both"
+    return "beginner" if beginner_mode else "full"
+
+
+def _agent_prompt(prefetched: bool = False, beginner_mode: Optional[bool] = None) -> str:
+    """Build the system prompt for stock analysis.
     
-    Args:
-        query: The user's question or request.
-        llm_provider: LLM provider ('lm_studio', 'ollama', 'openai'). If None, reads from streamlit session.
-        selected_model: Model to use. If None, reads from streamlit session.
-        
-    Returns:
-        The agent's response (always includes beginner takeaway section).
+    Only the sections needed for ``beginner_mode`` are requested; None
+    requests both the analysis and the beginner takeaway.
     """
-    # Always include beginner section - filtering happens at display time
-    full_prompt = SYSTEM_PROMPT + BEGINNER_SECTION
+    if beginner_mode is None:
+        full_prompt = SYSTEM_PROMPT + BEGINNER_SECTION
+    elif beginner_mode:
+        full_prompt = SYSTEM_PROMPT + BEGINNER_ONLY_NOTE + BEGINNER_SECTION
+    else:
+        full_prompt = SYSTEM_PROMPT
+    if prefetched:
+        full_prompt += PREFETCHED_DATA_NOTE
     full_prompt += "\n\nBe concise, factual, and helpful. Cite your sources when providing information from web searches. Focus on actionable, timely information first."
-    
-    # Get provider and model from params or session state
+    return full_prompt
+
+
+def _resolve_llm_settings(llm_provider: Optional[str], selected_model: Optional[str]) -> tuple[str, str]:
+    """Fill in the provider and model from the streamlit session when not given."""
     if llm_provider is None or selected_model is None:
         try:
             import streamlit as st
@@ -113,12 +158,135 @@ def run_agent(query: str, llm_provider: Optional[str] = None, selected_model: Op
                 llm_provider = "lm_studio"
             if selected_model is None:
                 selected_model = ""
+    return llm_provider or "lm_studio", selected_model or ""
+
+
+def _research_text(context: str, tool_results: list[dict]) -> str:
+    """Join the query sent to the agent with the tool results it got back."""
+    parts = [context] + [f"Result of {result['name']}:\n{result['content']}" for result in tool_results]
+    return "\n\n".join(parts)
+
+
+def _with_market_context(query: str, symbol: Optional[str]) -> str:
+    """Prepend the pre-fetched market data block for a symbol to the query."""
+    if not symbol:
+        return query
+    return build_market_context(symbol) + "\n\n" + query
+
+
+def run_agent(query: str, llm_provider: Optional[str] = None, selected_model: Optional[str] = None,
+              symbol: Optional[str] = None, force_refresh: bool = False,
+              beginner_mode: Optional[bool] = None) -> str:
+    """Run the agent with a given query.
+    
+    Responses are cached (see ``reasoning.response_cache``) until the
+    symbol's market data changes or the entry expires.
     
+    Args:
+        query: The user's question or request.
+        llm_provider: LLM provider ('lm_studio', 'ollama', 'openai'). If None, reads from streamlit session.
+        selected_model: Model to use. If None, reads from streamlit session.
+        symbol: Stock being discussed. If given, its date, quote, bars and news
+            are fetched up front and added to the query.
+        force_refresh: Skip the cached response and run the agent again.
+        beginner_mode: Generate only the beginner takeaway (True) or only the
+            analysis (False). None generates both.
+        
+    Returns:
+        The agent's response with the sections for ``beginner_mode``.
+    """
+    llm_provider, selected_model = _resolve_llm_settings(llm_provider, selected_model)
     print(f"DEBUG: run_agent - Using provider={llm_provider}, model={selected_model}")
     
+    key = response_key(f"analysis:{response_mode(beginner_mode)}", query, llm_provider, selected_model,
+                       [symbol] if symbol else None)
+    if not force_refresh:
+        cached = RESPONSE_CACHE.get(key)
+        if cached is not None:
+            print("DEBUG: run_agent - Using cached response")
+            return cached
+    
     # Get the provider and run the agent
-    provider = get_provider(llm_provider or "lm_studio")
-    return provider.run_agent(query, full_prompt, selected_model or None)
+    provider = get_provider(llm_provider)
+    response = provider.run_agent(_with_market_context(query, symbol), _agent_prompt(bool(symbol), beginner_mode), selected_model or None)
+    if is_cacheable(response):
+        RESPONSE_CACHE.set(key, response)
+    return response
+
+
+def stream_agent(query: str, llm_provider: Optional[str] = None, selected_model: Optional[str] = None,
+                 symbol: Optional[str] = None, force_refresh: bool = False,
+                 beginner_mode: Optional[bool] = None) -> Iterator[dict]:
+    """Run the agent with a given query, yielding token and tool events as they arrive.
+    
+    Args:
+        query: The user's question or request.
+        llm_provider: LLM provider ('lm_studio', 'ollama', 'openai'). If None, reads from streamlit session.
+        selected_model: Model to use. If None, reads from streamlit session.
+        symbol: Stock being discussed (see ``run_agent``).
+        force_refresh: Skip the cached response and run the agent again.
+        beginner_mode: Sections to generate (see ``run_agent``).
+        
+    Returns:
+        Iterator of events (see ``BaseLLMProvider.stream_agent``). The final
+        ``done`` event holds the same response ``run_agent`` would return.
+        In beginner mode it also holds the ``research`` the takeaway was
+        based on, for writing the analysis later (see ``complete_response``).
+        A cached response is yielded as a single token event.
+    """
+    llm_provider, selected_model = _resolve_llm_settings(llm_provider, selected_model)
+    print(f"DEBUG: stream_agent - Using provider={llm_provider}, model={selected_model}")
+    
+    mode = response_mode(beginner_mode)
+    key = response_key(f"analysis:{mode}", query, llm_provider, selected_model,
+                       [symbol] if symbol else None)
+    # Same query, model and market stamp as the response it belongs to
+    research_key = {**key, "kind": f"research:{mode}"} if beginner_mode else None
+    if not force_refresh:
+        cached = RESPONSE_CACHE.get(key)
+        if cached is not None:
+            print("DEBUG: stream_agent - Using cached response")
+            done = {"type": "done", "content": cached}
+            if beginner_mode:
+                done["research"] = RESPONSE_CACHE.get(research_key)
+            yield {"type": "token", "content": cached}
+            yield done
+            return
+    
+    context = _with_market_context(query, symbol)
+    tool_results = []
+    provider = get_provider(llm_provider)
+    for event in provider.stream_agent(context, _agent_prompt(bool(symbol), beginner_mode), selected_model or None):
+        if event["type"] == "tool_result":
+            tool_results.append(event)
+        elif event["type"] == "done" and beginner_mode:
+            event = {**event, "research": _research_text(context, tool_results)}
+        if event["type"] == "done" and is_cacheable(event["content"]):
+            RESPONSE_CACHE.set(key, event["content"])
+            if beginner_mode:
+                RESPONSE_CACHE.set(research_key, event["research"])
+        yield event
+
+
+def split_response(response: str) -> tuple[str, str]:
+    """Split a response into its analysis and its beginner takeaway.
+    
+    Returns:
+        The text before the beginner takeaway and the takeaway itself. The
+        takeaway is empty if the response has none.
+    """
+    # Use regex to find beginner takeaway section - handles various formatting
+    # Looks for the 🎯 emoji followed by BEGINNER (case insensitive)
+    pattern = r'(?:^|\n)\s*(?:\d+\.\s*)?(?:\*+\s*)?(?:#+\s*)?🎯\s*\**\s*BEGINNER'
+    match = re.search(pattern, response, re.IGNORECASE)
+    if not match:
+        return response, ""
+    
+    beginner_start = match.start()
+    # Skip any leading newline
+    if response[beginner_start] == '\n':
+        beginner_start += 1
+    return response[:beginner_start].rstrip(), response[beginner_start:]
 
 
 def filter_response_for_mode(response: str, beginner_mode: bool) -> str:
@@ -132,29 +300,111 @@ def filter_response_for_mode(response: str, beginner_mode: bool) -> str:
         Filtered response - only beginner takeaway if beginner mode, 
         or full response without beginner section if not.
     """
-    # Use regex to find beginner takeaway section - handles various formatting
-    # Looks for the 🎯 emoji followed by BEGINNER (case insensitive)
-    pattern = r'(?:^|\n)\s*(?:\d+\.\s*)?(?:\*+\s*)?(?:#+\s*)?🎯\s*\**\s*BEGINNER'
-    match = re.search(pattern, response, re.IGNORECASE)
+    analysis, takeaway = split_response(response)
+    if not takeaway:
+        # Fallback if marker not found
+        return response
+    return takeaway if beginner_mode else analysis
+
+
+def generate_takeaway(analysis: str, llm_provider: Optional[str] = None,
+                      selected_model: Optional[str] = None) -> str | None:
+    """Write the beginner takeaway for an analysis with a single LLM call (no tools).
     
-    if match:
-        beginner_start = match.start()
-        # Skip any leading newline
-        if response[beginner_start] == '\n':
-            beginner_start += 1
-    else:
-        beginner_start = -1
-    
-    if beginner_mode:
-        # Only show beginner takeaway
-        if beginner_start != -1:
-            return response[beginner_start:]
-        else:
-            # Fallback if marker not found
-            return response
+    Args:
+        analysis: A response generated in full mode.
+        llm_provider: LLM provider. If None, reads from streamlit session.
+        selected_model: Model to use. If None, reads from streamlit session.
+        
+    Returns:
+        The takeaway section, or None if the text is not a stock analysis.
+    """
+    llm_provider, selected_model = _resolve_llm_settings(llm_provider, selected_model)
+    key = response_key("takeaway", analysis, llm_provider, selected_model)
+    cached = RESPONSE_CACHE.get(key)
+    if cached is not None:
+        return cached or None
+    
+    llm = get_llm(llm_provider, selected_model)
+    if llm is None:
+        raise RuntimeError(f"No LLM available for {llm_provider}")
+    response = llm.invoke(TAKEAWAY_PROMPT.format(section=BEGINNER_SECTION.strip(), analysis=analysis))
+    content = response.content
+    if isinstance(content, list):
+        content = str(content[0]) if content else ""
+    content = content.strip()
+    if not is_cacheable(content):
+        raise RuntimeError(content or "No response generated")
+    
+    takeaway = "" if content.upper().strip(" .\"'") == "NONE" else content
+    RESPONSE_CACHE.set(key, takeaway)
+    return takeaway or None
+
+
+def generate_analysis(research: str, llm_provider: Optional[str] = None,
+                      selected_model: Optional[str] = None) -> str:
+    """Write the analysis sections from saved research with a single LLM call (no tools).
+    
+    Args:
+        research: The research a beginner-mode run gathered (see ``stream_agent``).
+        llm_provider: LLM provider. If None, reads from streamlit session.
+        selected_model: Model to use. If None, reads from streamlit session.
+        
+    Returns:
+        Sections 1-5 of the analysis.
+    """
+    llm_provider, selected_model = _resolve_llm_settings(llm_provider, selected_model)
+    key = response_key("analysis_from_research", research, llm_provider, selected_model)
+    cached = RESPONSE_CACHE.get(key)
+    if cached is not None:
+        return cached
+    
+    llm = get_llm(llm_provider, selected_model)
+    if llm is None:
+        raise RuntimeError(f"No LLM available for {llm_provider}")
+    sections = SYSTEM_PROMPT[SYSTEM_PROMPT.index("When analyzing a stock"):]
+    response = llm.invoke(ANALYSIS_PROMPT.format(sections=sections, research=research))
+    content = response.content
+    if isinstance(content, list):
+        content = str(content[0]) if content else ""
+    content = content.strip()
+    if not is_cacheable(content):
+        raise RuntimeError(content or "No response generated")
+    
+    RESPONSE_CACHE.set(key, content)
+    return content
+
+
+def complete_response(response: str, generated_mode: str, query: str, symbol: Optional[str] = None,
+                      llm_provider: Optional[str] = None, selected_model: Optional[str] = None,
+                      research: Optional[str] = None) -> str:
+    """Add the section missing from a response generated for one mode.
+    
+    Either section is written with one LLM call and no tools: a takeaway
+    from the existing analysis, an analysis from the research the takeaway
+    was based on. Responses saved without their research fall back to
+    running the agent again in full mode.
+    
+    Args:
+        response: The response generated for ``generated_mode``.
+        generated_mode: "beginner" or "full" (see ``response_mode``).
+        query: The query the response answered.
+        symbol: Stock being discussed.
+        llm_provider: LLM provider. If None, reads from streamlit session.
+        selected_model: Model to use. If None, reads from streamlit session.
+        research: Research saved with a beginner-mode response.
+        
+    Returns:
+        The response with both sections, ready for ``filter_response_for_mode``.
+    """
+    if generated_mode == "full":
+        takeaway = generate_takeaway(response, llm_provider, selected_model)
+        return response if takeaway is None else response.rstrip() + "\n\n" + takeaway
+    
+    if research:
+        analysis = generate_analysis(research, llm_provider, selected_model)
     else:
-        # Show full response without beginner takeaway
-        if beginner_start != -1:
-            return response[:beginner_start].rstrip()
-        else:
-            return response
+        analysis = run_agent(query, llm_provider, selected_model, symbol=symbol, beginner_mode=False)
+        if not is_cacheable(analysis):
+            raise RuntimeError(analysis)
+    return analysis.rstrip() + "\n\n" + filter_response_for_mode(response, True)
@@ -0,0 +1,133 @@
+"""Deterministic pre-fetch of the market data every stock analysis needs.
+
+The analysis prompt always starts with today's date, the latest quote,
+recent price action and news. All of that follows from the symbol, so it
+is fetched in parallel before the LLM runs instead of through sequential
+tool-calling turns.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable
+
+# Seconds to wait for all pre-fetches before going ahead without the slow ones
+PREFETCH_TIMEOUT = float(os.getenv("PREFETCH_TIMEOUT", "15"))
+PREFETCH_BARS = 30
+PREFETCH_NEWS_RESULTS = 5
+
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="prefetch")
+
+
+def _fetch_date() -> str:
+    from date_utils import get_current_date
+    return get_current_date.invoke({})
+
+
+def _fetch_quote(symbol: str) -> dict:
+    from stock import get_stock_info
+    return get_stock_info.invoke({"symbol": symbol})
+
+
+def _fetch_bars(symbol: str):
+    from stock import get_stock_history_frame
+    return get_stock_history_frame(symbol, limit=PREFETCH_BARS)
+
+
+def _fetch_news(symbol: str) -> dict:
+    from search import search_web
+    return search_web(f"{symbol} stock news")
+
+
+def prefetch_market_data(symbol: str, timeout: float | None = None) -> dict[str, Any]:
+    """Fetch the date, quote, recent bars and news for a symbol in parallel.
+    
+    Args:
+        symbol: The stock symbol.
+        timeout: Seconds to wait for all fetches together (defaults to ``PREFETCH_TIMEOUT``).
+        
+    Returns:
+        Dict with ``date``, ``quote``, ``bars`` and ``news`` keys. A fetch that
+        failed or timed out is None; the agent can still use its tools for it.
+    """
+    if timeout is None:
+        timeout = PREFETCH_TIMEOUT
+    fetches: dict[str, tuple[Callable, tuple]] = {
+        "date": (_fetch_date, ()),
+        "quote": (_fetch_quote, (symbol,)),
+        "bars": (_fetch_bars, (symbol,)),
+        "news": (_fetch_news, (symbol,)),
+    }
+    futures = {name: _executor.submit(fn, *args) for name, (fn, args) in fetches.items()}
+    # One deadline for all fetches; whatever is still running is left to the agent's tools
+    wait(futures.values(), timeout=timeout)
+    
+    results = {}
+    for name, future in futures.items():
+        if not future.done():
+            print(f"Prefetch of {name} for {symbol} timed out")
+            results[name] = None
+            continue
+        try:
+            results[name] = future.result()
+        except Exception as e:
+            print(f"Prefetch of {name} for {symbol} failed: {e}")
+            results[name] = None
+    return results
+
+
+def _format_quote(quote: dict | None) -> str | None:
+    if not quote or not quote.get("data"):
+        return None
+    fields = quote["data"][0]
+    return "\n".join(f"- {key}: {value}" for key, value in fields.items() if value is not None)
+
+
+def _format_bars(bars) -> str | None:
+    if bars is None or bars.empty:
+        return None
+    closes = bars["close"]
+    change = (closes.iloc[-1] / closes.iloc[0] - 1) * 100
+    lines = [
+        f"{len(bars)} daily bars from {bars.index[0]:%Y-%m-%d} to {bars.index[-1]:%Y-%m-%d}: "
+        f"change {change:+.2f}%, high {bars['high'].max():.2f}, low {bars['low'].min():.2f}, "
+        f"average volume {bars['volume'].mean():,.0f}",
+        "date | open | high | low | close | volume",
+    ]
+    for date, row in bars.iterrows():
+        lines.append(
+            f"{date:%Y-%m-%d} | {row['open']:.2f} | {row['high']:.2f} | {row['low']:.2f} | "
+            f"{row['close']:.2f} | {int(row['volume'])}"
+        )
+    return "\n".join(lines)
+
+
+def _format_news(news: dict | None) -> str | None:
+    if not news or not news.get("results"):
+        return None
+    lines = []
+    for item in news["results"][:PREFETCH_NEWS_RESULTS]:
+        published = f" ({item['published_date']})" if item.get("published_date") else ""
+        snippet = " ".join((item.get("content") or "").split())[:300]
+        lines.append(f"- {item.get('title', 'Untitled')}{published} - {item.get('url', '')}\n  {snippet}")
+    return "\n".join(lines)
+
+
+def format_market_context(symbol: str, data: dict[str, Any]) -> str:
+    """Format pre-fetched data as a context block for the agent's query.
+    
+    Sections that could not be fetched are listed as unavailable so the
+    agent knows to use its tools for them.
+    """
+    sections = [
+        ("TODAY'S DATE", data.get("date")),
+        (f"LATEST QUOTE FOR {symbol} (get_stock_info)", _format_quote(data.get("quote"))),
+        (f"RECENT DAILY BARS FOR {symbol}", _format_bars(data.get("bars"))),
+        (f"RECENT NEWS FOR {symbol} (search_web)", _format_news(data.get("news"))),
+    ]
+    blocks = [f"### {title}\n{body or 'Unavailable - use your tools if you need this.'}" for title, body in sections]
+    return "PREFETCHED MARKET DATA\n\n" + "\n\n".join(blocks) + "\n\nEND OF PREFETCHED MARKET DATA"
+
+
+def build_market_context(symbol: str) -> str:
+    """Pre-fetch and format the market data context for a symbol."""
+    return format_market_context(symbol, prefetch_market_data(symbol))
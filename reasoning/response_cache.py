@@ -0,0 +1,70 @@
+"""Persistent cache of agent responses.
+
+Agent runs are the slowest and most expensive operation in the app. A
+response is reused when the same (normalized) query is asked of the same
+provider and model while the market data it was based on is unchanged.
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Optional
+
+from cache import PersistentCache
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+RESPONSE_CACHE_FILE = Path(os.getenv("RESPONSE_CACHE_PATH", DATA_DIR / "responses.db"))
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "500"))
+RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", "3600"))
+
+RESPONSE_CACHE = PersistentCache(RESPONSE_CACHE_FILE, maxsize=RESPONSE_CACHE_SIZE, ttl=RESPONSE_CACHE_TTL)
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query so trivially different phrasings share an entry.
+
+    Case, repeated whitespace and trailing punctuation are ignored.
+    """
+    return re.sub(r"\s+", " ", query).strip().rstrip("?!.").strip().lower()
+
+
+def market_stamp(symbols: Iterable[str]) -> list:
+    """Get the newest bar (date and close) for each symbol.
+
+    Bars are refreshed first if stale, so a new bar or an intraday price
+    change yields a new stamp. Symbols without data stamp as None.
+    """
+    from stock import get_stock_history_frames
+
+    stamp = []
+    for symbol, frame in get_stock_history_frames(list(symbols), limit=1).items():
+        if frame.empty:
+            stamp.append([symbol, None, None])
+        else:
+            stamp.append([symbol, frame.index[-1].isoformat(), float(frame["close"].iloc[-1])])
+    return stamp
+
+
+def response_key(kind: str, query: str, provider: str, model: str,
+                 symbols: Optional[Iterable[str]] = None) -> dict:
+    """Build the cache key for an agent response.
+    
+    Args:
+        kind: Which prompt produced the response (e.g. "analysis", "competitors").
+        query: The query sent to the agent.
+        provider: The LLM provider name.
+        model: The model name.
+        symbols: Symbols whose market data the response depends on.
+    """
+    return {
+        "kind": kind,
+        "query": normalize_query(query),
+        "provider": provider,
+        "model": model,
+        "market": market_stamp(symbols) if symbols else None,
+    }
+
+
+def is_cacheable(response: str) -> bool:
+    """Check whether a response is a real answer rather than a provider error."""
+    return bool(response) and not response.startswith("Error:") and response != "No response generated"
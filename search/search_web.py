@@ -2,11 +2,15 @@ import os
 from dotenv import load_dotenv
 from tavily import TavilyClient
 
+from cache import cached_tool
+
 # Load environment variables from .env file
 load_dotenv()
 
 tavily = TavilyClient()
 
+# Tavily bills every search; identical queries within the TTL reuse the results
+@cached_tool("search_web", ttl=float(os.getenv("SEARCH_TOOL_TTL", "900")), normalize={"query": str.lower})
 def search_web(query: str) -> dict:
     """Tool that searches the internet.
     Args:
@@ -1,6 +1,21 @@
-from .get_stock_info import get_stock_info, get_stock_history
+from .get_stock_info import (
+    get_stock_info,
+    get_stock_history,
+    get_stock_histories,
+    get_stock_history_frame,
+    get_stock_history_frames,
+    get_fundamentals,
+    FUNDAMENTALS_CACHE,
+    QUOTE_CACHE,
+    MARKET_DATA_FLIGHTS,
+)
+from .history_format import frame_to_payload, payload_to_frame
+from .indicator_state import get_indicator_state
+from .indicator_cache import get_indicator_frame, INDICATOR_CACHE
+from .scanner import scan_signals, load_universe, parse_universe
 from .extract_symbol import extract_stock_symbol
+from .symbol_index import SymbolIndex, get_symbol_index, resolve_symbol
 from .get_logo import get_stock_logo_url
 from .competitors import get_competitors, get_all_for_comparison
 
-__all__ = ["get_stock_info", "get_stock_history", "extract_stock_symbol", "get_stock_logo_url", "get_competitors", "get_all_for_comparison"]
\ No newline at end of file
+__all__ = ["get_stock_info", "get_stock_history", "get_stock_histories", "get_stock_history_frame", "get_stock_history_frames", "get_fundamentals", "FUNDAMENTALS_CACHE", "QUOTE_CACHE", "MARKET_DATA_FLIGHTS", "get_indicator_state", "get_indicator_frame", "INDICATOR_CACHE", "scan_signals", "load_universe", "parse_universe", "frame_to_payload", "payload_to_frame", "extract_stock_symbol", "SymbolIndex", "get_symbol_index", "resolve_symbol", "get_stock_logo_url", "get_competitors", "get_all_for_comparison"]
\ No newline at end of file
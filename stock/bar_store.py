@@ -0,0 +1,238 @@
+"""Local on-disk store for daily OHLCV bars.
+
+Every bar downloaded from Yahoo Finance is kept in a SQLite database under
+``data/`` so later requests only need to fetch bars newer than the last one
+already stored.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+BARS_DB_FILE = Path(os.getenv("BAR_STORE_PATH", DATA_DIR / "bars.db"))
+
+# Minimum number of seconds between two upstream refreshes of the same symbol
+REFRESH_INTERVAL_SECONDS = int(os.getenv("BAR_STORE_REFRESH_SECONDS", "300"))
+
+BAR_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bars (
+    symbol TEXT NOT NULL,
+    date TEXT NOT NULL,
+    open REAL,
+    high REAL,
+    low REAL,
+    close REAL,
+    volume INTEGER,
+    PRIMARY KEY (symbol, date)
+);
+CREATE TABLE IF NOT EXISTS symbols (
+    symbol TEXT PRIMARY KEY,
+    refreshed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS indicator_state (
+    symbol TEXT PRIMARY KEY,
+    last_date TEXT,
+    state TEXT NOT NULL
+);
+"""
+
+_write_lock = threading.RLock()
+_initialized = False
+
+
+def _connect() -> sqlite3.Connection:
+    """Open a connection to the bar store, creating the schema on first use."""
+    global _initialized
+    BARS_DB_FILE.parent.mkdir(exist_ok=True)
+    conn = sqlite3.connect(BARS_DB_FILE, timeout=30)
+    if not _initialized:
+        with _write_lock:
+            conn.executescript(_SCHEMA)
+            _initialized = True
+    return conn
+
+
+def format_bar_date(index: pd.DatetimeIndex) -> pd.Index:
+    """Format a bar index the way dates are stored and shown in the app."""
+    return index.strftime("%Y-%m-%dT%H:%M:%S+0000")
+
+
+def get_last_bar_date(symbol: str) -> str | None:
+    """Get the date of the newest stored bar for a symbol."""
+    conn = _connect()
+    try:
+        row = conn.execute(
+            "SELECT MAX(date) FROM bars WHERE symbol = ?", (symbol,)
+        ).fetchone()
+    finally:
+        conn.close()
+    return row[0] if row else None
+
+
+def get_last_bar(symbol: str) -> tuple[str, float] | None:
+    """Get the date and close of the newest stored bar for a symbol."""
+    conn = _connect()
+    try:
+        row = conn.execute(
+            "SELECT date, close FROM bars WHERE symbol = ? ORDER BY date DESC LIMIT 1", (symbol,)
+        ).fetchone()
+    finally:
+        conn.close()
+    return (row[0], row[1]) if row else None
+
+
+def count_bars(symbol: str) -> int:
+    """Count how many bars are stored for a symbol."""
+    conn = _connect()
+    try:
+        row = conn.execute(
+            "SELECT COUNT(*) FROM bars WHERE symbol = ?", (symbol,)
+        ).fetchone()
+    finally:
+        conn.close()
+    return row[0]
+
+
+def is_fresh(symbol: str, max_age: float | None = None) -> bool:
+    """Check whether a symbol was refreshed from upstream within ``max_age`` seconds.
+
+    Defaults to ``REFRESH_INTERVAL_SECONDS``.
+    """
+    if max_age is None:
+        max_age = REFRESH_INTERVAL_SECONDS
+    conn = _connect()
+    try:
+        row = conn.execute(
+            "SELECT refreshed_at FROM symbols WHERE symbol = ?", (symbol,)
+        ).fetchone()
+    finally:
+        conn.close()
+    return bool(row) and time.time() - row[0] < max_age
+
+
+def save_bars(symbol: str, hist: pd.DataFrame):
+    """Insert or update bars for a symbol.
+
+    The symbol is only marked as refreshed when bars were returned, so an
+    empty or failed download is retried on the next request.
+
+    Args:
+        symbol: The stock symbol.
+        hist: Bars indexed by date with Open/High/Low/Close/Volume columns
+            (as returned by yfinance).
+    """
+    if hist.empty:
+        return
+    dates = format_bar_date(hist.index)
+    rows = list(zip(
+        [symbol] * len(hist),
+        dates,
+        hist["Open"].round(4).astype(float),
+        hist["High"].round(4).astype(float),
+        hist["Low"].round(4).astype(float),
+        hist["Close"].round(4).astype(float),
+        hist["Volume"].fillna(0).astype("int64").tolist(),
+    ))
+
+    with _write_lock:
+        conn = _connect()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO bars (symbol, date, open, high, low, close, volume) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO symbols (symbol, refreshed_at) VALUES (?, ?)",
+                    (symbol, time.time()),
+                )
+        finally:
+            conn.close()
+
+
+def load_bars(symbol: str, limit: int | None = None) -> pd.DataFrame:
+    """Load stored bars for a symbol in ascending date order.
+
+    Args:
+        symbol: The stock symbol.
+        limit: Only return the most recent ``limit`` bars.
+
+    Returns:
+        DataFrame with a ``date`` string column followed by the OHLCV columns.
+    """
+    query = "SELECT date, open, high, low, close, volume FROM bars WHERE symbol = ? ORDER BY date DESC"
+    params: tuple = (symbol,)
+    if limit is not None:
+        query += " LIMIT ?"
+        params = (symbol, limit)
+
+    conn = _connect()
+    try:
+        df = pd.read_sql_query(query, conn, params=params)
+    finally:
+        conn.close()
+    return df.iloc[::-1].reset_index(drop=True)
+
+
+def load_bars_since(symbol: str, date: str) -> pd.DataFrame:
+    """Load stored bars on or after ``date`` in ascending date order."""
+    conn = _connect()
+    try:
+        return pd.read_sql_query(
+            "SELECT date, open, high, low, close, volume FROM bars "
+            "WHERE symbol = ? AND date >= ? ORDER BY date",
+            conn,
+            params=(symbol, date),
+        )
+    finally:
+        conn.close()
+
+
+def save_indicator_state(symbol: str, state: dict):
+    """Persist a serialized indicator state next to the symbol's bars."""
+    with _write_lock:
+        conn = _connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO indicator_state (symbol, last_date, state) VALUES (?, ?, ?)",
+                    (symbol, state.get("last_date"), json.dumps(state)),
+                )
+        finally:
+            conn.close()
+
+
+def load_indicator_state(symbol: str) -> dict | None:
+    """Load a serialized indicator state, or None if none was saved."""
+    conn = _connect()
+    try:
+        row = conn.execute(
+            "SELECT state FROM indicator_state WHERE symbol = ?", (symbol,)
+        ).fetchone()
+    finally:
+        conn.close()
+    return json.loads(row[0]) if row else None
+
+
+def clear_bars(symbol: str | None = None):
+    """Remove stored bars for one symbol, or for every symbol if None."""
+    with _write_lock:
+        conn = _connect()
+        try:
+            with conn:
+                for table in ("bars", "symbols", "indicator_state"):
+                    if symbol is None:
+                        conn.execute(f"DELETE FROM {table}")
+                    else:
+                        conn.execute(f"DELETE FROM {table} WHERE symbol = ?", (symbol,))
+        finally:
+            conn.close()
@@ -1,11 +1,21 @@
 from typing import Optional
 from dotenv import load_dotenv
 
+from .symbol_index import resolve_symbol
+
 load_dotenv()
 
 
 def extract_stock_symbol(text: str, llm_provider: Optional[str] = None, selected_model: Optional[str] = None) -> str | None:
-    """Use AI to extract stock symbol from user text."""
+    """Extract the stock symbol from user text.
+    
+    Tickers and company names in the bundled listings are resolved offline;
+    AI is only used when none or several of them are mentioned.
+    """
+    symbol = resolve_symbol(text)
+    if symbol:
+        return symbol
+    
     from providers import get_llm
     
     # Get the appropriate LLM based on provider
@@ -1,9 +1,170 @@
-import yfinance as yf
+import os
+
+import pandas as pd
 from langchain.tools import tool
 
+from cache import SingleFlight, TTLCache, cached_tool
+from market_data import RateLimitError, get_market_data_provider
+from . import bar_store
+from .history_format import bars_to_frame, empty_history_frame, frame_to_payload
+
+# Fundamentals barely change intraday; latest-quote bars need a much shorter TTL
+FUNDAMENTALS_CACHE = TTLCache(
+    maxsize=int(os.getenv("FUNDAMENTALS_CACHE_SIZE", "512")),
+    ttl=float(os.getenv("FUNDAMENTALS_CACHE_TTL", "21600")),
+)
+QUOTE_CACHE = TTLCache(
+    maxsize=int(os.getenv("QUOTE_CACHE_SIZE", "512")),
+    ttl=float(os.getenv("QUOTE_CACHE_TTL", "60")),
+)
+
+# Concurrent fetches for the same symbol share one upstream request
+MARKET_DATA_FLIGHTS = SingleFlight()
+
+# Largest history depth fully downloaded per symbol in this process. A symbol
+# may have fewer bars than requested (e.g. recently listed), so the stored
+# bar count alone cannot tell whether a full download is still needed.
+_full_history_depth: dict[str, int] = {}
+
+
+def _error_payload(error: Exception) -> dict:
+    """Build an error payload, flagging upstream throttling separately from bad symbols."""
+    payload = {"error": str(error)}
+    if isinstance(error, RateLimitError):
+        payload["rate_limited"] = True
+    return payload
+
+
+def _needs_refresh(symbol: str, limit: int) -> bool:
+    """Check whether the bar store must be refreshed from upstream for a symbol."""
+    return not (bar_store.is_fresh(symbol) and _has_depth(symbol, limit))
+
+
+def _has_depth(symbol: str, limit: int) -> bool:
+    """Check whether the bar store already holds ``limit`` bars of history (or all there is)."""
+    return _full_history_depth.get(symbol, 0) >= limit or bar_store.count_bars(symbol) >= limit
+
+
+def _lookback_period(limit: int) -> str:
+    """Calendar-day period that covers ``limit`` trading days (weekends plus a holiday buffer)."""
+    return f"{limit * 7 // 5 + 15}d"
+
+
+def _download_bars(symbols: list[str], period: str | None = None, start: str | None = None) -> list[str]:
+    """Download bars for several symbols in one request and store them.
+
+    Returns:
+        The symbols the download returned bars for.
+    """
+    histories = get_market_data_provider().get_history(symbols, period=period, start=start)
+    downloaded = []
+    for symbol in symbols:
+        hist = histories.get(symbol, pd.DataFrame())
+        if not hist.empty:
+            bar_store.save_bars(symbol, hist)
+            downloaded.append(symbol)
+    return downloaded
+
+
+def _refresh_histories(symbols: list[str], limit: int):
+    """Refresh the bar store, coalescing concurrent refreshes per symbol.
+
+    Symbols already being refreshed by another caller are waited on rather
+    than downloaded again; only the rest go into this caller's batch. A
+    joined refresh that covered fewer than ``limit`` bars is retried.
+    """
+    pending = list(dict.fromkeys(symbols))
+    while pending:
+        keys = [("history", symbol) for symbol in pending]
+        depths = MARKET_DATA_FLIGHTS.do_many(keys, _refresh_history_flight, limit)
+        pending = [symbol for (_, symbol), depth in depths.items() if depth < limit]
+
+
+def _refresh_history_flight(keys: list[tuple], limit: int) -> dict:
+    """Refresh the symbols behind the claimed flight keys, reporting the depth covered."""
+    _refresh_histories_uncoalesced([symbol for _, symbol in keys], limit)
+    return {key: limit for key in keys}
+
+
+def _refresh_histories_uncoalesced(symbols: list[str], limit: int):
+    """Bring the local bar store up to date for several symbols.
+
+    Only bars newer than the last stored one are downloaded. The last stored
+    bar is fetched again since it may have been a partial (intraday) bar.
+    Symbols are grouped so that the whole refresh costs at most two bulk
+    requests: one for symbols without enough stored history and one for
+    incremental updates.
+    """
+    full, delta = [], {}
+    for symbol in symbols:
+        if not _needs_refresh(symbol, limit):
+            continue
+        last_date = bar_store.get_last_bar_date(symbol)
+        if last_date and _has_depth(symbol, limit):
+            delta[symbol] = last_date[:10]
+        else:
+            full.append(symbol)
+
+    if full:
+        for symbol in _download_bars(full, period=_lookback_period(limit)):
+            _full_history_depth[symbol] = max(_full_history_depth.get(symbol, 0), limit)
+    if delta:
+        _download_bars(list(delta), start=min(delta.values()))
+
+
+def _load_history_frame(symbol: str, limit: int) -> pd.DataFrame:
+    """Load the most recent ``limit`` bars for a symbol from the local bar store."""
+    return bars_to_frame(bar_store.load_bars(symbol, limit))
+
+
+def get_stock_history_frame(symbol: str, limit: int = 30) -> pd.DataFrame:
+    """Fetches historical EOD data as a columnar frame.
+
+    Args:
+        symbol (str): The stock symbol to fetch information for.
+        limit (int): Number of days of history to fetch.
+    Returns:
+        pd.DataFrame: OHLCV columns indexed by date in ascending order. Empty
+        if no data could be fetched.
+    """
+    try:
+        _refresh_histories([symbol], limit)
+        return _load_history_frame(symbol, limit)
+    except Exception as e:
+        print(f"Error fetching history for {symbol}: {e}")
+        return empty_history_frame()
+
+
+def get_stock_history_frames(symbols: list[str], limit: int = 30) -> dict[str, pd.DataFrame]:
+    """Fetches historical EOD data for several symbols as columnar frames.
+
+    Args:
+        symbols (list[str]): The stock symbols to fetch information for.
+        limit (int): Number of days of history to fetch.
+    Returns:
+        dict: Mapping of symbol to its history frame (empty on failure).
+    """
+    symbols = list(dict.fromkeys(symbols))
+    try:
+        _refresh_histories(symbols, limit)
+    except Exception as e:
+        print(f"Error fetching histories for {symbols}: {e}")
+
+    frames = {}
+    for symbol in symbols:
+        try:
+            frames[symbol] = _load_history_frame(symbol, limit)
+        except Exception as e:
+            print(f"Error loading history for {symbol}: {e}")
+            frames[symbol] = empty_history_frame()
+    return frames
+
 
 def get_stock_history(symbol: str, limit: int = 30) -> dict:
     """Fetches historical EOD data for charting using Yahoo Finance.
+
+    Bars are served from the local bar store; only newer bars are downloaded.
+
     Args:
         symbol (str): The stock symbol to fetch information for.
         limit (int): Number of days of history to fetch.
@@ -11,37 +172,80 @@ def get_stock_history(symbol: str, limit: int = 30) -> dict:
         dict: The stock historical data.
     """
     try:
-        ticker = yf.Ticker(symbol)
-        # Get historical data (limit days + buffer for weekends/holidays)
-        hist = ticker.history(period=f"{limit + 15}d")
-        
-        if hist.empty:
-            return {"error": f"No data found for {symbol}"}
-        
-        # Take only the requested number of trading days
-        hist = hist.tail(limit)
-        
-        # Convert to the format expected by the app
-        data = []
-        for idx, row in hist.iterrows():
-            data.append({
-                "date": idx.strftime("%Y-%m-%dT%H:%M:%S+0000"),  # type: ignore
-                "symbol": symbol,
-                "open": float(round(row["Open"], 4)),
-                "high": float(round(row["High"], 4)),
-                "low": float(round(row["Low"], 4)),
-                "close": float(round(row["Close"], 4)),
-                "volume": int(row["Volume"])
-            })
-        
-        # Return in descending order (newest first)
-        data.reverse()
-        return {"data": data}
+        _refresh_histories([symbol], limit)
+        return frame_to_payload(_load_history_frame(symbol, limit), symbol)
     except Exception as e:
-        return {"error": str(e)}
+        return _error_payload(e)
+
+
+def get_stock_histories(symbols: list[str], limit: int = 30) -> dict[str, dict]:
+    """Fetches historical EOD data for several symbols with one bulk request.
+
+    Args:
+        symbols (list[str]): The stock symbols to fetch information for.
+        limit (int): Number of days of history to fetch.
+    Returns:
+        dict: Mapping of symbol to its history payload (same shape as
+        ``get_stock_history``).
+    """
+    symbols = list(dict.fromkeys(symbols))
+    try:
+        _refresh_histories(symbols, limit)
+    except Exception as e:
+        return {symbol: _error_payload(e) for symbol in symbols}
+
+    results = {}
+    for symbol in symbols:
+        try:
+            results[symbol] = frame_to_payload(_load_history_frame(symbol, limit), symbol)
+        except Exception as e:
+            results[symbol] = _error_payload(e)
+    return results
+
+
+def get_fundamentals(symbol: str) -> dict:
+    """Get slow-changing company fundamentals, cached for ``FUNDAMENTALS_CACHE_TTL`` seconds.
+
+    ``Ticker.info`` is the slowest yfinance endpoint, so only the fields the
+    app uses are kept, separately from the much shorter-lived price bars.
+    """
+    fundamentals = FUNDAMENTALS_CACHE.get(symbol)
+    if fundamentals is None:
+        fundamentals = MARKET_DATA_FLIGHTS.do(("fundamentals", symbol), _fetch_fundamentals, symbol)
+    return fundamentals
+
+
+def _fetch_fundamentals(symbol: str) -> dict:
+    """Fetch fundamentals from the market data provider and store them in the cache."""
+    info = get_market_data_provider().get_fundamentals(symbol)
+    fundamentals = {
+        "name": info.get("shortName", symbol),
+        "market_cap": info.get("marketCap"),
+        "pe_ratio": info.get("trailingPE"),
+        "fifty_two_week_high": info.get("fiftyTwoWeekHigh"),
+        "fifty_two_week_low": info.get("fiftyTwoWeekLow")
+    }
+    FUNDAMENTALS_CACHE.set(symbol, fundamentals)
+    return fundamentals
+
+
+def _get_quote_history(symbol: str) -> pd.DataFrame:
+    """Get the last few daily bars used for the latest quote, cached for ``QUOTE_CACHE_TTL`` seconds."""
+    hist = QUOTE_CACHE.get(symbol)
+    if hist is None:
+        hist = MARKET_DATA_FLIGHTS.do(("quote", symbol), _fetch_quote_history, symbol)
+    return hist
+
+
+def _fetch_quote_history(symbol: str) -> pd.DataFrame:
+    """Fetch the last few daily bars from the market data provider and store them in the cache."""
+    hist = get_market_data_provider().get_quote(symbol)
+    QUOTE_CACHE.set(symbol, hist)
+    return hist
 
 
 @tool
+@cached_tool("get_stock_info", ttl=float(os.getenv("STOCK_INFO_TOOL_TTL", "60")), normalize={"symbol": str.upper})
 def get_stock_info(symbol: str) -> dict:
     """Fetches the latest stock information using Yahoo Finance.
     Args:
@@ -50,8 +254,7 @@ def get_stock_info(symbol: str) -> dict:
         dict: The stock information including price, change, and basic stats.
     """
     try:
-        ticker = yf.Ticker(symbol)
-        hist = ticker.history(period="5d")
+        hist = _get_quote_history(symbol)
         
         if hist.empty:
             return {"error": f"No data found for {symbol}"}
@@ -60,7 +263,7 @@ def get_stock_info(symbol: str) -> dict:
         latest = hist.iloc[-1]
         prev_close = hist.iloc[-2]["Close"] if len(hist) > 1 else latest["Close"]
         
-        info = ticker.info
+        fundamentals = get_fundamentals(symbol)
         
         print(f"Getting stock info for: '{symbol}'")
         
@@ -76,12 +279,8 @@ def get_stock_info(symbol: str) -> dict:
                 "prev_close": round(prev_close, 4),
                 "change": round(latest["Close"] - prev_close, 4),
                 "change_percent": round((latest["Close"] - prev_close) / prev_close * 100, 2),
-                "name": info.get("shortName", symbol),
-                "market_cap": info.get("marketCap"),
-                "pe_ratio": info.get("trailingPE"),
-                "fifty_two_week_high": info.get("fiftyTwoWeekHigh"),
-                "fifty_two_week_low": info.get("fiftyTwoWeekLow")
+                **fundamentals
             }]
         }
     except Exception as e:
-        return {"error": str(e)}
+        return _error_payload(e)
@@ -0,0 +1,53 @@
+"""Conversions between columnar history frames and the list-of-dicts payload."""
+
+import pandas as pd
+
+from .bar_store import BAR_COLUMNS, format_bar_date
+
+PAYLOAD_COLUMNS = ["date", "symbol"] + BAR_COLUMNS
+
+
+def empty_history_frame() -> pd.DataFrame:
+    """Create an empty history frame with the expected columns and index."""
+    frame = pd.DataFrame(columns=BAR_COLUMNS, dtype=float)
+    frame.index = pd.DatetimeIndex([], tz="UTC", name="date")
+    return frame
+
+
+def bars_to_frame(bars: pd.DataFrame) -> pd.DataFrame:
+    """Convert bars loaded from the bar store into a date-indexed frame.
+
+    Args:
+        bars: Bars with a ``date`` string column and OHLCV columns.
+
+    Returns:
+        DataFrame indexed by a UTC ``DatetimeIndex`` in ascending order.
+    """
+    if bars.empty:
+        return empty_history_frame()
+    frame = bars[BAR_COLUMNS].copy()
+    frame.index = pd.DatetimeIndex(pd.to_datetime(bars["date"], utc=True), name="date")
+    return frame
+
+
+def frame_to_payload(frame: pd.DataFrame, symbol: str) -> dict:
+    """Convert a history frame into the ``{"data": [...]}`` payload.
+
+    Rows are returned newest first, matching ``get_stock_history``.
+    """
+    if frame.empty:
+        return {"error": f"No data found for {symbol}"}
+    records = frame.iloc[::-1].assign(
+        date=format_bar_date(frame.index[::-1]),
+        symbol=symbol,
+        volume=frame["volume"].iloc[::-1].astype("int64"),
+    )[PAYLOAD_COLUMNS]
+    return {"data": records.to_dict("records")}
+
+
+def payload_to_frame(stock_data: dict | None) -> pd.DataFrame:
+    """Convert a ``{"data": [...]}`` payload back into a history frame."""
+    if not stock_data or not stock_data.get("data"):
+        return empty_history_frame()
+    bars = pd.DataFrame(stock_data["data"])
+    return bars_to_frame(bars).sort_index()
@@ -0,0 +1,61 @@
+"""Cache of computed indicator frames, keyed by the symbol's last stored bar."""
+
+import os
+
+import pandas as pd
+
+from cache import TTLCache
+from indicators import DEFAULT_PARAMS, INDICATOR_NAMES, compute_indicators
+
+from . import bar_store
+from .get_stock_info import get_stock_history_frame
+
+# Entries are only reused while the last bar (date and close) matches, so
+# the TTL is a safety net rather than the freshness rule
+INDICATOR_CACHE = TTLCache(
+    maxsize=int(os.getenv("INDICATOR_CACHE_SIZE", "128")),
+    ttl=float(os.getenv("INDICATOR_CACHE_TTL", "3600")),
+    max_bytes=int(os.getenv("INDICATOR_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+)
+
+
+def _cache_key(symbol: str, limit: int, names: tuple[str, ...], params: dict, last_bar: tuple) -> tuple:
+    return (symbol, limit, names, tuple(sorted(params.items())), last_bar)
+
+
+def get_indicator_frame(symbol: str, limit: int = 100, indicators: list[str] | None = None, **params) -> pd.DataFrame:
+    """Get recent bars with indicator columns, reusing earlier results when possible.
+
+    While the symbol's bars are fresh (see ``bar_store.is_fresh``) and no
+    new bar has been stored (nor the last one updated intraday), the cached
+    frame is returned without touching the market data provider or
+    recomputing anything.
+
+    Args:
+        symbol: The stock symbol.
+        limit: Number of daily bars.
+        indicators: Indicator names to include (defaults to ``INDICATOR_NAMES``).
+        **params: Overrides for ``DEFAULT_PARAMS``.
+
+    Returns:
+        OHLCV columns plus one column per indicator, indexed by date in
+        ascending order. Empty if no data could be fetched.
+    """
+    names = tuple(indicators or INDICATOR_NAMES)
+    params = {**DEFAULT_PARAMS, **params}
+
+    if bar_store.is_fresh(symbol):
+        last_bar = bar_store.get_last_bar(symbol)
+        cached = INDICATOR_CACHE.get(_cache_key(symbol, limit, names, params, last_bar))
+        if cached is not None:
+            return cached
+
+    frame = get_stock_history_frame(symbol, limit=limit)
+    if frame.empty:
+        return frame
+
+    values = compute_indicators(frame["close"].to_numpy(), frame["volume"].to_numpy(), **params)
+    result = frame.assign(**{name: values[name] for name in names})
+    last_bar = (bar_store.format_bar_date(frame.index[-1:])[0], float(frame["close"].iloc[-1]))
+    INDICATOR_CACHE.set(_cache_key(symbol, limit, names, params, last_bar), result)
+    return result
@@ -0,0 +1,54 @@
+"""Keep per-symbol incremental indicator state in sync with the bar store."""
+
+from indicators import IndicatorState
+
+from . import bar_store
+
+
+def _is_last_bar(state: IndicatorState, bar) -> bool:
+    """Check whether a stored bar is the one the state already ends with."""
+    return (
+        bar["date"] == state.last_date
+        and bar["close"] == state.closes[-1]
+        and bool(state.volumes) and bar["volume"] == state.volumes[-1]
+    )
+
+
+def get_indicator_state(symbol: str) -> IndicatorState | None:
+    """Get the indicator state for a symbol, updated with any newly stored bars.
+
+    The saved state is loaded from the bar store and only bars on or after
+    its last date are applied (the last one is replaced, since it may have
+    been a partial bar). Without a saved state, or when other bars (such as
+    older history) have been stored since it was saved, one is built from
+    every stored bar.
+
+    Returns:
+        The up-to-date state, or None if no bars are stored for the symbol.
+    """
+    saved = bar_store.load_indicator_state(symbol)
+    state = None
+    if saved is not None and saved.get("last_date"):
+        state = IndicatorState.from_dict(saved)
+        bars = bar_store.load_bars_since(symbol, state.last_date)
+        # The first bar replaces the state's last one; anything else stored
+        # means the bars it was built from have changed
+        if bars.empty or state.count + len(bars) - 1 < bar_store.count_bars(symbol):
+            state = None
+        elif len(bars) == 1 and _is_last_bar(state, bars.iloc[0]):
+            return state
+        else:
+            for row in bars.itertuples(index=False):
+                state.update(row.close, row.volume, row.date)
+    if state is None:
+        bars = bar_store.load_bars(symbol)
+        if bars.empty:
+            return None
+        state = IndicatorState.from_bars(
+            bars["close"].to_numpy(),
+            bars["volume"].to_numpy(),
+            bars["date"].tolist(),
+        )
+
+    bar_store.save_indicator_state(symbol, state.to_dict())
+    return state
@@ -0,0 +1,77 @@
+"""Watchlist signal scanner built on the technical analysis signal rules."""
+
+from pathlib import Path
+
+import pandas as pd
+
+from indicators import align_bars, classify, compute_indicators_batch, last_valid_values
+
+from .get_stock_info import get_stock_history_frames
+
+SCAN_COLUMNS = [
+    "symbol", "close", "change_pct", "score",
+    "trend", "macd_signal", "rsi", "rsi_signal", "bb_position", "bb_signal",
+]
+
+
+def parse_universe(text: str) -> list[str]:
+    """Parse symbols from a universe file's contents.
+
+    Accepts one symbol per line or a CSV whose first column holds the
+    symbol. A ``symbol``/``ticker`` header line and lines starting with
+    ``#`` are ignored.
+    """
+    symbols = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        value = line.split(",")[0].strip().upper()
+        if value and value not in ("SYMBOL", "TICKER"):
+            symbols.append(value)
+    return list(dict.fromkeys(symbols))
+
+
+def load_universe(path: str | Path) -> list[str]:
+    """Load symbols from a universe file (see ``parse_universe``)."""
+    with open(path, "r") as f:
+        return parse_universe(f.read())
+
+
+def scan_signals(symbols: list[str], limit: int = 100) -> pd.DataFrame:
+    """Apply the technical tab's signal rules to every symbol.
+    
+    Bars are served from the local bar store (stale symbols are refreshed
+    with one bulk request) and indicators are computed for all symbols in
+    one vectorized pass.
+    
+    Args:
+        symbols: Stock symbols to scan.
+        limit: Number of daily bars to use per symbol.
+        
+    Returns:
+        One row per symbol with its latest signals, ranked by score (most
+        bullish first). Symbols without data are left out.
+    """
+    frames = get_stock_history_frames(symbols, limit=limit)
+    symbols, _, close, volume = align_bars(frames)
+    if not symbols:
+        return pd.DataFrame(columns=SCAN_COLUMNS)
+    
+    latest = last_valid_values(close, compute_indicators_batch(close, volume))
+    
+    rows = []
+    for row, symbol in enumerate(symbols):
+        values = {name: float(array[row]) for name, array in latest.items()}
+        history = frames[symbol]["close"]
+        prev_close = history.iloc[-2] if len(history) > 1 else history.iloc[-1]
+        rows.append({
+            "symbol": symbol,
+            "close": values["close"],
+            "change_pct": (values["close"] / prev_close - 1) * 100,
+            "rsi": values["RSI"],
+            **classify(values),
+        })
+    
+    result = pd.DataFrame(rows)[SCAN_COLUMNS]
+    return result.sort_values(["score", "change_pct"], ascending=False).reset_index(drop=True)
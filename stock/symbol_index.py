@@ -0,0 +1,144 @@
+"""Offline resolution of stock symbols from free text.
+
+Company names, aliases and tickers from the bundled ``listings.csv`` are
+indexed in a word-level trie, so a query like "Tell me about Nvidia" is
+resolved to ``NVDA`` without an LLM call. ``extract_stock_symbol`` only
+falls back to the LLM when the index finds no symbol or more than one.
+"""
+
+import csv
+import re
+import threading
+from pathlib import Path
+
+LISTINGS_FILE = Path(__file__).parent / "listings.csv"
+
+# Tickers often written in capitals as plain words ("buy NOW", "ALL time
+# high"); they only count as a cashtag ($NOW) or by company name
+CASHTAG_ONLY_TICKERS = frozenset({"ALL", "COST", "KEY", "LOW", "NET", "NOW"})
+
+# Tickers that are everyday words in lowercase ("ups and downs", "snap");
+# they only count in uppercase, as a cashtag or by company name
+UPPERCASE_ONLY_TICKERS = frozenset({
+    "ARM", "BABA", "CAT", "COIN", "COP", "DIS", "HON", "HOOD", "LUV", "PARA", "PEP",
+    "PINS", "SHOP", "SNAP", "SNOW", "SPOT", "SPY", "UNH", "UPS", "USB", "YUM",
+})
+
+_END = ""  # Trie key marking the end of a name; never a real token
+_WORD = re.compile(r"[a-z0-9]+(?:[&'.\-][a-z0-9]+)*")
+_TICKER = re.compile(r"(\$)?\b([A-Za-z]{1,5}(?:[.\-][A-Za-z]{1,2})?)\b")
+
+
+def _tokens(text: str) -> list[str]:
+    """Split text into lowercase words, dropping possessive 's."""
+    words = _WORD.findall(text.lower().replace("’", "'"))
+    return [word[:-2] if word.endswith("'s") else word for word in words]
+
+
+class SymbolIndex:
+    """Matches tickers, company names and aliases in free text.
+
+    Names are matched longest-first over word tokens, so "bank of america"
+    wins over any shorter name inside it. Bare tickers follow stricter
+    rules than names since many are short or look like words:
+
+    - ``$TICKER`` cashtags always match.
+    - Uppercase tickers match in mixed-case text, except single letters
+      and ``CASHTAG_ONLY_TICKERS``.
+    - Lowercase tickers (or any ticker in all-caps text) match only if
+      they are at least three letters and in neither word list.
+    """
+
+    def __init__(self, listings: list[dict]):
+        self.trie: dict = {}
+        self.tickers: set[str] = set()
+        for row in listings:
+            symbol = row["symbol"].strip().upper()
+            self.tickers.add(symbol)
+            names = [row.get("name") or ""] + (row.get("aliases") or "").split("|")
+            for name in names:
+                tokens = _tokens(name)
+                if tokens:
+                    self._add(tokens, symbol)
+
+    @classmethod
+    def from_csv(cls, path: str | Path = LISTINGS_FILE) -> "SymbolIndex":
+        """Build an index from a CSV file with symbol, name and aliases columns.
+
+        Aliases are separated by ``|``.
+        """
+        with open(path, "r", newline="", encoding="utf-8") as f:
+            return cls(list(csv.DictReader(f)))
+
+    def _add(self, tokens: list[str], symbol: str):
+        node = self.trie
+        for token in tokens:
+            node = node.setdefault(token, {})
+        node[_END] = symbol
+
+    def _name_matches(self, text: str) -> list[str]:
+        """Find company names and aliases, longest match first, without overlaps."""
+        tokens = _tokens(text)
+        matches = []
+        i = 0
+        while i < len(tokens):
+            node, end, symbol = self.trie, i, None
+            for j in range(i, len(tokens)):
+                node = node.get(tokens[j])
+                if node is None:
+                    break
+                if _END in node:
+                    end, symbol = j + 1, node[_END]
+            if symbol:
+                matches.append(symbol)
+                i = end
+            else:
+                i += 1
+        return matches
+
+    def _ticker_matches(self, text: str) -> list[str]:
+        """Find bare tickers and cashtags."""
+        all_caps = not any(c.islower() for c in text)
+        matches = []
+        for cashtag, word in _TICKER.findall(text):
+            ticker = word.upper().replace(".", "-")
+            if ticker not in self.tickers:
+                continue
+            if cashtag:
+                matches.append(ticker)
+            elif ticker in CASHTAG_ONLY_TICKERS:
+                continue
+            elif word.isupper() and not all_caps:
+                if len(ticker) > 1:
+                    matches.append(ticker)
+            elif len(ticker) >= 3 and ticker not in UPPERCASE_ONLY_TICKERS:
+                matches.append(ticker)
+        return matches
+
+    def find_all(self, text: str) -> list[str]:
+        """Get every distinct symbol mentioned in the text."""
+        return list(dict.fromkeys(self._name_matches(text) + self._ticker_matches(text)))
+
+    def resolve(self, text: str) -> str | None:
+        """Get the one symbol the text mentions, or None if none or several are found."""
+        symbols = self.find_all(text)
+        return symbols[0] if len(symbols) == 1 else None
+
+
+_index: SymbolIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_symbol_index() -> SymbolIndex:
+    """Get the index over the bundled listings, building it on first use."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = SymbolIndex.from_csv()
+    return _index
+
+
+def resolve_symbol(text: str) -> str | None:
+    """Resolve the single stock symbol mentioned in the text without an LLM call."""
+    return get_symbol_index().resolve(text)
@@ -0,0 +1,13 @@
+"""Shared fixtures."""
+
+import pytest
+
+from stock import bar_store
+
+
+@pytest.fixture
+def tmp_bar_store(monkeypatch, tmp_path):
+    """Point the bar store at an empty database for the test."""
+    monkeypatch.setattr(bar_store, "BARS_DB_FILE", tmp_path / "bars.db")
+    monkeypatch.setattr(bar_store, "_initialized", False)
+    return bar_store
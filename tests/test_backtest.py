@@ -0,0 +1,126 @@
+"""The vectorized backtest engine must match a plain per-bar simulation."""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest import STRATEGIES, METRIC_NAMES, backtest_symbols, hold_between, sweep
+from backtest import engine
+
+
+def loop_performance(close, positions, cost=0.0):
+    """Reference simulation: one bar at a time, positions applied from the next bar."""
+    equity = peak = 1.0
+    max_drawdown = 0.0
+    prev_held = 0.0
+    held_bars = bars = trades = wins = 0
+    trade_log = 0.0
+    for i in range(len(close)):
+        valid = i > 0 and not math.isnan(close[i]) and not math.isnan(close[i - 1])
+        ret = close[i] / close[i - 1] - 1 if valid else 0.0
+        held = 0.0
+        if valid and not math.isnan(positions[i - 1]):
+            held = positions[i - 1]
+        strategy = held * ret - cost * abs(held - prev_held)
+
+        equity *= 1 + strategy
+        peak = max(peak, equity)
+        max_drawdown = min(max_drawdown, equity / peak - 1)
+
+        if held > 0 and prev_held == 0:
+            trades += 1
+            trade_log = 0.0
+        if held > 0 or prev_held > 0:
+            trade_log += math.log1p(strategy)
+        if held == 0 and prev_held > 0:
+            wins += trade_log > 0
+        held_bars += held > 0
+        bars += valid
+        prev_held = held
+    if prev_held > 0:
+        wins += trade_log > 0
+
+    prices = [c for c in close if not math.isnan(c)]
+    return {
+        "total_return": equity - 1,
+        "buy_hold_return": prices[-1] / prices[0] - 1,
+        "max_drawdown": max_drawdown,
+        "exposure": held_bars / bars if bars else 0.0,
+        "trades": trades,
+        "hit_rate": wins / trades if trades else float("nan"),
+    }
+
+
+def loop_hold_between(entry, exit):
+    """Reference for hold_between: long from an entry bar until the next exit bar."""
+    state, positions = 0.0, []
+    for is_entry, is_exit in zip(entry, exit):
+        if is_entry:
+            state = 1.0
+        elif is_exit:
+            state = 0.0
+        positions.append(state)
+    return np.array(positions)
+
+
+def random_close(n, seed, listed_after=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.02, n)))
+    close[:listed_after] = np.nan
+    return close
+
+
+def assert_metrics_match(row, expected):
+    for name in METRIC_NAMES:
+        assert row[name] == pytest.approx(expected[name], rel=1e-9, abs=1e-12, nan_ok=True), name
+
+
+@pytest.mark.parametrize("strategy", list(STRATEGIES))
+@pytest.mark.parametrize("cost", [0.0, 0.001])
+def test_performance_matches_loop(strategy, cost):
+    close = random_close(750, seed=1, listed_after=30)
+    positions = STRATEGIES[strategy](close)
+    metrics = engine.performance(close, positions, cost)
+    assert_metrics_match({name: float(value) for name, value in metrics.items()},
+                         loop_performance(close, positions, cost))
+
+
+def test_hold_between_matches_loop():
+    rng = np.random.default_rng(2)
+    entry = rng.random(500) < 0.05
+    exit = rng.random(500) < 0.05
+    np.testing.assert_array_equal(hold_between(entry, exit), loop_hold_between(entry, exit))
+
+
+def test_sweep_matches_loop():
+    close = random_close(500, seed=3)
+    grid = {"ema_fast": [5, 12, 30], "ema_slow": [20, 26], "macd_signal": [9]}
+    result = sweep(close, "macd", grid, cost=0.001)
+
+    # ema_fast=30 is never below ema_slow, so those combinations are skipped
+    assert len(result) == 4
+    for row in result.to_dict("records"):
+        params = {name: row[name] for name in grid}
+        positions = STRATEGIES["macd"](close, **params)
+        assert_metrics_match(row, loop_performance(close, positions, 0.001))
+    assert result["total_return"].is_monotonic_decreasing
+
+
+def test_backtest_symbols_matches_loop_in_process_pool(monkeypatch):
+    monkeypatch.setattr(engine, "MIN_SYMBOLS_FOR_POOL", 1)
+    index = pd.bdate_range("2022-01-03", periods=400)
+    frames = {
+        f"SYM{i}": pd.DataFrame({"close": random_close(400, seed=10 + i, listed_after=i * 40)}, index=index)
+        for i in range(3)
+    }
+    frames["EMPTY"] = pd.DataFrame(columns=["close"])
+
+    result = backtest_symbols(frames, "rsi", cost=0.001, max_workers=2, oversold=35)
+
+    assert list(result["symbol"]) == ["SYM0", "SYM1", "SYM2"]
+    for row in result.to_dict("records"):
+        close = frames[row["symbol"]]["close"].to_numpy()
+        positions = STRATEGIES["rsi"](close, oversold=35)
+        assert_metrics_match(row, loop_performance(close, positions, 0.001))
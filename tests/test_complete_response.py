@@ -0,0 +1,81 @@
+"""Writing the section a response is missing without running the agent again."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from cache import PersistentCache
+from reasoning import llm, response_cache
+
+TAKEAWAY = "🎯 **BEGINNER TAKEAWAY**\n📈 **Overall Rating:** Good"
+
+
+class FakeProvider:
+    """Agent that calls one tool and answers with the takeaway."""
+
+    def stream_agent(self, query, system_prompt, model=None):
+        yield {"type": "tool_call", "name": "search_web"}
+        yield {"type": "tool_result", "name": "search_web", "content": "ACME beat earnings estimates"}
+        yield {"type": "token", "content": TAKEAWAY}
+        yield {"type": "done", "content": TAKEAWAY}
+
+    def run_agent(self, query, system_prompt, model=None):
+        raise AssertionError("the agent must not run again")
+
+
+class FakeLLM:
+    """Tool-free LLM that records its prompts."""
+
+    def __init__(self):
+        self.prompts = []
+
+    def invoke(self, prompt):
+        self.prompts.append(prompt)
+        return SimpleNamespace(content="1. **TODAY'S DAILY PERFORMANCE**\nACME rose on earnings.")
+
+
+@pytest.fixture
+def fake_llm(monkeypatch, tmp_path):
+    fake = FakeLLM()
+    monkeypatch.setattr(llm, "RESPONSE_CACHE", PersistentCache(tmp_path / "responses.db"))
+    monkeypatch.setattr(llm, "get_provider", lambda name: FakeProvider())
+    monkeypatch.setattr(llm, "get_llm", lambda provider, model: fake)
+    return fake
+
+
+def test_beginner_run_saves_research(fake_llm):
+    events = list(llm.stream_agent("How is ACME doing?", "openai", "gpt", beginner_mode=True))
+    research = events[-1]["research"]
+    assert "How is ACME doing?" in research
+    assert "Result of search_web:\nACME beat earnings estimates" in research
+
+    # A cached response comes back with its research
+    cached = list(llm.stream_agent("How is ACME doing?", "openai", "gpt", beginner_mode=True))
+    assert cached[-1]["research"] == research
+
+
+def test_full_mode_run_has_no_research(fake_llm):
+    events = list(llm.stream_agent("How is ACME doing?", "openai", "gpt", beginner_mode=False))
+    assert "research" not in events[-1]
+
+
+def test_analysis_is_written_from_research(fake_llm):
+    research = list(llm.stream_agent("How is ACME doing?", "openai", "gpt", beginner_mode=True))[-1]["research"]
+    completed = llm.complete_response(TAKEAWAY, "beginner", "How is ACME doing?", symbol="ACME",
+                                      llm_provider="openai", selected_model="gpt", research=research)
+
+    assert len(fake_llm.prompts) == 1
+    assert "ACME beat earnings estimates" in fake_llm.prompts[0]
+    analysis, takeaway = llm.split_response(completed)
+    assert analysis == "1. **TODAY'S DAILY PERFORMANCE**\nACME rose on earnings."
+    assert takeaway.strip() == TAKEAWAY
+
+
+@pytest.mark.parametrize("beginner_mode", [True, False])
+def test_market_stamp_is_taken_once_per_run(fake_llm, monkeypatch, beginner_mode):
+    stamps = []
+    monkeypatch.setattr(response_cache, "market_stamp", lambda symbols: stamps.append(symbols) or [])
+    monkeypatch.setattr(llm, "build_market_context", lambda symbol: "PREFETCHED MARKET DATA")
+
+    list(llm.stream_agent("How is ACME doing?", "openai", "gpt", symbol="ACME", beginner_mode=beginner_mode))
+    assert stamps == [["ACME"]]
@@ -0,0 +1,58 @@
+"""Refreshing the local bar store from the market data provider."""
+
+import importlib
+
+import pandas as pd
+import pytest
+
+from stock import bar_store
+
+# The package attribute of the same name is the tool, not the module
+get_stock_info = importlib.import_module("stock.get_stock_info")
+
+
+def yahoo_bars(periods):
+    index = pd.bdate_range(end="2025-06-30", periods=periods, tz="UTC")
+    return pd.DataFrame(
+        {"Open": 10.0, "High": 11.0, "Low": 9.0, "Close": 10.5, "Volume": 1000},
+        index=index,
+    )
+
+
+class FakeProvider:
+    """Returns no bars until ``bars`` is set."""
+
+    def __init__(self):
+        self.bars = pd.DataFrame()
+        self.requests = []
+
+    def get_history(self, symbols, period=None, start=None):
+        self.requests.append((list(symbols), period, start))
+        return {symbol: self.bars for symbol in symbols}
+
+
+@pytest.fixture
+def provider(monkeypatch, tmp_bar_store):
+    provider = FakeProvider()
+    monkeypatch.setattr(get_stock_info, "_full_history_depth", {})
+    monkeypatch.setattr(get_stock_info, "get_market_data_provider", lambda: provider)
+    return provider
+
+
+def test_empty_download_is_retried(provider):
+    assert get_stock_info.get_stock_history_frame("NEWCO", 30).empty
+    assert not bar_store.is_fresh("NEWCO")
+    assert "NEWCO" not in get_stock_info._full_history_depth
+
+    provider.bars = yahoo_bars(30)
+    frame = get_stock_info.get_stock_history_frame("NEWCO", 30)
+    assert len(frame) == 30
+    # The retry is a full download, not an incremental one
+    assert provider.requests[-1][1] is not None
+
+
+def test_fresh_history_is_not_downloaded_again(provider):
+    provider.bars = yahoo_bars(30)
+    get_stock_info.get_stock_history_frame("ACME", 30)
+    get_stock_info.get_stock_history_frame("ACME", 30)
+    assert len(provider.requests) == 1
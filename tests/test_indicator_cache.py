@@ -0,0 +1,41 @@
+"""Reuse of computed indicator frames between reruns."""
+
+import importlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cache import TTLCache
+from indicators import compute_indicators
+from stock import indicator_cache
+
+get_stock_info = importlib.import_module("stock.get_stock_info")
+
+
+@pytest.fixture
+def store(monkeypatch, tmp_bar_store):
+    monkeypatch.setattr(indicator_cache, "INDICATOR_CACHE", TTLCache(maxsize=16, ttl=3600))
+    monkeypatch.setattr(get_stock_info, "_full_history_depth", {})
+    return tmp_bar_store
+
+
+def save(store, close):
+    index = pd.bdate_range("2025-01-01", periods=len(close), tz="UTC")
+    store.save_bars("ACME", pd.DataFrame(
+        {"Open": close, "High": close, "Low": close, "Close": close, "Volume": 1e6}, index=index,
+    ))
+
+
+def test_intraday_update_of_last_bar_is_not_served_stale(store):
+    close = 100 + np.arange(60, dtype=float)
+    save(store, close)
+    first = indicator_cache.get_indicator_frame("ACME", limit=60)
+    assert indicator_cache.get_indicator_frame("ACME", limit=60) is first
+
+    # Same date, new close
+    close[-1] = 120.0
+    save(store, close)
+    updated = indicator_cache.get_indicator_frame("ACME", limit=60)
+    assert updated["close"].iloc[-1] == 120.0
+    assert updated["SMA_20"].iloc[-1] == pytest.approx(compute_indicators(close)["SMA_20"][-1])
@@ -0,0 +1,114 @@
+"""Streamed indicator updates must match a full compute_indicators recompute."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import INDICATOR_NAMES, IndicatorState, compute_indicators
+from stock import get_indicator_state
+
+
+def random_bars(n, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    volume = rng.integers(1_000, 1_000_000, n).astype(float)
+    dates = [f"2025-01-01T00:00:{i:05d}" for i in range(n)]
+    return close, volume, dates
+
+
+def assert_latest_matches(state, close, volume):
+    expected = compute_indicators(close, volume)
+    values = state.values()
+    for name in INDICATOR_NAMES:
+        np.testing.assert_allclose(values[name], expected[name][-1], rtol=1e-9, atol=1e-9,
+                                   equal_nan=True, err_msg=name)
+
+
+@pytest.mark.parametrize("n", [1, 2, 14, 15, 30, 80, 300])
+def test_streamed_bars_match_recompute(n):
+    close, volume, dates = random_bars(n)
+    state = IndicatorState()
+    for i in range(n):
+        state.update(close[i], volume[i], dates[i])
+    assert_latest_matches(state, close, volume)
+
+
+@pytest.mark.parametrize("n", [1, 2, 14, 15, 30, 80, 300])
+def test_from_bars_then_update_matches_recompute(n):
+    close, volume, dates = random_bars(n + 1)
+    state = IndicatorState.from_bars(close[:-1], volume[:-1], dates[:-1])
+    state.update(close[-1], volume[-1], dates[-1])
+    assert_latest_matches(state, close, volume)
+
+
+def test_partial_bar_is_replaced():
+    close, volume, dates = random_bars(80)
+    state = IndicatorState.from_bars(close, volume, dates)
+    # An intraday update of the last bar, then the final bar
+    state.update(close[-1] * 1.05, volume[-1] / 2, dates[-1])
+    close[-1] *= 0.97
+    state.update(close[-1], volume[-1], dates[-1])
+    assert_latest_matches(state, close, volume)
+
+
+def test_serialized_state_keeps_streaming():
+    close, volume, dates = random_bars(120)
+    state = IndicatorState.from_bars(close[:100], volume[:100], dates[:100])
+    state = IndicatorState.from_dict(state.to_dict())
+    for i in range(100, 120):
+        state.update(close[i], volume[i], dates[i])
+    assert_latest_matches(state, close, volume)
+
+
+def yahoo_frame(close, volume, dates):
+    index = pd.DatetimeIndex(pd.to_datetime(dates), tz="UTC")
+    return pd.DataFrame(
+        {"Open": close, "High": close, "Low": close, "Close": close, "Volume": volume},
+        index=index,
+    )
+
+
+def stored_bars(bar_store, symbol):
+    bars = bar_store.load_bars(symbol)
+    return bars["close"].to_numpy(), bars["volume"].to_numpy()
+
+
+def test_get_indicator_state_applies_new_bars(tmp_bar_store):
+    index = pd.bdate_range("2025-01-01", periods=120, tz="UTC")
+    dates = list(tmp_bar_store.format_bar_date(index))
+    close, volume, _ = random_bars(120)
+
+    tmp_bar_store.save_bars("ACME", yahoo_frame(close[:100], volume[:100], dates[:100]))
+    get_indicator_state("ACME")
+
+    # New bars, with the previously last bar corrected
+    close[99] *= 1.01
+    tmp_bar_store.save_bars("ACME", yahoo_frame(close[99:], volume[99:], dates[99:]))
+    state = get_indicator_state("ACME")
+    assert_latest_matches(state, *stored_bars(tmp_bar_store, "ACME"))
+    assert state.count == 120
+
+
+def test_get_indicator_state_rebuilds_after_backfill(tmp_bar_store):
+    index = pd.bdate_range("2025-01-01", periods=120, tz="UTC")
+    dates = list(tmp_bar_store.format_bar_date(index))
+    close, volume, _ = random_bars(120)
+
+    tmp_bar_store.save_bars("ACME", yahoo_frame(close[90:], volume[90:], dates[90:]))
+    assert np.isnan(get_indicator_state("ACME").values()["SMA_50"])
+
+    # Older history stored later must be taken into account
+    tmp_bar_store.save_bars("ACME", yahoo_frame(close[:90], volume[:90], dates[:90]))
+    state = get_indicator_state("ACME")
+    assert_latest_matches(state, *stored_bars(tmp_bar_store, "ACME"))
+
+
+def test_get_indicator_state_without_new_bars(tmp_bar_store):
+    index = pd.bdate_range("2025-01-01", periods=80, tz="UTC")
+    close, volume, _ = random_bars(80)
+    tmp_bar_store.save_bars("ACME", yahoo_frame(close, volume, list(tmp_bar_store.format_bar_date(index))))
+
+    first = get_indicator_state("ACME")
+    second = get_indicator_state("ACME")
+    assert second.count == first.count == 80
+    assert_latest_matches(second, *stored_bars(tmp_bar_store, "ACME"))
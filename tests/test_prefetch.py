@@ -0,0 +1,42 @@
+"""prefetch_market_data runs the fetches in parallel under one shared deadline."""
+
+import time
+
+import pytest
+
+from reasoning import prefetch
+
+
+@pytest.fixture
+def slow_fetches(monkeypatch):
+    def delayed(value, seconds):
+        def fetch(*args):
+            time.sleep(seconds)
+            return value
+        return fetch
+
+    monkeypatch.setattr(prefetch, "_fetch_date", delayed("Monday, January 5, 2026", 0.05))
+    monkeypatch.setattr(prefetch, "_fetch_quote", delayed({"data": [{"close": 1.0}]}, 0.6))
+    monkeypatch.setattr(prefetch, "_fetch_bars", delayed(None, 0.6))
+    monkeypatch.setattr(prefetch, "_fetch_news", delayed({"results": []}, 0.6))
+
+
+def test_timeout_is_shared_by_all_fetches(slow_fetches):
+    start = time.monotonic()
+    data = prefetch.prefetch_market_data("AAPL", timeout=0.3)
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.5
+    assert data == {"date": "Monday, January 5, 2026", "quote": None, "bars": None, "news": None}
+
+
+def test_failed_fetch_is_unavailable(monkeypatch, slow_fetches):
+    def fail(symbol):
+        raise RuntimeError("no API key")
+
+    monkeypatch.setattr(prefetch, "_fetch_news", fail)
+    data = prefetch.prefetch_market_data("AAPL", timeout=2)
+
+    assert data["news"] is None
+    assert data["quote"] == {"data": [{"close": 1.0}]}
+    assert "Unavailable" in prefetch.format_market_context("AAPL", data)
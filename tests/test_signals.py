@@ -0,0 +1,38 @@
+"""Signal rules and the scanner on degenerate price series."""
+
+import numpy as np
+import pandas as pd
+
+from indicators import bollinger_position, bollinger_signal
+from stock import scanner
+
+
+def test_bollinger_position_flat_bands():
+    assert bollinger_position(50.0, 50.0, 50.0) is None
+    assert bollinger_signal(bollinger_position(50.0, 50.0, 50.0)) is None
+
+
+def test_bollinger_position_within_bands():
+    assert bollinger_position(55.0, 60.0, 40.0) == 75.0
+
+
+def test_scan_signals_with_flat_symbol(monkeypatch):
+    dates = pd.date_range("2025-01-01", periods=80, freq="B", tz="UTC", name="date")
+    rng = np.random.default_rng(1)
+    trending = 100 + np.cumsum(rng.normal(0, 1, 80))
+
+    def frame(close):
+        return pd.DataFrame(
+            {"open": close, "high": close, "low": close, "close": close, "volume": np.full(80, 1e6)},
+            index=dates,
+        )
+
+    frames = {"FLAT": frame(np.full(80, 20.0)), "TREND": frame(trending)}
+    monkeypatch.setattr(scanner, "get_stock_history_frames", lambda symbols, limit=100: frames)
+
+    result = scanner.scan_signals(["FLAT", "TREND"])
+
+    assert set(result["symbol"]) == {"FLAT", "TREND"}
+    flat = result.set_index("symbol").loc["FLAT"]
+    assert pd.isna(flat["bb_position"])
+    assert pd.isna(flat["bb_signal"])
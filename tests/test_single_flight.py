@@ -0,0 +1,91 @@
+"""Per-key request coalescing across overlapping batches."""
+
+import importlib
+import threading
+import time
+
+import pytest
+
+from cache import SingleFlight
+
+# The package attribute of the same name is the tool, not the module
+get_stock_info = importlib.import_module("stock.get_stock_info")
+
+
+def test_overlapping_batches_fetch_each_key_once():
+    flights = SingleFlight()
+    fetched, started = [], threading.Event()
+
+    def fetch(keys):
+        fetched.append(sorted(keys))
+        started.set()
+        time.sleep(0.2)
+        return {key: key.lower() for key in keys}
+
+    first = threading.Thread(target=flights.do_many, args=(["A", "B"], fetch))
+    first.start()
+    started.wait()
+    results = flights.do_many(["B", "C"], fetch)
+    first.join()
+
+    assert fetched == [["A", "B"], ["C"]]
+    assert results == {"B": "b", "C": "c"}
+    assert flights.stats() == {"executed": 3, "shared": 1, "in_flight": 0}
+
+
+def test_joined_keys_see_the_leader_error():
+    flights = SingleFlight()
+    started = threading.Event()
+
+    def fail(keys):
+        started.set()
+        time.sleep(0.2)
+        raise RuntimeError("upstream down")
+
+    first = threading.Thread(target=lambda: pytest.raises(RuntimeError, flights.do_many, ["A"], fail))
+    first.start()
+    started.wait()
+    with pytest.raises(RuntimeError):
+        flights.do_many(["A"], lambda keys: {key: 1 for key in keys})
+    first.join()
+    assert flights.stats()["in_flight"] == 0
+
+
+def test_refresh_histories_batches_only_symbols_not_in_flight(monkeypatch):
+    batches, started = [], threading.Event()
+
+    def refresh(symbols, limit):
+        batches.append((sorted(symbols), limit))
+        started.set()
+        time.sleep(0.2)
+
+    monkeypatch.setattr(get_stock_info, "_refresh_histories_uncoalesced", refresh)
+    monkeypatch.setattr(get_stock_info, "MARKET_DATA_FLIGHTS", SingleFlight())
+
+    first = threading.Thread(target=get_stock_info._refresh_histories, args=(["AAPL", "MSFT"], 30))
+    first.start()
+    started.wait()
+    get_stock_info._refresh_histories(["MSFT", "NVDA"], 30)
+    first.join()
+
+    assert batches == [(["AAPL", "MSFT"], 30), (["NVDA"], 30)]
+
+
+def test_refresh_histories_retries_shallower_joined_refresh(monkeypatch):
+    batches, started = [], threading.Event()
+
+    def refresh(symbols, limit):
+        batches.append((sorted(symbols), limit))
+        started.set()
+        time.sleep(0.2)
+
+    monkeypatch.setattr(get_stock_info, "_refresh_histories_uncoalesced", refresh)
+    monkeypatch.setattr(get_stock_info, "MARKET_DATA_FLIGHTS", SingleFlight())
+
+    first = threading.Thread(target=get_stock_info._refresh_histories, args=(["AAPL"], 30))
+    first.start()
+    started.wait()
+    get_stock_info._refresh_histories(["AAPL"], 200)
+    first.join()
+
+    assert batches == [(["AAPL"], 30), (["AAPL"], 200)]
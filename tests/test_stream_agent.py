@@ -0,0 +1,55 @@
+"""Events yielded while an agent run streams."""
+
+from langchain_core.messages import AIMessage, AIMessageChunk, ToolMessage
+
+from providers.base import BaseLLMProvider
+
+
+class FakeAgent:
+    def __init__(self, messages):
+        self.messages = messages
+
+    def stream(self, inputs, stream_mode):
+        for message in self.messages:
+            yield message, {}
+
+
+class FakeProvider(BaseLLMProvider):
+    def __init__(self, messages):
+        super().__init__()
+        self.agent = FakeAgent(messages)
+
+    def get_models(self):
+        return []
+
+    def create_llm(self, model=None):
+        return None
+
+    def run_agent(self, query, system_prompt, model=None):
+        return ""
+
+    def get_agent(self, model=None, tools=None):
+        return self.agent
+
+
+def test_tool_calls_on_whole_messages_are_reported():
+    provider = FakeProvider([
+        AIMessage(content="", tool_calls=[{"name": "search_web", "args": {"query": "ACME"}, "id": "1"}]),
+        ToolMessage(content="ACME beat estimates", name="search_web", tool_call_id="1"),
+        AIMessage(content="ACME is up."),
+    ])
+    events = list(provider.stream_agent("How is ACME?", "system"))
+    assert [e["type"] for e in events] == ["tool_call", "tool_result", "token", "done"]
+    assert events[0]["name"] == "search_web"
+    assert events[-1]["content"] == "ACME is up."
+
+
+def test_tool_call_chunks_are_reported_once():
+    provider = FakeProvider([
+        AIMessageChunk(content="", tool_call_chunks=[{"name": "get_stock_info", "args": "", "id": "1", "index": 0}]),
+        AIMessageChunk(content="", tool_call_chunks=[{"name": None, "args": '{"symbol": "ACME"}', "id": None, "index": 0}]),
+        ToolMessage(content="{}", name="get_stock_info", tool_call_id="1"),
+        AIMessageChunk(content="Done"),
+    ])
+    events = list(provider.stream_agent("How is ACME?", "system"))
+    assert [e["type"] for e in events] == ["tool_call", "tool_result", "token", "done"]
@@ -0,0 +1,75 @@
+"""Failure detection for multi-ticker Yahoo downloads."""
+
+import logging
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+import yfinance as yf
+
+from market_data import yfinance_provider
+from market_data.rate_limit import RateLimiter
+from market_data.yfinance_provider import YFinanceProvider, _download
+
+FIELDS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+def multi_ticker_frame(filled, empty=()):
+    """Build a frame shaped like ``yf.download(group_by="ticker")``."""
+    index = pd.bdate_range("2024-01-01", periods=5)
+    frames = {symbol: pd.DataFrame(1.0, index=index, columns=FIELDS) for symbol in filled}
+    frames.update({symbol: pd.DataFrame(np.nan, index=index, columns=FIELDS) for symbol in empty})
+    return pd.concat(frames, axis=1)
+
+
+def test_partial_failure_returns_empty_frame(monkeypatch):
+    monkeypatch.setattr(yf, "download", lambda *a, **k: multi_ticker_frame(["AAPL"], ["BAD"]))
+    result = YFinanceProvider().get_history(["AAPL", "BAD", "GONE"], period="5d")
+    assert len(result["AAPL"]) == 5
+    assert result["BAD"].empty
+    assert result["GONE"].empty
+
+
+def throttled_download(frame):
+    """Fake ``yf.download`` that logs a rate-limit failure like yfinance does."""
+    def download(*args, **kwargs):
+        logging.getLogger("yfinance").error(
+            "['AAPL']: YFRateLimitError('Too Many Requests. Rate limited. Try after a while.')"
+        )
+        return frame
+    return download
+
+
+def test_unknown_symbol_is_not_throttling(monkeypatch):
+    monkeypatch.setattr(yf, "download", lambda *a, **k: pd.DataFrame())
+    limiter = RateLimiter(base_delay=0)
+    monkeypatch.setattr(yfinance_provider, "MARKET_DATA_LIMITER", limiter)
+    result = YFinanceProvider().get_history(["ZZZZZ"], period="5d")
+    assert result["ZZZZZ"].empty
+    assert limiter.stats()["throttled"] == 0
+
+
+def test_logged_rate_limit_is_throttling(monkeypatch):
+    monkeypatch.setattr(yf, "download", throttled_download(pd.DataFrame()))
+    with pytest.raises(yf.exceptions.YFRateLimitError):
+        _download(["AAPL"], period="5d")
+
+
+def test_rate_limit_logged_by_another_thread_is_ignored(monkeypatch):
+    def download(*args, **kwargs):
+        other = threading.Thread(target=throttled_download(None))
+        other.start()
+        other.join()
+        return multi_ticker_frame(["AAPL"])
+
+    monkeypatch.setattr(yf, "download", download)
+    assert len(_download(["AAPL"], period="5d")) == 5
+
+
+def test_throttled_download_is_retried(monkeypatch):
+    responses = iter([throttled_download(pd.DataFrame()), lambda *a, **k: multi_ticker_frame(["AAPL"])])
+    monkeypatch.setattr(yf, "download", lambda *a, **k: next(responses)(*a, **k))
+    monkeypatch.setattr(yfinance_provider, "MARKET_DATA_LIMITER", RateLimiter(base_delay=0))
+    result = YFinanceProvider().get_history(["AAPL"], period="5d")
+    assert len(result["AAPL"]) == 5
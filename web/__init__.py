@@ -2,7 +2,7 @@ from .config import setup_page_config
 from .state import init_session_state, clear_all_state
 from .styles import apply_custom_styles
 from .sidebar import render_sidebar
-from .components import render_stock_page, render_new_chat_page
+from .components import render_stock_page, render_new_chat_page, render_scanner_page
 from .tasks import run_analysis_task, poll_background_tasks
 
 __all__ = [
@@ -13,6 +13,7 @@ __all__ = [
     "render_sidebar",
     "render_stock_page",
     "render_new_chat_page",
+    "render_scanner_page",
     "run_analysis_task",
     "poll_background_tasks",
 ]
@@ -2,5 +2,6 @@
 
 from .stock_page import render_stock_page
 from .welcome_page import render_new_chat_page
+from .scanner_page import render_scanner_page
 
-__all__ = ["render_stock_page", "render_new_chat_page"]
+__all__ = ["render_stock_page", "render_new_chat_page", "render_scanner_page"]
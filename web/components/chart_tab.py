@@ -1,12 +1,30 @@
 """Chart tab component."""
 
 import streamlit as st
-from chart import display_chart
+from chart import display_chart, CHART_RANGES
+from stock import get_stock_history
 
 
 def render_chart_tab(symbol: str, conv: dict):
     """Render the chart tab for a stock."""
-    if conv.get("stock_data"):
-        display_chart(symbol, conv["stock_data"], chart_key=f"main_chart_{symbol}")
-    else:
+    if not conv.get("stock_data"):
         st.info("No chart data available.")
+        return
+    
+    range_label = st.radio(
+        "Range",
+        list(CHART_RANGES),
+        horizontal=True,
+        key=f"chart_range_{symbol}",
+        label_visibility="collapsed"
+    )
+    bars = CHART_RANGES[range_label]
+    
+    # Longer ranges re-query the full-resolution bars; the chart downsamples them
+    stock_data = conv["stock_data"]
+    if bars > len(stock_data.get("data") or []):
+        history = get_stock_history(symbol, limit=bars)
+        if history.get("data"):
+            stock_data = history
+    
+    display_chart(symbol, stock_data, chart_key=f"main_chart_{symbol}")
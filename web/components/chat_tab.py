@@ -3,51 +3,138 @@
 import streamlit as st
 from history import save_conversations
 from reasoning import filter_response_for_mode
-from ..tasks import run_analysis_task
+from ..tasks import run_analysis_task, run_section_task, section_task_key, StreamBuffer
+from ..tasks.streaming import LIVE_REFRESH_SECONDS
+
+SECTION_LABELS = {"beginner": "the beginner takeaway", "full": "the full analysis"}
 
 
 def render_chat_tab(symbol: str, conv: dict):
     """Render the chat tab for a stock."""
-    # Check for completed background tasks for this stock
-    _check_completed_tasks(symbol)
-    
     # Get current beginner mode setting
     beginner_mode = st.session_state.get("beginner_mode", True)
     
+    messages = conv.get("messages", [])
+    latest = max((i for i, msg in enumerate(messages) if msg["role"] == "assistant"), default=None)
+    
     # Display chat messages for this stock
-    for i, msg in enumerate(conv.get("messages", [])):
+    for i, msg in enumerate(messages):
         with st.chat_message(msg["role"]):
             # Filter assistant responses based on beginner mode
             if msg["role"] == "assistant":
-                filtered_content = filter_response_for_mode(msg["content"], beginner_mode)
-                st.markdown(filtered_content)
+                _render_assistant_message(symbol, conv, i, beginner_mode, complete=i == latest)
             else:
                 st.markdown(msg["content"])
     
-    # Show spinner if analysis is running for this stock
+    # Show the live response (or a placeholder) if analysis is running for this stock
     is_analyzing = symbol in st.session_state.active_threads
     if is_analyzing:
-        with st.chat_message("assistant"):
-            st.markdown("*Analyzing... (you can switch to other stocks while waiting)*")
-    
-    # Process pending query for this stock - start background thread
-    _process_pending_query(symbol)
+        _render_live_response(symbol)
     
     # Chat input for this stock
     _render_chat_input(symbol, is_analyzing)
 
 
-def _check_completed_tasks(symbol: str):
+@st.fragment(run_every=LIVE_REFRESH_SECONDS)
+def _render_live_response(symbol: str):
+    """Show the response streamed so far; only this fragment reruns while the agent works."""
+    stream = st.session_state.stream_buffers.get(symbol)
+    with st.chat_message("assistant"):
+        text = "".join(stream.follow()) if stream is not None else ""
+        st.markdown(text or "*Analyzing... (you can switch to other stocks while waiting)*")
+    
+    # Pick up the result as soon as the task finishes rather than on the next poll
+    future = st.session_state.background_tasks.get(symbol)
+    if future is not None and future.done():
+        st.rerun(scope="app")
+
+
+def _render_assistant_message(symbol: str, conv: dict, index: int, beginner_mode: bool, complete: bool):
+    """Render a response, generating the section the current mode needs if it is missing.
+    
+    Only the latest response (``complete``) gets the missing section; older
+    ones show the section they were generated with.
+    """
+    msg = conv["messages"][index]
+    wanted = "beginner" if beginner_mode else "full"
+    # Responses saved before generation became mode-aware hold both sections
+    mode = msg.get("mode", "both")
+    key = section_task_key(symbol, index)
+    error = st.session_state.section_errors.get(key)
+    
+    if mode in (wanted, "both"):
+        st.markdown(filter_response_for_mode(msg["content"], beginner_mode))
+        return
+    if error or not complete:
+        # Show the section the response does have
+        st.markdown(filter_response_for_mode(msg["content"], mode == "beginner"))
+        st.caption(error or f"Only {SECTION_LABELS[mode]} was written for this reply.")
+        return
+    
+    if key not in st.session_state.background_tasks:
+        query = next(
+            (m["content"] for m in reversed(conv["messages"][:index]) if m["role"] == "user"), ""
+        )
+        future = st.session_state.executor.submit(
+            run_section_task,
+            symbol,
+            index,
+            query,
+            msg["content"],
+            mode,
+            llm_provider=st.session_state.get("llm_provider", "lm_studio"),
+            selected_model=st.session_state.get("selected_model", ""),
+            research=msg.get("research"),
+        )
+        st.session_state.background_tasks[key] = future
+        st.session_state.active_threads[key] = True
+    st.markdown(f"*Writing {SECTION_LABELS[wanted]}...*")
+
+
+def check_completed_sections(symbol: str):
+    """Save finished section tasks for a stock into its conversation."""
+    messages = st.session_state.stock_conversations.get(symbol, {}).get("messages", [])
+    for index in range(len(messages)):
+        key = section_task_key(symbol, index)
+        future = st.session_state.background_tasks.get(key)
+        if future is None or not future.done():
+            continue
+        try:
+            result = future.result()
+        except Exception as e:
+            result = {"status": "error", "response": f"Sorry, I encountered an error: {str(e)}"}
+        if result["status"] == "complete":
+            msg = messages[index]
+            msg["content"] = result["response"]
+            msg["mode"] = result["mode"]
+            # Both sections are written now, so the research is no longer needed
+            msg.pop("research", None)
+            save_conversations()
+        else:
+            # Not retried this session; the saved section is shown instead
+            st.session_state.section_errors[key] = result["response"]
+        del st.session_state.background_tasks[key]
+        st.session_state.active_threads.pop(key, None)
+        st.rerun()
+
+
+def check_completed_tasks(symbol: str):
     """Check and process completed background tasks for a stock."""
     if symbol in st.session_state.background_tasks:
         future = st.session_state.background_tasks[symbol]
         if future.done():
             try:
                 result = future.result()
-                st.session_state.stock_conversations[symbol]["messages"].append({
+                message = {
                     "role": "assistant",
                     "content": result["response"]
-                })
+                }
+                if result["status"] == "complete":
+                    # Which sections were generated, so the other can be added on a mode switch
+                    message["mode"] = result["mode"]
+                    if "research" in result:
+                        message["research"] = result["research"]
+                st.session_state.stock_conversations[symbol]["messages"].append(message)
             except Exception as e:
                 st.session_state.stock_conversations[symbol]["messages"].append({
                     "role": "assistant",
@@ -57,12 +144,13 @@ def _check_completed_tasks(symbol: str):
             save_conversations()
             # Clean up
             del st.session_state.background_tasks[symbol]
+            st.session_state.stream_buffers.pop(symbol, None)
             if symbol in st.session_state.active_threads:
                 del st.session_state.active_threads[symbol]
             st.rerun()
 
 
-def _process_pending_query(symbol: str):
+def process_pending_query(symbol: str):
     """Process any pending query for a stock."""
     if st.session_state.pending_query and st.session_state.selected_stock == symbol:
         query = st.session_state.pending_query
@@ -72,14 +160,18 @@ def _process_pending_query(symbol: str):
         llm_provider = st.session_state.get("llm_provider", "lm_studio")
         selected_model = st.session_state.get("selected_model", "")
         
-        # Start background analysis using ThreadPoolExecutor
+        # Start background analysis using ThreadPoolExecutor, streaming its output
+        stream = StreamBuffer()
         future = st.session_state.executor.submit(
             run_analysis_task, 
             symbol, 
             query,
             llm_provider=llm_provider,
-            selected_model=selected_model
+            selected_model=selected_model,
+            stream=stream,
+            beginner_mode=st.session_state.get("beginner_mode", True)
         )
+        st.session_state.stream_buffers[symbol] = stream
         st.session_state.background_tasks[symbol] = future
         st.session_state.active_threads[symbol] = True
         st.rerun()
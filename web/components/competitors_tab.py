@@ -1,10 +1,12 @@
 """Competitors tab component."""
 
+import pandas as pd
 import streamlit as st
-from stock import get_stock_logo_url, get_competitors, get_stock_history
+from chart import build_mini_figure, get_figure, sparkline_data_uri
+from stock import get_stock_logo_url, get_competitors, get_stock_history_frames, frame_to_payload
 from reasoning import filter_response_for_mode
 from history import save_conversations
-from ..tasks import run_competitor_analysis_task, run_analysis_task
+from ..tasks import run_competitor_analysis_task, run_analysis_task, StreamBuffer
 
 
 def render_competitors_tab(symbol: str):
@@ -29,10 +31,13 @@ def render_competitors_tab(symbol: str):
     # Show competitor logos with popovers containing chart and button
     st.markdown("**Comparing against:** *(click symbol for details)*")
     
+    # Fetch all competitor histories in one bulk request
+    histories = get_stock_history_frames(competitors, limit=30)
+    
     cols = st.columns(len(competitors))
     for i, comp in enumerate(competitors):
         with cols[i]:
-            _render_competitor_hover_card(comp, symbol)
+            _render_competitor_hover_card(comp, symbol, histories[comp])
     
     st.divider()
     
@@ -43,27 +48,6 @@ def render_competitors_tab(symbol: str):
     conv = st.session_state.stock_conversations.get(symbol, {})
     saved_analysis = conv.get("competitor_analysis")
     
-    # Check for completed background tasks for competitor analysis
-    if comp_key in st.session_state.background_tasks:
-        future = st.session_state.background_tasks[comp_key]
-        if future.done():
-            try:
-                result = future.result()
-                # Extract response - ensure it's a string
-                response_text = result.get("response", "")
-                if not isinstance(response_text, str):
-                    response_text = str(response_text)
-                # Save to conversation for persistence
-                st.session_state.stock_conversations[symbol]["competitor_analysis"] = response_text
-                save_conversations()
-            except Exception as e:
-                st.session_state.stock_conversations[symbol]["competitor_analysis"] = f"Error: {str(e)}"
-                save_conversations()
-            del st.session_state.background_tasks[comp_key]
-            if comp_key in st.session_state.active_threads:
-                del st.session_state.active_threads[comp_key]
-            st.rerun()
-    
     # Show analysis or auto-start if not running
     if saved_analysis:
         # Ensure it's a string
@@ -81,6 +65,10 @@ def render_competitors_tab(symbol: str):
             # Clear the started tracking so it can run again
             if "competitor_analysis_started" in st.session_state:
                 st.session_state.competitor_analysis_started.discard(comp_key)
+            # Bypass the response cache on the next run
+            if "competitor_force_refresh" not in st.session_state:
+                st.session_state.competitor_force_refresh = set()
+            st.session_state.competitor_force_refresh.add(comp_key)
             save_conversations()
             st.rerun()
     elif comp_key in st.session_state.active_threads:
@@ -95,13 +83,19 @@ def render_competitors_tab(symbol: str):
         llm_provider = st.session_state.get("llm_provider", "lm_studio")
         selected_model = st.session_state.get("selected_model", "")
         
+        # A refresh skips the cached analysis
+        force_refresh = comp_key in st.session_state.get("competitor_force_refresh", set())
+        if force_refresh:
+            st.session_state.competitor_force_refresh.discard(comp_key)
+        
         # Auto-start competitor analysis
         future = st.session_state.executor.submit(
             run_competitor_analysis_task,
             symbol,
             competitors,
             llm_provider=llm_provider,
-            selected_model=selected_model
+            selected_model=selected_model,
+            force_refresh=force_refresh,
         )
         st.session_state.background_tasks[comp_key] = future
         st.session_state.active_threads[comp_key] = True
@@ -112,18 +106,40 @@ def render_competitors_tab(symbol: str):
         st.markdown("*Analyzing competitors... this may take a moment*")
 
 
-def _render_competitor_hover_card(comp: str, current_symbol: str):
-    """Render a competitor with popover showing chart and add button."""
-    import plotly.graph_objects as go
-    import pandas as pd
-    
-    # Always fetch fresh stock data for chart
-    stock_data = get_stock_history(comp, limit=30)
+def check_completed_competitor_analysis(symbol: str):
+    """Save a finished background competitor analysis into the conversation."""
+    comp_key = f"competitor_analysis_{symbol}"
     
-    # Center container for logo and popover
+    if comp_key in st.session_state.background_tasks:
+        future = st.session_state.background_tasks[comp_key]
+        if future.done():
+            try:
+                result = future.result()
+                # Extract response - ensure it's a string
+                response_text = result.get("response", "")
+                if not isinstance(response_text, str):
+                    response_text = str(response_text)
+                # Save to conversation for persistence
+                st.session_state.stock_conversations[symbol]["competitor_analysis"] = response_text
+                save_conversations()
+            except Exception as e:
+                st.session_state.stock_conversations[symbol]["competitor_analysis"] = f"Error: {str(e)}"
+                save_conversations()
+            del st.session_state.background_tasks[comp_key]
+            if comp_key in st.session_state.active_threads:
+                del st.session_state.active_threads[comp_key]
+            st.rerun()
+
+
+def _render_competitor_hover_card(comp: str, current_symbol: str, history: pd.DataFrame):
+    """Render a competitor with popover showing chart and add button."""
+    # Center container for logo, sparkline and popover
+    sparkline = sparkline_data_uri(comp, history)
+    sparkline_img = f'<img src="{sparkline}" width="120" height="36">' if sparkline else ''
     st.markdown(
         f'<div style="display: flex; flex-direction: column; align-items: center;">'
         f'<img src="{get_stock_logo_url(comp)}" width="60" style="border-radius: 8px; margin-bottom: 8px;">'
+        f'{sparkline_img}'
         f'</div>',
         unsafe_allow_html=True
     )
@@ -131,7 +147,14 @@ def _render_competitor_hover_card(comp: str, current_symbol: str):
     # Center the popover using columns
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
-        with st.popover(comp, width='stretch'):
+        # The popover reruns the app when toggled, so its chart is only built while open
+        popover = st.popover(
+            comp,
+            width='stretch',
+            key=f"competitor_popover_{comp}_{current_symbol}",
+            on_change="rerun"
+        )
+        with popover:
             # Header with logo
             st.markdown(
                 f'<div style="display: flex; align-items: center; gap: 10px; margin-bottom: 12px;">'
@@ -142,12 +165,11 @@ def _render_competitor_hover_card(comp: str, current_symbol: str):
             )
             
             # Show price info
-            if stock_data and "data" in stock_data and len(stock_data["data"]) >= 2:
-                latest = stock_data["data"][0]
-                prev = stock_data["data"][1]
-                price = latest.get("close", 0)
-                change = price - prev.get("close", price)
-                change_pct = (change / prev.get("close", 1)) * 100 if prev.get("close") else 0
+            if len(history) >= 2:
+                price = history["close"].iloc[-1]
+                prev_close = history["close"].iloc[-2]
+                change = price - prev_close
+                change_pct = (change / prev_close) * 100 if prev_close else 0
                 color = "#00c853" if change >= 0 else "#ff5252"
                 sign = "+" if change >= 0 else ""
                 st.markdown(
@@ -159,33 +181,12 @@ def _render_competitor_hover_card(comp: str, current_symbol: str):
                 )
             
             # Display mini chart
-            if stock_data and "data" in stock_data and stock_data["data"]:
-                df = pd.DataFrame(stock_data["data"])
-                df["date"] = pd.to_datetime(df["date"])
-                df = df.sort_values("date")
-                
-                # Create simple line chart for popover
-                fig = go.Figure(data=[go.Scatter(
-                    x=df["date"],
-                    y=df["close"],
-                    mode='lines',
-                    line=dict(color='#00c853' if df["close"].iloc[-1] >= df["close"].iloc[0] else '#ff5252', width=2),
-                    fill='tozeroy',
-                    fillcolor='rgba(0, 200, 83, 0.1)' if df["close"].iloc[-1] >= df["close"].iloc[0] else 'rgba(255, 82, 82, 0.1)'
-                )])
-                
-                fig.update_layout(
-                    template="plotly_dark",
-                    height=150,
-                    margin=dict(l=0, r=0, t=10, b=0),
-                    xaxis=dict(showticklabels=False, showgrid=False),
-                    yaxis=dict(showticklabels=False, showgrid=False),
-                    showlegend=False
-                )
-                
-                st.plotly_chart(fig, key=f"mini_chart_{comp}_{current_symbol}", width="stretch")
-            else:
+            if history.empty:
                 st.caption("Chart data unavailable")
+            elif popover.open:
+                last_bar = (history.index[-1].isoformat(), float(history["close"].iloc[-1]))
+                fig = get_figure("mini", comp, len(history), last_bar, build_mini_figure, history)
+                st.plotly_chart(fig, key=f"mini_chart_{comp}_{current_symbol}", width="stretch")
             
             # Add/View button inside popover
             already_tracked = comp in st.session_state.stock_conversations
@@ -202,7 +203,7 @@ def _render_competitor_hover_card(comp: str, current_symbol: str):
                     
                     st.session_state.stock_conversations[comp] = {
                         "messages": [{"role": "user", "content": query}],
-                        "stock_data": stock_data
+                        "stock_data": frame_to_payload(history, comp)
                     }
                     save_conversations()
                     
@@ -210,14 +211,18 @@ def _render_competitor_hover_card(comp: str, current_symbol: str):
                     llm_provider = st.session_state.get("llm_provider", "lm_studio")
                     selected_model = st.session_state.get("selected_model", "")
                     
-                    # Start background analysis
+                    # Start background analysis, streaming its output
+                    stream = StreamBuffer()
                     future = st.session_state.executor.submit(
                         run_analysis_task,
                         comp,
                         query,
                         llm_provider=llm_provider,
-                        selected_model=selected_model
+                        selected_model=selected_model,
+                        stream=stream,
+                        beginner_mode=st.session_state.get("beginner_mode", True)
                     )
+                    st.session_state.stream_buffers[comp] = stream
                     st.session_state.background_tasks[comp] = future
                     st.session_state.active_threads[comp] = True
                     
@@ -0,0 +1,59 @@
+"""Signal scanner page - technical signals for every tracked stock at once."""
+
+import streamlit as st
+from stock import scan_signals, parse_universe
+
+
+def render_scanner_page():
+    """Render the watchlist signal scanner."""
+    st.markdown("## Signal Scanner")
+    st.caption("RSI, MACD, SMA trend and Bollinger signals for many stocks at once, ranked from most bullish to most bearish.")
+    
+    source = st.radio(
+        "Universe",
+        ["Your stocks", "Upload a list"],
+        horizontal=True,
+        key="scanner_source"
+    )
+    
+    if source == "Your stocks":
+        symbols = list(st.session_state.stock_conversations.keys())
+    else:
+        uploaded = st.file_uploader(
+            "Symbols file (one ticker per line, or a CSV with a symbol column)",
+            type=["txt", "csv"]
+        )
+        symbols = parse_universe(uploaded.getvalue().decode("utf-8")) if uploaded else []
+    
+    if not symbols:
+        st.info("No stocks to scan yet. Analyze a stock or upload a list of symbols.")
+        return
+    
+    if st.button(f"Scan {len(symbols)} stocks", type="primary"):
+        with st.spinner("Scanning..."):
+            st.session_state.scanner_results = scan_signals(symbols)
+    
+    results = st.session_state.get("scanner_results")
+    if results is None:
+        return
+    if results.empty:
+        st.warning("No market data available for these stocks.")
+        return
+    
+    st.dataframe(
+        results,
+        hide_index=True,
+        width="stretch",
+        column_config={
+            "symbol": "Symbol",
+            "close": st.column_config.NumberColumn("Close", format="$%.2f"),
+            "change_pct": st.column_config.NumberColumn("Change", format="%+.2f%%"),
+            "score": st.column_config.NumberColumn("Score", help="Positive is bullish, negative is bearish"),
+            "trend": "Trend (SMA)",
+            "macd_signal": "MACD",
+            "rsi": st.column_config.NumberColumn("RSI (14)", format="%.1f"),
+            "rsi_signal": "RSI Signal",
+            "bb_position": st.column_config.NumberColumn("Bollinger %", format="%.0f%%"),
+            "bb_signal": "Bollinger",
+        }
+    )
@@ -4,8 +4,8 @@ import streamlit as st
 from stock import get_stock_logo_url
 
 from .chart_tab import render_chart_tab
-from .chat_tab import render_chat_tab
-from .competitors_tab import render_competitors_tab
+from .chat_tab import render_chat_tab, check_completed_tasks, check_completed_sections, process_pending_query
+from .competitors_tab import render_competitors_tab, check_completed_competitor_analysis
 from .technical_tab import render_technical_tab
 
 
@@ -22,33 +22,31 @@ def render_stock_page(symbol: str):
         unsafe_allow_html=True
     )
     
+    # Background work for this stock runs whichever tab is open
+    check_completed_tasks(symbol)
+    check_completed_sections(symbol)
+    check_completed_competitor_analysis(symbol)
+    process_pending_query(symbol)
+    
     # Check beginner mode - hide technical tab if enabled
     beginner_mode = st.session_state.get("beginner_mode", True)
     
-    if beginner_mode:
-        # Simplified tabs for beginners
-        tab1, tab2, tab3 = st.tabs(["Chart", "Chat", "Competitors"])
-        
-        with tab1:
-            render_chart_tab(symbol, conv)
-        
-        with tab2:
-            render_chat_tab(symbol, conv)
-        
-        with tab3:
-            render_competitors_tab(symbol)
-    else:
+    tabs = {
+        "Chart": lambda: render_chart_tab(symbol, conv),
+        "Chat": lambda: render_chat_tab(symbol, conv),
+    }
+    if not beginner_mode:
         # Full tabs including technical analysis
-        tab1, tab2, tab3, tab4 = st.tabs(["Chart", "Chat", "Technical", "Competitors"])
-        
-        with tab1:
-            render_chart_tab(symbol, conv)
-        
-        with tab2:
-            render_chat_tab(symbol, conv)
-        
-        with tab3:
-            render_technical_tab(symbol, conv)
-        
-        with tab4:
-            render_competitors_tab(symbol)
+        tabs["Technical"] = lambda: render_technical_tab(symbol, conv)
+    tabs["Competitors"] = lambda: render_competitors_tab(symbol)
+    
+    # Tabs rerun the app when switched, so only the open tab's body runs
+    containers = st.tabs(
+        list(tabs),
+        key=f"stock_tabs_{symbol}_{'beginner' if beginner_mode else 'full'}",
+        on_change="rerun"
+    )
+    for container, render in zip(containers, tabs.values()):
+        if container.open:
+            with container:
+                render()
@@ -1,7 +1,8 @@
 import streamlit as st
-from stock import get_stock_logo_url, get_stock_history
+from stock import get_stock_logo_url, get_stock_histories
 from .state import clear_all_state
 from history import save_conversations
+from providers import invalidate_provider_cache
 
 
 def render_sidebar():
@@ -31,6 +32,11 @@ def render_sidebar():
             st.session_state.selected_view = "chat"
             st.rerun()
         
+        if st.button("⚡ Signal Scanner", width="stretch"):
+            st.session_state.selected_stock = None
+            st.session_state.selected_view = "scanner"
+            st.rerun()
+        
         if st.button("↻ Refresh All", width="stretch"):
             _refresh_all_stocks()
             st.rerun()
@@ -58,6 +64,7 @@ def render_sidebar():
             provider_key = provider_keys[providers.index(selected_provider)]
             
             if provider_key != current_provider:
+                invalidate_provider_cache(current_provider)
                 st.session_state.llm_provider = provider_key
                 st.session_state.selected_model = ""  # Reset model when provider changes
                 from history import save_settings
@@ -124,6 +131,7 @@ def _render_model_selector(provider_key: str):
                 help="Select a loaded model from LM Studio"
             )
             if selected_model != st.session_state.get("selected_model"):
+                invalidate_provider_cache(provider_key, st.session_state.get("selected_model") or None)
                 st.session_state.selected_model = selected_model
                 save_settings({"selected_model": selected_model})
                 st.rerun()
@@ -144,6 +152,7 @@ def _render_model_selector(provider_key: str):
                 help="Select an Ollama model"
             )
             if selected_model != st.session_state.get("selected_model"):
+                invalidate_provider_cache(provider_key, st.session_state.get("selected_model") or None)
                 st.session_state.selected_model = selected_model
                 save_settings({"selected_model": selected_model})
                 st.rerun()
@@ -164,6 +173,7 @@ def _render_model_selector(provider_key: str):
                 help="Select an OpenAI GPT model"
             )
             if selected_model != st.session_state.get("selected_model"):
+                invalidate_provider_cache(provider_key, st.session_state.get("selected_model") or None)
                 st.session_state.selected_model = selected_model
                 save_settings({"selected_model": selected_model})
                 st.rerun()
@@ -174,7 +184,8 @@ def _render_model_selector(provider_key: str):
 
 def _refresh_all_stocks():
     """Refresh stock data for all tracked stocks."""
-    for symbol in st.session_state.stock_conversations.keys():
-        stock_data = get_stock_history(symbol, limit=30)
-        st.session_state.stock_conversations[symbol]["stock_data"] = stock_data
+    symbols = list(st.session_state.stock_conversations.keys())
+    histories = get_stock_histories(symbols, limit=30)
+    for symbol in symbols:
+        st.session_state.stock_conversations[symbol]["stock_data"] = histories[symbol]
     save_conversations()
@@ -16,7 +16,7 @@ def init_session_state():
         st.session_state.selected_stock = None
     
     if "selected_view" not in st.session_state:
-        st.session_state.selected_view = "chat"  # "chart" or "chat"
+        st.session_state.selected_view = "chat"  # "chart", "chat" or "scanner"
     
     if "pending_query" not in st.session_state:
         st.session_state.pending_query = None
@@ -27,6 +27,12 @@ def init_session_state():
     if "active_threads" not in st.session_state:
         st.session_state.active_threads = {}  # {symbol: True} - tracks which stocks have pending analysis
     
+    if "stream_buffers" not in st.session_state:
+        st.session_state.stream_buffers = {}  # {symbol: StreamBuffer} - live agent output for running analyses
+    
+    if "section_errors" not in st.session_state:
+        st.session_state.section_errors = {}  # {section task key: error} - mode sections that failed to generate
+    
     if "executor" not in st.session_state:
         st.session_state.executor = ThreadPoolExecutor(max_workers=5)
     
@@ -54,5 +60,7 @@ def clear_all_state():
     st.session_state.pending_query = None
     st.session_state.background_tasks = {}
     st.session_state.active_threads = {}
+    st.session_state.stream_buffers = {}
+    st.session_state.section_errors = {}
     # Remove the saved file
     clear_conversations()
@@ -3,5 +3,7 @@
 from .analysis import run_analysis_task
 from .competitors import run_competitor_analysis_task
 from .polling import poll_background_tasks
+from .sections import run_section_task, section_task_key
+from .streaming import StreamBuffer
 
-__all__ = ["run_analysis_task", "run_competitor_analysis_task", "poll_background_tasks"]
+__all__ = ["run_analysis_task", "run_competitor_analysis_task", "run_section_task", "section_task_key", "poll_background_tasks", "StreamBuffer"]
@@ -1,9 +1,16 @@
 """Stock analysis task."""
 
-from reasoning import run_agent
+from reasoning import stream_agent, response_mode
+from .streaming import StreamBuffer
 
 
-def run_analysis_task(symbol: str, query: str, llm_provider: str = None, selected_model: str = None) -> dict:
+def analysis_query(symbol: str, query: str) -> str:
+    """Prefix a user's query with the stock it is about."""
+    return f"The user is asking about {symbol}. " + query
+
+
+def run_analysis_task(symbol: str, query: str, llm_provider: str = None, selected_model: str = None,
+                      stream: StreamBuffer = None, beginner_mode: bool = None) -> dict:
     """Run AI analysis and return result dict. Designed to run in background thread.
     
     Args:
@@ -11,16 +18,30 @@ def run_analysis_task(symbol: str, query: str, llm_provider: str = None, selecte
         query (str): User's query
         llm_provider (str): LLM provider to use (from streamlit session)
         selected_model (str): Model to use (from streamlit session)
+        stream (StreamBuffer): If given, agent events are written here as they arrive
+        beginner_mode (bool): Generate only the beginner takeaway (True) or only the
+            full analysis (False); None generates both
     """
     try:
-        context = f"The user is asking about {symbol}. "
-        full_query = context + query
-        response = run_agent(full_query, llm_provider=llm_provider, selected_model=selected_model)
-        return {
+        full_query = analysis_query(symbol, query)
+        response, research = "", None
+        for event in stream_agent(full_query, llm_provider=llm_provider, selected_model=selected_model, symbol=symbol,
+                                  beginner_mode=beginner_mode):
+            if stream is not None:
+                stream.append(event)
+            if event["type"] == "done":
+                response = event["content"]
+                research = event.get("research")
+        result = {
             "status": "complete",
             "response": response,
-            "symbol": symbol
+            "symbol": symbol,
+            "mode": response_mode(beginner_mode)
         }
+        if research:
+            # Lets the full analysis be written later without running the agent again
+            result["research"] = research
+        return result
     except Exception as e:
         return {
             "status": "error",
@@ -1,6 +1,7 @@
 """Competitor analysis task."""
 
 from providers import get_provider
+from reasoning.response_cache import RESPONSE_CACHE, response_key, is_cacheable
 
 # Simplified system prompt for competitor analysis (no decline message)
 COMPETITOR_SYSTEM_PROMPT = """You are an expert stock market analyst. Your job is to compare stocks and provide investment analysis.
@@ -13,7 +14,8 @@ You have access to these tools:
 Always use the tools to get current data before making comparisons. Be concise and actionable."""
 
 
-def run_competitor_analysis_task(symbol: str, competitors: list[str], llm_provider: str = None, selected_model: str = None) -> dict:
+def run_competitor_analysis_task(symbol: str, competitors: list[str], llm_provider: str = None, selected_model: str = None,
+                                 force_refresh: bool = False) -> dict:
     """Run AI competitor comparison analysis. Designed to run in background thread.
     
     Args:
@@ -21,6 +23,7 @@ def run_competitor_analysis_task(symbol: str, competitors: list[str], llm_provid
         competitors (list[str]): List of competitor symbols
         llm_provider (str): LLM provider to use (from streamlit session)
         selected_model (str): Model to use (from streamlit session)
+        force_refresh (bool): Skip the cached analysis and run the agent again
     """
     try:
         comp_list = ", ".join(competitors)
@@ -48,9 +51,15 @@ Provide a competitive analysis covering:
 
 Keep the analysis concise and actionable. Focus on what matters for making an investment decision TODAY."""
         
-        # Use the provider directly with a simpler system prompt
-        provider = get_provider(llm_provider or "lm_studio")
-        response = provider.run_agent(query, COMPETITOR_SYSTEM_PROMPT, selected_model or None)
+        key = response_key("competitors", query, llm_provider or "lm_studio", selected_model or "",
+                           [symbol, *competitors])
+        response = None if force_refresh else RESPONSE_CACHE.get(key)
+        if response is None:
+            # Use the provider directly with a simpler system prompt
+            provider = get_provider(llm_provider or "lm_studio")
+            response = provider.run_agent(query, COMPETITOR_SYSTEM_PROMPT, selected_model or None)
+            if is_cacheable(response):
+                RESPONSE_CACHE.set(key, response)
         return {
             "status": "complete",
             "response": response,
@@ -0,0 +1,49 @@
+"""Task that adds the section a saved response is missing for the current mode."""
+
+from reasoning import complete_response
+from .analysis import analysis_query
+
+
+def section_task_key(symbol: str, index: int) -> str:
+    """Key of the section task for a message in ``background_tasks``."""
+    return f"section_{symbol}_{index}"
+
+
+def run_section_task(symbol: str, index: int, query: str, response: str, generated_mode: str,
+                     llm_provider: str = None, selected_model: str = None, research: str = None) -> dict:
+    """Complete a response generated for one mode. Designed to run in background thread.
+    
+    Args:
+        symbol (str): Stock symbol the response is about
+        index (int): Position of the response in the conversation's messages
+        query (str): User's query the response answered
+        response (str): The saved response
+        generated_mode (str): Mode the response was generated for ("beginner" or "full")
+        llm_provider (str): LLM provider to use (from streamlit session)
+        selected_model (str): Model to use (from streamlit session)
+        research (str): Research saved with a beginner-mode response, if any
+    """
+    try:
+        completed = complete_response(
+            response,
+            generated_mode,
+            analysis_query(symbol, query),
+            symbol=symbol,
+            llm_provider=llm_provider,
+            selected_model=selected_model,
+            research=research,
+        )
+        return {
+            "status": "complete",
+            "response": completed,
+            "symbol": symbol,
+            "index": index,
+            "mode": "both"
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "response": f"Sorry, I encountered an error: {str(e)}",
+            "symbol": symbol,
+            "index": index
+        }
@@ -0,0 +1,42 @@
+"""Hand-off of streamed agent events from a background task to the UI."""
+
+import os
+import threading
+from typing import Iterator
+
+# How often the page redraws a response that is still streaming
+LIVE_REFRESH_SECONDS = float(os.getenv("STREAM_REFRESH_SECONDS", "1"))
+
+
+class StreamBuffer:
+    """Thread-safe log of agent events written by a background task.
+    
+    The task appends events while the agent runs. Readers never wait for
+    it: each rerun of the page replays whatever has been buffered so far,
+    so a script run is not held for the length of the agent run.
+    """
+    
+    def __init__(self):
+        self._events: list[dict] = []
+        self._lock = threading.Lock()
+    
+    def append(self, event: dict):
+        """Add an event."""
+        with self._lock:
+            self._events.append(event)
+    
+    def events(self) -> list[dict]:
+        """Get every event buffered so far."""
+        with self._lock:
+            return list(self._events)
+    
+    def follow(self) -> Iterator[str]:
+        """Yield displayable text (tokens and tool notes) buffered so far.
+        
+        Stops when it runs out of events instead of waiting for more.
+        """
+        for event in self.events():
+            if event["type"] == "token":
+                yield event["content"]
+            elif event["type"] == "tool_call":
+                yield f"\n\n*Using `{event['name']}`...*\n\n"